@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark for 'webease daemon'
+
+Compiles a small page three ways: a fresh `python webease.py page.ws --save`
+process, the same command forwarded to a running daemon, and a compile
+request sent straight over the daemon's socket (what an editor plugin
+does). --json prints the raw numbers.
+
+    python benchmarks/bench_daemon.py --repeat 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease.client import DaemonError, send_request  # noqa: E402
+
+PAGE = 'add_title("Hello")\nadd_heading("Welcome")\nadd_paragraph("A small page")\nadd_badge("New")\n'
+
+
+def run_cli(directory, env):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, str(ROOT / 'webease.py'), 'page.ws', '--save'], cwd=directory, env=env,
+                   stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def run_request(directory, socket):
+    start = time.perf_counter()
+    response = send_request({'command': 'compile', 'file': 'page.ws', 'cwd': str(directory)}, socket)
+    elapsed = time.perf_counter() - start
+    assert response['ok'], response.get('error')
+    return elapsed
+
+
+def wait_for_daemon(socket, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            return send_request({'command': 'status'}, socket)
+        except DaemonError:
+            time.sleep(0.05)
+    raise RuntimeError('The daemon did not start')
+
+
+def summarize(samples):
+    return {'min_ms': min(samples) * 1000, 'median_ms': statistics.median(samples) * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=10, help='Compiles per measurement')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='webease-daemon-') as directory:
+        directory = Path(directory)
+        (directory / 'page.ws').write_text(PAGE, encoding='utf-8')
+        socket = str(directory / 'daemon.sock')
+        env = dict(os.environ, WEBEASE_SOCKET=socket)
+
+        results['cli'] = summarize([run_cli(directory, dict(env, WEBEASE_NO_DAEMON='1'))
+                                    for _ in range(args.repeat)])
+
+        daemon = subprocess.Popen([sys.executable, str(ROOT / 'webease.py'), 'daemon', 'start', '--quiet'],
+                                  cwd=directory, env=env, stdout=subprocess.DEVNULL)
+        try:
+            wait_for_daemon(socket)
+            results['cli_via_daemon'] = summarize([run_cli(directory, env) for _ in range(args.repeat)])
+            results['socket_request'] = summarize([run_request(directory, socket) for _ in range(args.repeat)])
+        finally:
+            send_request({'command': 'shutdown'}, socket)
+            daemon.wait(timeout=10)
+
+    if args.json:
+        print(json.dumps({'repeat': args.repeat, 'results': results}, indent=2))
+        return
+
+    print(f'{"path":<16} {"min ms":>9} {"median ms":>10}')
+    for name, result in results.items():
+        print(f'{name:<16} {result["min_ms"]:>9.1f} {result["median_ms"]:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
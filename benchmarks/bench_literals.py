@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark for large literal arguments (lists and dicts with 10k+ elements)
+
+Parses one call with a big list literal four ways: the parser's JSON
+fast path (double-quoted strings and plain numbers), the same list with
+a trailing comma (the outer list takes the token path, its items still
+decode as JSON), the parser's token-by-token path (the same data with
+single quotes, which JSON can't read) and the legacy parse_value. Time per element should stay flat as
+the list grows; --json prints the raw numbers.
+
+    python benchmarks/bench_literals.py --max-elements 100000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease import parser  # noqa: E402
+from src.webease.compiler import WebeaseCompiler  # noqa: E402
+
+
+def strings_literal(count):
+    return '[' + ', '.join(f'"Item {i}"' for i in range(count)) + ']'
+
+
+def rows_literal(count):
+    """Table rows with three cells each"""
+    return '[' + ', '.join(f'["Row {i}", {i}, "{i}.99"]' for i in range(count // 3)) + ']'
+
+
+def dicts_literal(count):
+    """Gallery-style dicts with two keys each; one key contains a colon"""
+    return '[' + ', '.join(f'{{"src": "img/{i}.jpg", "alt": "Photo: {i}"}}' for i in range(count // 2)) + ']'
+
+
+def wide_literal(count):
+    """Rows longer than the parser's 4 KB JSON slice, one per 100 elements"""
+    return '[' + ', '.join(f'["{"x" * 5000}", {i}]' for i in range(count // 100)) + ']'
+
+
+SHAPES = {'strings': strings_literal, 'rows': rows_literal, 'dicts': dicts_literal, 'wide': wide_literal}
+
+
+def parse_fast(literal):
+    return parser.parse(f'add_list({literal})\n').statements[0].evaluate_arguments()[0][0]
+
+
+def parse_trailing(literal):
+    return parser.parse(f'add_list({literal[:-1]},])\n').statements[0].evaluate_arguments()[0][0]
+
+
+def parse_tokens(literal):
+    return parser.parse(f"add_list({literal.replace(chr(34), chr(39))})\n").statements[0].evaluate_arguments()[0][0]
+
+
+def parse_legacy(literal):
+    return WebeaseCompiler(legacy_parser=True).parse_value(literal)
+
+
+def best_time(parse, literal, repeat):
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        value = parse(literal)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, value
+
+
+def sizes_up_to(max_elements):
+    size = 10_000
+    while size < max_elements:
+        yield size
+        size *= 10
+    yield max_elements
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    argument_parser.add_argument('--max-elements', type=int, default=100_000, help='Largest literal to parse')
+    argument_parser.add_argument('--repeat', type=int, default=3, help='Runs per size (the best is kept)')
+    argument_parser.add_argument('--no-legacy', action='store_true', help='Skip the legacy parse_value')
+    argument_parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = argument_parser.parse_args()
+
+    paths = {'fast': parse_fast, 'trailing': parse_trailing, 'tokens': parse_tokens}
+    if not args.no_legacy:
+        paths['legacy'] = parse_legacy
+
+    results = []
+    for elements in sizes_up_to(args.max_elements):
+        for shape, build in SHAPES.items():
+            literal = build(elements)
+            result = {'shape': shape, 'elements': elements, 'bytes': len(literal)}
+            expected = None
+            for name, parse in paths.items():
+                seconds, value = best_time(parse, literal, args.repeat)
+                if name != 'tokens':
+                    expected = value if expected is None else expected
+                    assert value == expected, f'{name} parsed {shape} differently'
+                result[f'{name}_ms'] = seconds * 1000
+                result[f'{name}_ns_per_element'] = seconds / elements * 1e9
+            results.append(result)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    header = f'{"shape":<8} {"elements":>10} {"bytes":>12}'
+    for name in paths:
+        header += f' {name + " ms":>11} {"ns/elem":>8}'
+    print(header)
+    for result in results:
+        line = f'{result["shape"]:<8} {result["elements"]:>10,} {result["bytes"]:>12,}'
+        for name in paths:
+            line += f' {result[name + "_ms"]:>11.1f} {result[name + "_ns_per_element"]:>8.0f}'
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
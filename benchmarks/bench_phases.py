@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Phase benchmarks for the compiler - the same suite as 'webease bench'
+
+Builds synthetic pages (many small lines, nested literals, a large table,
+heavy component use, a large .wl library) and times parse, execute,
+render and write separately. Takes the same options as the command:
+
+    python benchmarks/bench_phases.py --size small --size medium -o before.json
+    python benchmarks/bench_phases.py --size small --size medium -o after.json --compare before.json
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease.cli import bench_command  # noqa: E402
+
+if __name__ == '__main__':
+    bench_command()
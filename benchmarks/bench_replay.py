@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Replay benchmark for compiled programs (WebeaseCompiler.render_program)
+
+Renders the same page many times, the way a preview service does, once
+by interpreting the source each time and once from a CompiledProgram
+with the rows passed in as a binding. --json prints the raw numbers.
+
+    python benchmarks/bench_replay.py --renders 1000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease import functions  # noqa: E402
+from src.webease.compiler import WebeaseCompiler  # noqa: E402
+from src.webease.program import CompiledProgram  # noqa: E402
+
+
+def template(statements):
+    """A page of short builder and component calls, plus a table filled from a binding"""
+    lines = ['define_component("card", "<div class=\'card\'><h3>{{title}}</h3><p>{{body}}</p></div>")']
+    for i in range(statements // 4):
+        lines.append(f'add_heading("Section {i}", level=2)')
+        lines.append(f'add_paragraph("Paragraph {i} with a little text")')
+        lines.append(f'add_badge("Badge {i}", color="#667eea")')
+        lines.append(f'card(title="Card {i}", body="Body text {i}")')
+    lines.append('create_table(["Name", "Price"], binding("products"))')
+    return '\n'.join(lines) + '\n'
+
+
+def interpret(compiler, source, rows):
+    """What a caller without compiled programs does: substitute the rows into the source and compile it"""
+    code = source.replace('binding("products")', repr(rows))
+    program = compiler.parse(code)
+    compiler.context = functions.WebeaseContext()
+    with functions.use_context(compiler.context):
+        compiler.execute_program(program)
+    return compiler.generate_html()
+
+
+def replay(compiler, program, rows):
+    html, error = compiler.render_program(program, {'products': rows})
+    if error:
+        raise RuntimeError(error)
+    return html
+
+
+def time_renders(render, renders):
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(renders):
+        html = render()
+    return (time.perf_counter() - start) / renders, html
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--renders', type=int, default=200, help='Renders per measurement')
+    parser.add_argument('--statements', type=int, default=400, help='Statements in the page')
+    parser.add_argument('--rows', type=int, default=50, help='Rows in the bound table')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    source = template(args.statements)
+    rows = [[f'Product {i}', f'{i}.99'] for i in range(args.rows)]
+    compiler = WebeaseCompiler()
+
+    start = time.perf_counter()
+    program = compiler.compile_program(source)
+    compile_seconds = time.perf_counter() - start
+    data = program.dumps()
+    start = time.perf_counter()
+    program = CompiledProgram.loads(data)
+    load_seconds = time.perf_counter() - start
+
+    interpreted, interpreted_html = time_renders(lambda: interpret(compiler, source, rows), args.renders)
+    replayed, replayed_html = time_renders(lambda: replay(compiler, program, rows), args.renders)
+    assert interpreted_html == replayed_html
+
+    result = {
+        'statements': len(program),
+        'rows': args.rows,
+        'renders': args.renders,
+        'compile_ms': compile_seconds * 1000,
+        'compiled_bytes': len(data),
+        'load_ms': load_seconds * 1000,
+        'interpreted_ms_per_render': interpreted * 1000,
+        'compiled_ms_per_render': replayed * 1000,
+        'speedup': interpreted / replayed,
+    }
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f'{result["statements"]} statements, {args.rows} bound rows, {args.renders} renders')
+    print(f'compile once     {result["compile_ms"]:>8.2f} ms ({len(data):,} bytes serialized, '
+          f'{result["load_ms"]:.2f} ms to load)')
+    print(f'interpreted      {result["interpreted_ms_per_render"]:>8.2f} ms/render')
+    print(f'compiled         {result["compiled_ms_per_render"]:>8.2f} ms/render ({result["speedup"]:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for importing Webease and compiling a first page
+
+Starts a fresh interpreter for every run and reads the cumulative import
+time of the CLI, the compiler and the function library from
+`python -X importtime`, then times a whole process that compiles a small
+page. Pass --root to measure another checkout (e.g. a worktree of an
+older commit) with the same script; --json prints the raw numbers.
+
+    python benchmarks/bench_startup.py --repeat 20
+"""
+
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = {
+    'cli': 'src.webease.cli',
+    'compiler': 'src.webease.compiler',
+    'functions': 'src.webease.functions',
+}
+
+# A first page that touches two builtin categories, like most small pages
+HELLO_PAGE = '''
+from src.webease.compiler import WebeaseCompiler
+compiler = WebeaseCompiler()
+program = compiler.compile_program('add_title("Hello")\\nadd_paragraph("Hi")\\nadd_badge("New")\\n')
+html, error = compiler.render_program(program)
+assert error is None, error
+'''
+
+
+def python_command(root, code, importtime=False):
+    prefix = f'import sys; sys.path.insert(0, {str(root)!r})\n'
+    return [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', prefix + code]
+
+
+def import_time(root, module):
+    """Cumulative import time of module in microseconds, and the number of modules it loaded"""
+    result = subprocess.run(python_command(root, f'import {module}', importtime=True),
+                            capture_output=True, text=True, check=True)
+    lines = [line for line in result.stderr.splitlines() if line.startswith('import time:')]
+    for line in lines:
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if name.strip() == module:
+            # The header line is not an import
+            return int(cumulative), len(lines) - 1
+    raise RuntimeError(f'{module} did not show up in -X importtime output')
+
+
+def process_time(root, code):
+    """Wall-clock seconds for a whole interpreter running code"""
+    start = time.perf_counter()
+    subprocess.run(python_command(root, code), check=True)
+    return time.perf_counter() - start
+
+
+def summarize(samples):
+    return {'min_ms': min(samples) * 1000, 'median_ms': statistics.median(samples) * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--root', type=Path, default=ROOT, help='Checkout to measure (default: this one)')
+    parser.add_argument('--repeat', type=int, default=10, help='Fresh interpreters per measurement')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    root = args.root.resolve()
+    # Stale or missing .pyc files would add compile time to every import
+    compileall.compile_dir(str(root / 'src'), quiet=1)
+    os.environ.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    results = {}
+    for label, module in MODULES.items():
+        samples = [import_time(root, module) for _ in range(args.repeat)]
+        results[f'import_{label}'] = {**summarize([micros / 1e6 for micros, _ in samples]),
+                                      'modules': samples[0][1]}
+
+    baseline = [process_time(root, 'pass') for _ in range(args.repeat)]
+    hello = [process_time(root, HELLO_PAGE) for _ in range(args.repeat)]
+    results['interpreter'] = summarize(baseline)
+    results['hello_page'] = summarize(hello)
+    # What Webease adds on top of starting Python
+    results['hello_page_overhead'] = summarize([max(h - min(baseline), 0.0) for h in hello])
+
+    if args.json:
+        print(json.dumps({'root': str(root), 'repeat': args.repeat, 'results': results}, indent=2))
+        return
+
+    print(f'{"measurement":<22} {"min ms":>9} {"median ms":>10} {"modules":>8}')
+    for name, result in results.items():
+        modules = result.get('modules', '')
+        print(f'{name:<22} {result["min_ms"]:>9.1f} {result["median_ms"]:>10.1f} {modules:>8}')
+
+
+if __name__ == '__main__':
+    main()
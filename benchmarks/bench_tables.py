@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for the list-driven builders (create_table, add_list, ...)
+
+Renders tables of growing size with create_table and, for comparison,
+with the `+=` loop it used before builders moved to webease.fragments.
+Time per cell should stay flat as the table grows; --json prints the
+raw numbers.
+
+    python benchmarks/bench_tables.py --max-cells 1000000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease import functions  # noqa: E402
+
+COLUMNS = 10
+
+
+def concat_table(headers, rows):
+    """create_table's markup built the old way, one += per cell"""
+    table_html = '<table><thead><tr>'
+    for header in headers:
+        table_html += f'<th>{header}</th>'
+    table_html += '</tr></thead><tbody>'
+    for row in rows:
+        table_html += '<tr>'
+        for cell in row:
+            table_html += f'<td>{cell}</td>'
+        table_html += '</tr>'
+    table_html += '</tbody></table>'
+    return table_html
+
+
+def fragment_table(headers, rows):
+    functions.reset_context()
+    functions.create_table(headers, rows)
+    return functions.get_context().html_parts[-1]
+
+
+def make_rows(cells):
+    return [[f'r{row}c{column}' for column in range(COLUMNS)] for row in range(cells // COLUMNS)]
+
+
+def best_time(render, headers, rows, repeat):
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        html = render(headers, rows)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(html)
+
+
+def sizes_up_to(max_cells):
+    size = 1000
+    while size < max_cells:
+        yield size
+        size *= 10
+    yield max_cells
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--max-cells', type=int, default=1_000_000, help='Largest table to render')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per size (the best is kept)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    headers = [f'Column {column}' for column in range(COLUMNS)]
+    results = []
+    for cells in sizes_up_to(args.max_cells):
+        rows = make_rows(cells)
+        fragments, size = best_time(fragment_table, headers, rows, args.repeat)
+        concat, concat_size = best_time(concat_table, headers, rows, args.repeat)
+        assert size == concat_size
+        results.append({
+            'cells': len(rows) * COLUMNS,
+            'bytes': size,
+            'fragments_ms': fragments * 1000,
+            'concat_ms': concat * 1000,
+            'fragments_ns_per_cell': fragments / (len(rows) * COLUMNS) * 1e9,
+            'concat_ns_per_cell': concat / (len(rows) * COLUMNS) * 1e9,
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f'{"cells":>10} {"bytes":>12} {"fragments ms":>13} {"ns/cell":>8} {"+= ms":>10} {"ns/cell":>8}')
+    for result in results:
+        print(f'{result["cells"]:>10,} {result["bytes"]:>12,} {result["fragments_ms"]:>13.1f} '
+              f'{result["fragments_ns_per_cell"]:>8.0f} {result["concat_ms"]:>10.1f} '
+              f'{result["concat_ns_per_cell"]:>8.0f}')
+
+
+if __name__ == '__main__':
+    main()
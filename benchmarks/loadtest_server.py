@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Load test comparing 'webease serve' with the old SimpleHTTPRequestHandler server
+
+Starts each server in its own process on a free port, hammers one page with
+concurrent keep-alive clients and reports requests per second and latency
+percentiles. With --slow-clients, that many extra connections send half a
+request and then stall for the whole run, which is what a slow network
+client looks like to a single-threaded server.
+
+    python benchmarks/loadtest_server.py --concurrency 50 --duration 5 --slow-clients 1
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SIMPLE_SERVER = '''
+import functools, http.server, socketserver, sys
+handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=sys.argv[1])
+handler.func.log_message = lambda *args: None
+with socketserver.TCPServer(("127.0.0.1", int(sys.argv[2])), handler) as httpd:
+    httpd.serve_forever()
+'''
+
+WEBEASE_SERVER = f'''
+import sys
+sys.path.insert(0, {str(ROOT)!r})
+from src.webease.server import run_server
+run_server(sys.argv[1], "127.0.0.1", int(sys.argv[2]))
+'''
+
+SERVERS = {'simple': SIMPLE_SERVER, 'webease': WEBEASE_SERVER}
+REQUEST_TIMEOUT = 5.0
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(name, directory):
+    port = free_port()
+    process = subprocess.Popen([sys.executable, '-c', SERVERS[name], str(directory), str(port)])
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return process, port
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError(f'{name} server did not start')
+
+
+async def request(reader, writer, path):
+    """Send one GET and read the response, returning True if the connection stays open"""
+    writer.write(f'GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n'.encode('latin-1'))
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ')[1])
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    if 'content-length' in headers:
+        await reader.readexactly(int(headers['content-length']))
+    else:
+        await reader.read()
+        return status, False
+
+    keep_alive = lines[0].startswith('HTTP/1.1') and headers.get('connection', '').lower() != 'close'
+    return status, keep_alive
+
+
+async def client(port, path, deadline, latencies, errors):
+    connection = None
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            if connection is None:
+                connection = await asyncio.wait_for(asyncio.open_connection('127.0.0.1', port), REQUEST_TIMEOUT)
+            status, keep_alive = await asyncio.wait_for(request(*connection, path), REQUEST_TIMEOUT)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, IndexError):
+            errors.append(time.perf_counter() - start)
+            if connection is not None:
+                connection[1].close()
+            connection = None
+            continue
+
+        if status == 200:
+            latencies.append(time.perf_counter() - start)
+        else:
+            errors.append(time.perf_counter() - start)
+        if not keep_alive:
+            connection[1].close()
+            connection = None
+
+    if connection is not None:
+        connection[1].close()
+
+
+async def slow_client(port, stop):
+    """Open a connection, send half a request line and go quiet"""
+    try:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    except OSError:
+        return
+    writer.write(b'GET / HTTP/1.1\r\n')
+    await writer.drain()
+    await stop.wait()
+    writer.close()
+
+
+async def run_load(port, path, concurrency, duration, slow_clients):
+    stop = asyncio.Event()
+    slow = [asyncio.create_task(slow_client(port, stop)) for _ in range(slow_clients)]
+    await asyncio.sleep(0.1)
+
+    latencies = []
+    errors = []
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(client(port, path, deadline, latencies, errors) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await asyncio.gather(*slow)
+    return latencies, errors, elapsed
+
+
+def percentile(values, fraction):
+    if not values:
+        return float('nan')
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def summarize(name, latencies, errors, elapsed):
+    return {
+        'server': name,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'requests_per_second': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--directory', default=str(ROOT / 'output'), help='Directory to serve')
+    parser.add_argument('--path', default=None, help='URL path to request (default: first .html file)')
+    parser.add_argument('--concurrency', type=int, default=50, help='Concurrent clients')
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds to run against each server')
+    parser.add_argument('--slow-clients', type=int, default=0, help='Stalled connections held open during the run')
+    parser.add_argument('--servers', default='simple,webease', help='Comma-separated servers to test')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    path = args.path
+    if path is None:
+        pages = sorted(Path(args.directory).glob('*.html'))
+        if not pages:
+            parser.error(f'no .html files in {args.directory}; compile something first')
+        path = '/' + pages[0].name
+
+    results = []
+    for name in args.servers.split(','):
+        process, port = start_server(name, args.directory)
+        try:
+            latencies, errors, elapsed = asyncio.run(
+                run_load(port, path, args.concurrency, args.duration, args.slow_clients))
+        finally:
+            process.terminate()
+            process.wait()
+        results.append(summarize(name, latencies, errors, elapsed))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f'GET {path} with {args.concurrency} clients for {args.duration:g}s'
+          f' ({args.slow_clients} slow client(s))')
+    print(f'{"server":<10} {"requests":>10} {"errors":>8} {"req/s":>10} {"p50 ms":>9} {"p99 ms":>9}')
+    for result in results:
+        print(f'{result["server"]:<10} {result["requests"]:>10} {result["errors"]:>8} '
+              f'{result["requests_per_second"]:>10.0f} {result["p50_ms"]:>9.2f} {result["p99_ms"]:>9.2f}')
+
+
+if __name__ == '__main__':
+    main()
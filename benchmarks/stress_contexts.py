@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Stress check for per-thread and per-task compile contexts
+
+Compiles every example page serially with compile_file, then compiles
+the same pages a few hundred times at once from a ThreadPoolExecutor and
+from asyncio tasks using run_in_executor. Every concurrent result must be
+byte-for-byte equal to the serial one; the script exits with status 1
+if any differs. tests/test_context.py runs a smaller version under pytest.
+
+    python benchmarks/stress_contexts.py --compiles 400 --workers 16
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease.compiler import WebeaseCompiler  # noqa: E402
+from src.webease.libraries import LibraryRegistry  # noqa: E402
+
+LIBRARIES = LibraryRegistry((ROOT / 'libraries', ROOT))
+
+
+def compile_page(page):
+    """Compile a page with its own compiler, as every worker thread does
+
+    A compile error is returned as the output, so a context leaking between
+    threads shows up as a mismatch rather than stopping the run.
+    """
+    html, error = WebeaseCompiler(libraries=LIBRARIES).compile_file(str(page))
+    return page, (error or html).encode('utf-8')
+
+
+def check(label, results, baseline, elapsed):
+    mismatches = [page.name for page, html in results if html != baseline[page]]
+    status = 'ok' if not mismatches else f'{len(mismatches)} MISMATCHED ({", ".join(sorted(set(mismatches)))})'
+    print(f'{label:<10} {len(results):>6} compiles in {elapsed * 1000:>8.1f} ms  {status}')
+    return not mismatches
+
+
+def run_threads(jobs, workers):
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(compile_page, jobs))
+
+
+async def run_asyncio(jobs, workers):
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return await asyncio.gather(*(loop.run_in_executor(executor, compile_page, page) for page in jobs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--compiles', type=int, default=400, help='Concurrent compiles per executor')
+    parser.add_argument('--workers', type=int, default=16, help='Threads per executor')
+    args = parser.parse_args()
+
+    pages = sorted((ROOT / 'examples').glob('*.ws'))
+    baseline = {}
+    for page in pages:
+        html, error = WebeaseCompiler(libraries=LIBRARIES).compile_file(str(page))
+        if error:
+            sys.exit(f'{page.name} does not compile serially:\n{error}')
+        baseline[page] = html.encode('utf-8')
+    jobs = [pages[i % len(pages)] for i in range(args.compiles)]
+
+    start = time.perf_counter()
+    results = run_threads(jobs, args.workers)
+    passed = check('threads', results, baseline, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    results = asyncio.run(run_asyncio(jobs, args.workers))
+    passed = check('asyncio', results, baseline, time.perf_counter() - start) and passed
+
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,7 @@ import sys
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from src.webease.build import atomic_writer
 from src.webease.compiler import WebeaseCompiler
 
 
@@ -170,7 +171,24 @@ class WebeaseGUI:
         
         try:
             # Compile
-            html, error = self.compiler.compile_file(input_path)
+            context, error = self.compiler.compile_context(input_path)
+            
+            if not error:
+                # Create output directory
+                output_dir = Path(self.output_dir.get())
+                output_dir.mkdir(exist_ok=True)
+                
+                # Generate output filename
+                input_path_obj = Path(input_path)
+                output_filename = input_path_obj.stem + '.html'
+                output_path = output_dir / output_filename
+                
+                # Write HTML one fragment at a time
+                try:
+                    with atomic_writer(output_path) as f:
+                        self.compiler.generate_html_stream(f)
+                except Exception as e:
+                    error = self.compiler.format_error(e)
             
             if error:
                 self.log(f"\n❌ Compilation Failed!\n", "ERROR")
@@ -179,19 +197,6 @@ class WebeaseGUI:
                 messagebox.showerror("Compilation Error", "See log for details")
                 return
             
-            # Create output directory
-            output_dir = Path(self.output_dir.get())
-            output_dir.mkdir(exist_ok=True)
-            
-            # Generate output filename
-            input_path_obj = Path(input_path)
-            output_filename = input_path_obj.stem + '.html'
-            output_path = output_dir / output_filename
-            
-            # Write HTML
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html)
-            
             self.log(f"\n✅ Successfully compiled!", "SUCCESS")
             self.log(f"📄 Output: {output_path}", "SUCCESS")
             
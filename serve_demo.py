@@ -3,22 +3,19 @@
 Simple HTTP server to demonstrate compiled Webease files
 """
 
-import http.server
-import socketserver
-import os
 from pathlib import Path
+from src.webease.server import run_server
 
 PORT = 5000
 
-os.chdir('output')
+print(f"🌐 Serving compiled Webease files at http://0.0.0.0:{PORT}")
+print(f"📁 Directory: {Path('output').absolute()}")
+print("\nAvailable files:")
+for file in Path('output').glob('*.html'):
+    print(f"  - http://0.0.0.0:{PORT}/{file.name}")
+print("\n Press Ctrl+C to stop")
 
-Handler = http.server.SimpleHTTPRequestHandler
-
-with socketserver.TCPServer(("0.0.0.0", PORT), Handler) as httpd:
-    print(f"🌐 Serving compiled Webease files at http://0.0.0.0:{PORT}")
-    print(f"📁 Directory: {Path.cwd()}")
-    print("\nAvailable files:")
-    for file in Path('.').glob('*.html'):
-        print(f"  - http://0.0.0.0:{PORT}/{file.name}")
-    print("\n Press Ctrl+C to stop")
-    httpd.serve_forever()
+try:
+    run_server('output', '0.0.0.0', PORT)
+except KeyboardInterrupt:
+    pass
@@ -0,0 +1,219 @@
+"""
+Webease Bench - Synthetic workloads timed phase by phase for 'webease bench'
+"""
+
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import __version__
+from . import functions
+from . import parser
+from .build import write_atomic
+from .compiler import WebeaseCompiler
+from .libraries import LibraryRegistry
+
+
+PHASES = ('parse', 'execute', 'render', 'write')
+SIZES = {'small': 1, 'medium': 10, 'large': 100}
+DEFAULT_SIZES = ('small', 'medium')
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 1.25
+# Phases faster than this are too noisy to call a regression
+NOISE_FLOOR_MS = 1.0
+RESULTS_FORMAT = 1
+
+
+# ==================== WORKLOADS ====================
+
+def lines_workload(scale):
+    """Many short statements, one builder call per line"""
+    builders = ('add_paragraph("Paragraph {i} with a little text")', 'add_heading("Heading {i}", level=2)',
+                'add_link("/page/{i}", "Link {i}")', 'add_badge("Badge {i}", color="#667eea")')
+    lines = [builders[i % len(builders)].format(i=i) for i in range(200 * scale)]
+    return '\n'.join(lines) + '\n', {}
+
+
+def nested_literal(depth, breadth, prefix='v'):
+    if depth == 0:
+        return f'"{prefix}"'
+    items = [nested_literal(depth - 1, breadth, f'{prefix}{i}') for i in range(breadth)]
+    if depth % 2:
+        return '[' + ', '.join(items) + ']'
+    return '{' + ', '.join(f'"k{i}": {item}' for i, item in enumerate(items)) + '}'
+
+
+def nested_workload(scale):
+    """Deeply nested list and dict literals (depth 6, two items per level)"""
+    literal = nested_literal(6, 2)
+    return ''.join(f'add_text({literal})\n' for _ in range(10 * scale)), {}
+
+
+def table_workload(scale):
+    """One create_table call with a large inline row literal (10 columns)"""
+    headers = ', '.join(f'"Column {column}"' for column in range(10))
+    rows = ', '.join('[' + ', '.join(f'"r{row}c{column}"' for column in range(10)) + ']'
+                     for row in range(100 * scale))
+    return f'add_title("Table")\ncreate_table([{headers}], [{rows}])\n', {}
+
+
+def components_workload(scale):
+    """A few components, each used many times"""
+    lines = [
+        'define_component("card", "<div class=\'card\'><h3>{{title}}</h3><p>{{body}}</p></div>")',
+        'define_component("item", "<li>{{label}}</li>")',
+    ]
+    for i in range(100 * scale):
+        lines.append(f'use_component("card", title="Card {i}", body="Body text {i}")')
+        lines.append(f'use_component("item", label="Item {i}")')
+    return '\n'.join(lines) + '\n', {}
+
+
+def library_workload(scale):
+    """A large .wl library, imported by a page that uses a few of its components"""
+    components = [
+        f'component widget_{i} {{\n'
+        f'<div class="widget-{i}" style="padding: 10px;">\n'
+        f'    <h4>{{{{title}}}}</h4>\n'
+        f'    <p>{{{{text}}}}</p>\n'
+        f'</div>\n}}\n'
+        for i in range(50 * scale)
+    ]
+    lines = ['import_library("bench_widgets")']
+    lines += [f'use_component("widget_{i}", title="Title {i}", text="Text {i}")' for i in range(20)]
+    return '\n'.join(lines) + '\n', {'bench_widgets': '\n'.join(components)}
+
+
+WORKLOADS = {
+    'lines': lines_workload,
+    'nested': nested_workload,
+    'table': table_workload,
+    'components': components_workload,
+    'library': library_workload,
+}
+
+
+# ==================== TIMING ====================
+
+def time_phases(compiler, source, output_path):
+    """Run one page through parse, execute, render and write, returning seconds per phase and the HTML"""
+    timings = {}
+    start = time.perf_counter()
+    program = parser.parse(source)
+    timings['parse'] = time.perf_counter() - start
+
+    compiler.context = functions.WebeaseContext()
+    compiler.dependencies = []
+    start = time.perf_counter()
+    with functions.use_context(compiler.context):
+        compiler.execute_program(program)
+    timings['execute'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    html = compiler.generate_html()
+    timings['render'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    write_atomic(output_path, html)
+    timings['write'] = time.perf_counter() - start
+    return timings, html
+
+
+def run_workload(name, size, repeat=DEFAULT_REPEAT, minify=False):
+    """Time one workload at one size, keeping the fastest run of each phase"""
+    # statistics is slow to import and only needed once a benchmark runs
+    import statistics
+
+    source, libraries = WORKLOADS[name](SIZES[size])
+    runs = {phase: [] for phase in PHASES}
+
+    with tempfile.TemporaryDirectory(prefix='webease-bench-') as directory:
+        directory = Path(directory)
+        for library, text in libraries.items():
+            (directory / f'{library}.wl').write_text(text, encoding='utf-8')
+
+        for _ in range(repeat):
+            # A fresh registry each run, so library parsing is part of 'execute'
+            compiler = WebeaseCompiler(minify=minify, libraries=LibraryRegistry((directory,)))
+            gc.collect()
+            timings, html = time_phases(compiler, source, directory / 'page.html')
+            for phase in PHASES:
+                runs[phase].append(timings[phase])
+
+    result = {
+        'workload': name,
+        'size': size,
+        'source_bytes': len(source.encode('utf-8')),
+        'output_bytes': len(html.encode('utf-8')),
+    }
+    for phase in PHASES:
+        result[f'{phase}_ms'] = min(runs[phase]) * 1000
+        result[f'{phase}_median_ms'] = statistics.median(runs[phase]) * 1000
+    result['total_ms'] = sum(result[f'{phase}_ms'] for phase in PHASES)
+    return result
+
+
+def run_suite(workloads=None, sizes=DEFAULT_SIZES, repeat=DEFAULT_REPEAT, minify=False, progress=None):
+    """Run every workload at every size and return the results document"""
+    results = []
+    for size in sizes:
+        for name in workloads or WORKLOADS:
+            result = run_workload(name, size, repeat, minify)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return {
+        'format': RESULTS_FORMAT,
+        'webease': __version__,
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'repeat': repeat,
+        'minify': minify,
+        'results': results,
+    }
+
+
+# ==================== RESULTS ====================
+
+def save_results(document, path):
+    write_atomic(path, json.dumps(document, indent=2) + '\n')
+
+
+def load_results(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Return (workload, size, phase, before_ms, after_ms) for every phase that got slower than threshold x"""
+    before = {(result['workload'], result['size']): result for result in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        old = before.get((result['workload'], result['size']))
+        if old is None:
+            continue
+        for phase in PHASES + ('total',):
+            key = f'{phase}_ms'
+            if key not in old:
+                continue
+            if result[key] > old[key] * threshold and result[key] - old[key] > NOISE_FLOOR_MS:
+                regressions.append((result['workload'], result['size'], phase, old[key], result[key]))
+    return regressions
+
+
+def format_result(result):
+    phases = ' '.join(f'{result[f"{phase}_ms"]:>9.2f}' for phase in PHASES)
+    return (f'{result["workload"]:<11} {result["size"]:<7} {result["source_bytes"]:>10,} '
+            f'{phases} {result["total_ms"]:>9.2f}')
+
+
+def format_header():
+    phases = ' '.join(f'{phase + " ms":>9}' for phase in PHASES)
+    return f'{"workload":<11} {"size":<7} {"source":>10} {phases} {"total ms":>9}'
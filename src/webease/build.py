@@ -0,0 +1,443 @@
+"""
+Webease Build - Incremental multi-page builds driven by a manifest
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+
+from . import __version__
+from .cache import ParseCache
+from .bundle import DEFAULT_MIN_PAGES, plan_bundle
+from .compiler import WebeaseCompiler
+from .compress import ENCODERS, get_encoder, write_variants
+from .libraries import registry_for
+
+
+MANIFEST_NAME = '.webease-manifest.json'
+MANIFEST_FORMAT = 1
+WRITE_CHUNK = 64 * 1024
+
+
+def hash_file(path):
+    """Return the sha256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_record(path):
+    """Describe a file by its hash, mtime and size"""
+    stat = os.stat(path)
+    return {'hash': hash_file(path), 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def record_matches(path, record):
+    """Check a file against a file_record, hashing only when the stat data differs
+
+    A file that was touched but not edited gets its record's mtime updated,
+    so the next check is a plain stat again.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    if stat.st_mtime_ns == record['mtime_ns'] and stat.st_size == record['size']:
+        return True
+    if stat.st_size == record['size'] and hash_file(path) == record['hash']:
+        record['mtime_ns'] = stat.st_mtime_ns
+        return True
+    return False
+
+
+@contextmanager
+def atomic_writer(path, binary=False):
+    """Open a temporary file that replaces path only if the block finishes without an error"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    try:
+        if binary:
+            with open(temp_path, 'wb') as f:
+                yield f
+        else:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def write_atomic(path, data):
+    """Write text or bytes to path so readers never see a half-written file"""
+    with atomic_writer(path, binary=isinstance(data, bytes)) as f:
+        f.write(data)
+
+
+def encoded_chunks(pieces):
+    """Join text fragments into UTF-8 chunks of about WRITE_CHUNK characters"""
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= WRITE_CHUNK:
+            yield ''.join(buffer).encode('utf-8')
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+
+def write_page(output_path, html, precompress=(), compress_level=None):
+    """Stream a page and its precompressed variants to disk, removing variants that are now stale
+
+    html is a string or an iterable of fragments such as compiler.iter_html().
+    Returns (size, {encoding: size}) for the page and the variants kept; a
+    variant that comes out no smaller than the page is removed.
+    """
+    pieces = (html,) if isinstance(html, str) else html
+    with ExitStack() as stack:
+        # Variants are opened first so they are closed after the page, keeping
+        # their mtimes at or after its mtime as the preview server expects
+        variants = {name: stack.enter_context(atomic_writer(f'{output_path}{get_encoder(name).suffix}', binary=True))
+                    for name in precompress}
+        f = stack.enter_context(atomic_writer(output_path, binary=True))
+        size = write_variants(encoded_chunks(pieces), f, variants, compress_level)
+        sizes = {name: variant.tell() for name, variant in variants.items()}
+
+    encoded_sizes = {}
+    for name, encoder in ENCODERS.items():
+        if sizes.get(name, size) < size:
+            encoded_sizes[name] = sizes[name]
+        else:
+            try:
+                os.unlink(f'{output_path}{encoder.suffix}')
+            except FileNotFoundError:
+                pass
+    return size, encoded_sizes
+
+
+def remove_page(output_path):
+    """Delete a page's output and any precompressed variants"""
+    for path in [output_path] + [f'{output_path}{encoder.suffix}' for encoder in ENCODERS.values()]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def build_options(minify=False, precompress=(), compress_level=None, bundle=False,
+                  bundle_min_pages=DEFAULT_MIN_PAGES):
+    """The settings that change a build's output; a change to any of them rebuilds every page"""
+    options = {'minify': minify}
+    if precompress:
+        options['precompress'] = sorted(precompress)
+        options['compress_level'] = compress_level
+    if bundle:
+        options['bundle_min_pages'] = bundle_min_pages
+    return options
+
+
+def find_pages(source_dir):
+    """Find every .ws page under a directory, in a stable order"""
+    return sorted(Path(source_dir).rglob('*.ws'))
+
+
+def output_path_for(page, source_dir, output_dir):
+    """Mirror a page's location under source_dir into output_dir"""
+    relative = Path(page).relative_to(source_dir)
+    return Path(output_dir) / relative.with_suffix('.html')
+
+
+class BuildManifest:
+    """Records the inputs each page was built from, so unchanged pages can be skipped"""
+
+    def __init__(self, path, options=None):
+        self.path = Path(path)
+        self.options = options or {}
+        self.pages = {}
+        self.changed = False
+        self._checked = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (data.get('format') == MANIFEST_FORMAT and data.get('compiler') == __version__
+                and data.get('options', {}) == self.options):
+            self.pages = data.get('pages', {})
+        else:
+            self.changed = True
+
+    def save(self):
+        if not self.changed:
+            return
+        data = {'format': MANIFEST_FORMAT, 'compiler': __version__, 'options': self.options, 'pages': self.pages}
+        write_atomic(self.path, json.dumps(data, sort_keys=True, separators=(',', ':')))
+        self.changed = False
+
+    def file_unchanged(self, path, record):
+        """Check a file against its record, hashing only when the stat data differs"""
+        key = str(path)
+        if key in self._checked:
+            return self._checked[key]
+
+        mtime_ns = record['mtime_ns']
+        unchanged = record_matches(path, record)
+        if record['mtime_ns'] != mtime_ns:
+            self.changed = True
+
+        self._checked[key] = unchanged
+        return unchanged
+
+    def forget_checks(self):
+        """Re-stat files on the next freshness check instead of reusing earlier answers"""
+        self._checked.clear()
+
+    def is_fresh(self, page_key, page_path, output_path):
+        """True if the page, its libraries and its output are all unchanged"""
+        entry = self.pages.get(page_key)
+        if entry is None or not os.path.exists(output_path):
+            return False
+        if not self.file_unchanged(page_path, entry['source']):
+            return False
+        return all(
+            self.file_unchanged(dep_path, record)
+            for dep_path, record in entry['dependencies'].items()
+        )
+
+    def record(self, page_key, page_path, dependencies, output_path):
+        """Remember the inputs a page was just built from"""
+        self.pages[page_key] = {
+            'source': file_record(page_path),
+            'dependencies': {str(dep): file_record(dep) for dep in dependencies},
+            'output': str(output_path),
+        }
+        self.changed = True
+
+    def prune(self, page_keys):
+        """Forget pages that no longer exist, returning their keys"""
+        removed = sorted(set(self.pages) - set(page_keys))
+        for key in removed:
+            del self.pages[key]
+            self.changed = True
+        return removed
+
+
+class PageResult:
+    """The outcome of compiling one page, as returned by a worker
+
+    The page itself is already on disk; only its sizes come back.
+    """
+
+    def __init__(self, page, error=None, dependencies=(), elapsed=0.0,
+                 original_size=None, output_size=None, encoded_sizes=None, context=None):
+        self.page = page
+        self.error = error
+        self.dependencies = list(dependencies)
+        self.elapsed = elapsed
+        self.original_size = original_size
+        self.output_size = output_size
+        self.encoded_sizes = encoded_sizes or {}
+        self.context = context
+
+
+class BuildResult:
+    def __init__(self):
+        self.built = []
+        self.skipped = []
+        self.failed = []
+        self.removed = []
+        self.timings = {}
+        self.elapsed = 0.0
+        self.original_size = 0
+        self.output_size = 0
+        self.uncompressed_size = 0
+        self.encoded_sizes = {}
+        self.bundle = None
+
+    @property
+    def pages_per_second(self):
+        compiled = len(self.built) + len(self.failed)
+        return compiled / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def compile_page(compiler, page, output_path=None, precompress=(), compress_level=None, keep_context=False):
+    """Compile one page and stream it, with any precompressed variants, to output_path
+
+    With keep_context the page is only run, not rendered, and the result
+    carries its context so a bundled build can render it later.
+    """
+    start = time.perf_counter()
+    try:
+        context, error = compiler.compile_context(page)
+    except OSError as e:
+        context, error = None, compiler.format_error(e)
+    if error or keep_context:
+        if context is not None:
+            context.custom_functions = {}
+        return PageResult(page, error, compiler.dependencies, time.perf_counter() - start, context=context)
+
+    try:
+        output_size, encoded_sizes = write_page(output_path, compiler.iter_html(), precompress, compress_level)
+    except Exception as e:
+        return PageResult(page, compiler.format_error(e), compiler.dependencies, time.perf_counter() - start)
+    return PageResult(page, None, compiler.dependencies, time.perf_counter() - start,
+                      compiler.original_size, output_size, encoded_sizes)
+
+
+# Each worker process keeps one warm compiler for all the pages it is given
+_worker_compiler = None
+_worker_precompress = ()
+_worker_compress_level = None
+_worker_keep_context = False
+
+
+def _init_worker(use_cache, minify, library_path, precompress, compress_level, keep_context):
+    global _worker_compiler, _worker_precompress, _worker_compress_level, _worker_keep_context
+    _worker_compiler = WebeaseCompiler(cache=ParseCache() if use_cache else None, minify=minify,
+                                       libraries=registry_for(library_path))
+    _worker_precompress = precompress
+    _worker_compress_level = compress_level
+    _worker_keep_context = keep_context
+
+
+def _compile_in_worker(page, output_path):
+    return compile_page(_worker_compiler, page, output_path, _worker_precompress, _worker_compress_level,
+                        _worker_keep_context)
+
+
+def compile_pages(pages, output_paths, jobs=1, use_cache=True, minify=False, library_path=(), precompress=(),
+                  compress_level=None, keep_context=False):
+    """Compile pages serially or across worker processes, yielding results in order
+
+    Each page is written to its output path by the process that compiled it.
+    """
+    if jobs == 1 or len(pages) < 2:
+        compiler = WebeaseCompiler(cache=ParseCache() if use_cache else None, minify=minify,
+                                   libraries=registry_for(library_path))
+        for page, output_path in zip(pages, output_paths):
+            yield compile_page(compiler, page, output_path, precompress, compress_level, keep_context)
+        return
+
+    # Deferred so commands that never start workers don't import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(jobs, len(pages))
+    chunksize = max(1, len(pages) // (workers * 4))
+    initargs = (use_cache, minify, tuple(library_path), tuple(precompress), compress_level, keep_context)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as executor:
+        yield from executor.map(_compile_in_worker, pages, output_paths, chunksize=chunksize)
+
+
+def build_site(source_dir, output_dir='output', force=False, jobs=1, use_cache=True, minify=False,
+               library_path=(), precompress=(), compress_level=None, bundle=False,
+               bundle_min_pages=DEFAULT_MIN_PAGES):
+    """Compile every changed .ws page under source_dir into output_dir
+
+    With bundle, CSS and JS shared by several pages are moved into
+    site.<hash>.css/js. The bundle depends on every page, so a change to
+    any page rebuilds them all.
+    """
+    start = time.perf_counter()
+    source_dir = Path(source_dir)
+    output_dir = Path(output_dir)
+    options = build_options(minify, precompress, compress_level, bundle, bundle_min_pages)
+    manifest = BuildManifest(output_dir / MANIFEST_NAME, options)
+    result = BuildResult()
+    jobs = jobs or os.cpu_count() or 1
+
+    page_keys = {}
+    stale = []
+    for page in find_pages(source_dir):
+        page_key = page.relative_to(source_dir).as_posix()
+        page_keys[page] = page_key
+        output_path = output_path_for(page, source_dir, output_dir)
+
+        if force or not manifest.is_fresh(page_key, page, output_path):
+            stale.append(page)
+        else:
+            result.skipped.append(page)
+
+    if bundle and stale:
+        stale = list(page_keys)
+        result.skipped = []
+
+    output_paths = [output_path_for(page, source_dir, output_dir) for page in stale]
+    page_results = compile_pages(stale, output_paths, jobs, use_cache, minify, library_path, precompress,
+                                 compress_level, keep_context=bundle)
+    if bundle and stale:
+        page_results = render_bundled(page_results, page_keys, source_dir, output_dir, minify, precompress,
+                                      compress_level, bundle_min_pages, result)
+
+    for page_result in page_results:
+        page = page_result.page
+        result.timings[page] = page_result.elapsed
+        if page_result.error:
+            result.failed.append((page, page_result.error))
+            continue
+
+        output_path = output_path_for(page, source_dir, output_dir)
+        if precompress:
+            result.uncompressed_size += page_result.output_size
+            for name in precompress:
+                # A page too small to compress is served as-is, so it counts at full size
+                size = page_result.encoded_sizes.get(name) or page_result.output_size
+                result.encoded_sizes[name] = result.encoded_sizes.get(name, 0) + size
+        if minify:
+            result.original_size += page_result.original_size
+            result.output_size += page_result.output_size
+        manifest.record(page_keys[page], page, page_result.dependencies, output_path)
+        result.built.append(page)
+
+    result.removed = [source_dir / key for key in manifest.prune(page_keys.values())]
+    manifest.save()
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def render_bundled(page_results, page_keys, source_dir, output_dir, minify, precompress, compress_level,
+                   min_pages, result):
+    """Plan the shared bundle from every page's context, write it, then render the pages against it"""
+    page_results = list(page_results)
+    contexts = {page_keys[page_result.page]: page_result.context
+                for page_result in page_results if page_result.context is not None}
+
+    site_bundle = plan_bundle(contexts, min_pages, minify)
+    site_bundle.write(output_dir, lambda path, text: write_page(path, text, precompress, compress_level))
+    result.bundle = site_bundle
+
+    compiler = WebeaseCompiler(minify=minify)
+    for page_result in page_results:
+        if page_result.context is None:
+            yield page_result
+            continue
+
+        start = time.perf_counter()
+        page_key = page_keys[page_result.page]
+        compiler.context = page_result.context
+        output_path = output_path_for(page_result.page, source_dir, output_dir)
+        assets = site_bundle.assets_for(page_key, output_path, output_dir)
+        try:
+            page_result.output_size, page_result.encoded_sizes = write_page(
+                output_path, compiler.iter_html(assets), precompress, compress_level)
+            page_result.original_size = compiler.original_size
+        except Exception as e:
+            page_result.error = compiler.format_error(e)
+        page_result.context = None
+        page_result.elapsed += time.perf_counter() - start
+        yield page_result
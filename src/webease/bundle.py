@@ -0,0 +1,217 @@
+"""
+Webease Bundle - Shared CSS and JavaScript extracted from a multi-page build
+"""
+
+import hashlib
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+
+from .compiler import BASE_CSS
+from .compress import ENCODERS
+from .css import rule_parts, split_rules
+from .minify import minify_css, minify_js
+
+
+BUNDLE_NAME = 'site'
+BUNDLE_PATTERN = re.compile(r'^site\.[0-9a-f]{12}\.(css|js)$')
+DEFAULT_MIN_PAGES = 2
+COMPRESSED_SUFFIXES = tuple(encoder.suffix for encoder in ENCODERS.values())
+KEYFRAMES_PATTERN = re.compile(r'@(?:-\w+-)?keyframes\s+([\w-]+)')
+
+
+def rule_targets(rule):
+    """The selectors (or @keyframes names) a CSS block defines, or None if unknown
+
+    Selectors are compared literally. That is enough for the class-scoped
+    rules the builders generate, and anything that can't be analysed
+    (@media blocks, comments, ...) is treated as conflicting with everything.
+    """
+    rules = split_rules(rule)
+    if not rules:
+        return None
+    targets = set()
+    for single in rules:
+        keyframes = KEYFRAMES_PATTERN.match(single)
+        if keyframes:
+            targets.add('@keyframes ' + keyframes.group(1))
+            continue
+        parts = rule_parts(single)
+        if parts is None:
+            return None
+        targets.update(selector.strip() for selector in parts[0].split(','))
+    return targets
+
+
+def cascade_conflict(rules, positions):
+    """True if hoisting a page's shared rules into the site stylesheet could change the cascade
+
+    The site stylesheet is linked before the page's own <style>, so every
+    shared rule effectively moves ahead of the page rules that preceded it,
+    and shared rules take the stylesheet's order. That is only safe when no
+    rule that ends up after a shared rule targets the same selector.
+    """
+    seen = {}
+    unknown_seen = -1
+    latest = -1
+    for rule in rules:
+        position = positions.get(rule, len(positions))
+        targets = rule_targets(rule)
+        shared = rule in positions
+
+        if shared:
+            if unknown_seen > position:
+                return True
+            if targets is None:
+                if latest > position:
+                    return True
+            elif any(seen.get(target, -1) > position for target in targets):
+                return True
+
+        latest = max(latest, position)
+        if targets is None:
+            unknown_seen = max(unknown_seen, position)
+        else:
+            for target in targets:
+                seen[target] = max(seen.get(target, -1), position)
+    return False
+
+
+def choose_shared(page_items, min_pages):
+    """Greedily pick the items worth moving into a shared file
+
+    Every linking page must contain every chosen item, so each item added
+    narrows the set of pages. An item is kept when it increases the bytes
+    saved, (bundle size) x (linking pages - 1). Returns (items, pages).
+    """
+    pages_with = defaultdict(set)
+    for page, items in page_items.items():
+        for item in items:
+            pages_with[item].add(page)
+
+    candidates = [item for item, pages in pages_with.items() if len(pages) >= min_pages]
+    candidates.sort(key=lambda item: len(pages_with[item]), reverse=True)
+
+    chosen = []
+    linked = set(page_items)
+    size = 0
+    for item in candidates:
+        pages = linked & pages_with[item]
+        new_size = size + len(item)
+        if len(pages) >= min_pages and new_size * (len(pages) - 1) > size * (len(linked) - 1):
+            chosen.append(item)
+            linked = pages
+            size = new_size
+    if not chosen:
+        return [], set()
+    return chosen, linked
+
+
+class PageAssets:
+    """The shared files one page links to, and what they already contain"""
+
+    __slots__ = ('css_href', 'css_rules', 'js_href', 'js_chunks')
+
+    def __init__(self, css_href=None, css_rules=frozenset(), js_href=None, js_chunks=()):
+        self.css_href = css_href
+        self.css_rules = css_rules
+        self.js_href = js_href
+        self.js_chunks = js_chunks
+
+
+class SiteBundle:
+    """The shared stylesheet and script for a site, and which pages link them"""
+
+    def __init__(self, css_rules=(), css_pages=(), js_chunks=(), js_pages=(), minify=False):
+        self.css_rules = list(css_rules)
+        self.css_pages = set(css_pages)
+        self.js_chunks = list(js_chunks)
+        self.js_pages = set(js_pages)
+        self.minify = minify
+        self._css_set = frozenset(self.css_rules)
+
+        self.css = self.render_css() if self.css_rules else None
+        self.js = self.render_js() if self.js_chunks else None
+        self.css_name = self.file_name(self.css, 'css')
+        self.js_name = self.file_name(self.js, 'js')
+
+    def render_css(self):
+        if self.minify:
+            return ''.join(minify_css(rule) for rule in self.css_rules)
+        return '\n'.join(self.css_rules) + '\n'
+
+    def render_js(self):
+        if self.minify:
+            return '\n'.join(filter(None, (minify_js(chunk) for chunk in self.js_chunks)))
+        return '\n'.join(self.js_chunks) + '\n'
+
+    @staticmethod
+    def file_name(text, extension):
+        if text is None:
+            return None
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]
+        return f'{BUNDLE_NAME}.{digest}.{extension}'
+
+    def assets_for(self, page_key, output_path, output_dir):
+        """The PageAssets for one page, with links relative to its output file"""
+        css_href = js_href = None
+        if page_key in self.css_pages:
+            css_href = self.relative_href(self.css_name, output_path, output_dir)
+        if page_key in self.js_pages:
+            js_href = self.relative_href(self.js_name, output_path, output_dir)
+        if css_href is None and js_href is None:
+            return None
+        return PageAssets(css_href, self._css_set if css_href else frozenset(),
+                          js_href, self.js_chunks if js_href else ())
+
+    @staticmethod
+    def relative_href(name, output_path, output_dir):
+        return Path(os.path.relpath(Path(output_dir) / name, Path(output_path).parent)).as_posix()
+
+    def write(self, output_dir, write):
+        """Write the bundle files with write(path, text) and delete bundles from earlier builds"""
+        output_dir = Path(output_dir)
+        current = {self.css_name, self.js_name}
+        if self.css is not None:
+            write(output_dir / self.css_name, self.css)
+        if self.js is not None:
+            write(output_dir / self.js_name, self.js)
+
+        try:
+            names = os.listdir(output_dir)
+        except OSError:
+            return
+        for name in names:
+            # Precompressed copies (site.<hash>.css.gz) go with their bundle
+            base_name = os.path.splitext(name)[0] if name.endswith(COMPRESSED_SUFFIXES) else name
+            if BUNDLE_PATTERN.match(base_name) and base_name not in current:
+                try:
+                    os.unlink(output_dir / name)
+                except OSError:
+                    pass
+
+
+def plan_bundle(contexts, min_pages=DEFAULT_MIN_PAGES, minify=False):
+    """Work out the shared site stylesheet and script for {page_key: context}"""
+    page_rules = {key: [BASE_CSS] + list(context.css_rules) for key, context in contexts.items()}
+    css_rules, css_pages = choose_shared({key: set(rules) for key, rules in page_rules.items()}, min_pages)
+
+    if css_rules:
+        # Use the order of the first linking page, then drop pages whose cascade it would change
+        reference = page_rules[min(css_pages)]
+        order = {rule: index for index, rule in enumerate(reference)}
+        css_rules.sort(key=lambda rule: order[rule])
+        positions = {rule: index for index, rule in enumerate(css_rules)}
+        css_pages = {key for key in css_pages if not cascade_conflict(page_rules[key], positions)}
+        if len(css_pages) < min_pages:
+            css_rules, css_pages = [], set()
+
+    page_chunks = {key: set(context.js_code) for key, context in contexts.items()}
+    js_chunks, js_pages = choose_shared(page_chunks, min_pages)
+    if js_chunks:
+        # Builder scripts are self-contained, so only their relative order is kept
+        reference = contexts[min(js_pages)].js_code
+        js_chunks.sort(key=reference.index)
+
+    return SiteBundle(css_rules, css_pages, js_chunks, js_pages, minify)
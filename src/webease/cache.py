@@ -0,0 +1,197 @@
+"""
+Webease Cache - Persistent on-disk cache of parsed .ws programs
+"""
+
+import gc
+import hashlib
+import marshal
+import os
+import threading
+import zlib
+from pathlib import Path
+
+from . import __version__
+from . import functions
+from .parser import Program, Call, Literal, ListLiteral, DictLiteral
+
+
+DEFAULT_CACHE_DIR = '.webease_cache'
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+CACHE_FORMAT = 1
+ENTRY_SUFFIX = '.wpc'
+
+CALL, LITERAL, LIST, DICT = range(4)
+
+
+def function_table_signature():
+    """Hash the names of all builtins so new or removed functions invalidate the cache"""
+    # The registry lists every builtin, so this doesn't import the category modules
+    names = sorted(functions.BUILTIN_NAMES)
+    return hashlib.sha256('\n'.join(names).encode('utf-8')).hexdigest()
+
+
+# ==================== SERIALIZATION ====================
+
+def encode_node(node):
+    """Convert an AST node to nested tuples that marshal can store"""
+    if isinstance(node, Literal):
+        return (LITERAL, node.value, node.line, node.column)
+    if isinstance(node, Call):
+        return (CALL, node.name, [encode_node(arg) for arg in node.args],
+                [(key, encode_node(value)) for key, value in node.kwargs],
+                node.line, node.column)
+    if isinstance(node, ListLiteral):
+        return (LIST, [encode_node(item) for item in node.items], node.line, node.column)
+    return (DICT, [(encode_node(key), encode_node(value)) for key, value in node.items],
+            node.line, node.column)
+
+
+def decode_node(data):
+    """Rebuild an AST node from its encoded form"""
+    kind = data[0]
+    if kind == LITERAL:
+        return Literal(data[1], data[2], data[3])
+    if kind == CALL:
+        return Call(data[1], [decode_node(arg) for arg in data[2]],
+                    [(key, decode_node(value)) for key, value in data[3]],
+                    data[4], data[5])
+    if kind == LIST:
+        return ListLiteral([decode_node(item) for item in data[1]], data[2], data[3])
+    return DictLiteral([(decode_node(key), decode_node(value)) for key, value in data[1]],
+                       data[2], data[3])
+
+
+def dumps(program):
+    """Serialize a Program to compressed bytes"""
+    return zlib.compress(marshal.dumps([encode_node(call) for call in program.statements]), 1)
+
+
+def loads(data):
+    """Deserialize a Program from bytes"""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return Program([decode_node(call) for call in marshal.loads(zlib.decompress(data))])
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+# ==================== CACHE ====================
+
+class ParseCache:
+    """Stores parsed programs on disk, keyed by source hash, compiler version and builtins"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_size=DEFAULT_MAX_SIZE):
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._signature = None
+        self._size = None
+
+    def key(self, code):
+        """Compute the cache key for a piece of source code"""
+        if self._signature is None:
+            self._signature = function_table_signature()
+        digest = hashlib.sha256(f'{CACHE_FORMAT}\0{__version__}\0{self._signature}\0'.encode('utf-8'))
+        digest.update(code.encode('utf-8'))
+        return digest.hexdigest()
+
+    def entry_path(self, key):
+        return self.cache_dir / f'{key}{ENTRY_SUFFIX}'
+
+    def load(self, code):
+        """Return the cached Program for this source, or None"""
+        path = self.entry_path(self.key(code))
+        try:
+            with open(path, 'rb') as f:
+                program = loads(f.read())
+        except (OSError, ValueError, EOFError, TypeError, IndexError, zlib.error):
+            self.misses += 1
+            return None
+
+        # Touching the entry keeps least-recently-used eviction accurate
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return program
+
+    def store(self, code, program):
+        """Write a Program to the cache and evict old entries if over the size limit"""
+        data = dumps(program)
+        path = self.entry_path(self.key(code))
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            return
+
+        if self._size is None:
+            self._size = self.total_size()
+        else:
+            self._size += len(data)
+        if self._size > self.max_size:
+            self.evict()
+
+    def entries(self):
+        """List (path, size, mtime) for every cache entry"""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(ENTRY_SUFFIX):
+                        stat = entry.stat()
+                        entries.append((Path(entry.path), stat.st_size, stat.st_mtime))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def total_size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_size"""
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        size = sum(entry[1] for entry in entries)
+        removed = 0
+        for path, entry_size, _ in entries:
+            if size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            size -= entry_size
+            removed += 1
+        self._size = size
+        return removed
+
+    def clear(self):
+        """Delete every cache entry, returning how many were removed"""
+        removed = 0
+        for path, _, _ in self.entries():
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        self._size = 0
+        return removed
+
+    def stats(self):
+        """Summarize the cache contents"""
+        entries = self.entries()
+        return {
+            'directory': str(self.cache_dir),
+            'entries': len(entries),
+            'size': sum(size for _, size, _ in entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
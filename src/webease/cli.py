@@ -3,10 +3,18 @@ Webease CLI - Command-line interface for Webease
 """
 
 import click
-import webbrowser
 import os
 from pathlib import Path
 from .compiler import WebeaseCompiler
+from .cache import ParseCache, DEFAULT_CACHE_DIR
+from .build import atomic_writer, build_site, write_atomic
+from .libraries import registry_for
+from .watch import SiteWatcher, DEFAULT_POLL_INTERVAL
+from .compress import ENCODERS
+from .bundle import DEFAULT_MIN_PAGES
+from . import bench
+from .profiling import CompileProfile, DEFAULT_TOP_LINES
+from .client import DaemonError, send_request, socket_path
 
 
 @click.group(invoke_without_command=True)
@@ -27,27 +35,55 @@ def cli(ctx):
 @click.argument('filename', type=click.Path(exists=True))
 @click.option('--save', is_flag=True, help='Save HTML without opening browser')
 @click.option('--output', '-o', default='output', help='Output directory')
-def compile(filename, save, output):
+@click.option('--legacy-parser', is_flag=True, help='Use the old line-by-line parser')
+@click.option('--no-cache', is_flag=True, help='Do not read or write the parse cache')
+@click.option('--minify', is_flag=True, help='Minify the generated HTML, CSS and JavaScript')
+@click.option('--library-path', '-L', multiple=True, type=click.Path(file_okay=False),
+              help='Extra directory to search for .wl libraries (repeatable)')
+@click.option('--profile', type=click.Choice(['table', 'json']), is_flag=False, flag_value='table', default=None,
+              help='Report time per phase, builtin and line (--profile=json for JSON)')
+@click.option('--profile-top', default=DEFAULT_TOP_LINES, type=click.IntRange(min=0),
+              help='Number of slowest lines to report')
+@click.option('--profile-output', type=click.Path(dir_okay=False), help='Write the profile to a file')
+def compile(filename, save, output, legacy_parser, no_cache, minify, library_path, profile, profile_top,
+            profile_output):
     """Compile a .ws file to HTML"""
-    run_compiler(filename, save, output)
+    run_compiler(filename, save, output, legacy_parser, not no_cache, minify, library_path, profile, profile_top,
+                 profile_output)
 
 
 @click.command()
 @click.argument('filename', type=click.Path(exists=True))
 @click.option('--save', is_flag=True, help='Save HTML without opening browser')
 @click.option('--output', '-o', default='output', help='Output directory')
-def main(filename, save, output):
+@click.option('--legacy-parser', is_flag=True, help='Use the old line-by-line parser')
+@click.option('--no-cache', is_flag=True, help='Do not read or write the parse cache')
+@click.option('--minify', is_flag=True, help='Minify the generated HTML, CSS and JavaScript')
+@click.option('--library-path', '-L', multiple=True, type=click.Path(file_okay=False),
+              help='Extra directory to search for .wl libraries (repeatable)')
+@click.option('--profile', type=click.Choice(['table', 'json']), is_flag=False, flag_value='table', default=None,
+              help='Report time per phase, builtin and line (--profile=json for JSON)')
+@click.option('--profile-top', default=DEFAULT_TOP_LINES, type=click.IntRange(min=0),
+              help='Number of slowest lines to report')
+@click.option('--profile-output', type=click.Path(dir_okay=False), help='Write the profile to a file')
+def main(filename, save, output, legacy_parser, no_cache, minify, library_path, profile, profile_top,
+         profile_output):
     """Main entry point for webease command"""
-    run_compiler(filename, save, output)
+    run_compiler(filename, save, output, legacy_parser, not no_cache, minify, library_path, profile, profile_top,
+                 profile_output)
 
 
-def run_compiler(filename, save, output):
+def run_compiler(filename, save, output, legacy_parser=False, use_cache=True, minify=False, library_path=(),
+                 profile=None, profile_top=DEFAULT_TOP_LINES, profile_output=None):
     """Run the Webease compiler"""
-    compiler = WebeaseCompiler()
+    cache = ParseCache() if use_cache else None
+    compile_profile = CompileProfile() if profile else None
+    compiler = WebeaseCompiler(legacy_parser=legacy_parser, cache=cache, minify=minify,
+                               libraries=registry_for(library_path), profile=compile_profile)
     
     click.echo(f"🔨 Compiling {filename}...")
     
-    html, error = compiler.compile_file(filename)
+    context, error = compiler.compile_context(filename)
     
     if error:
         click.echo(error, err=True)
@@ -60,16 +96,294 @@ def run_compiler(filename, save, output):
     output_filename = input_path.stem + '.html'
     output_path = output_dir / output_filename
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # Written fragment by fragment, so the page never exists as one string
+    try:
+        with atomic_writer(output_path) as f:
+            if compile_profile is None:
+                compiler.generate_html_stream(f)
+            else:
+                compile_profile.render(compiler, f)
+    except Exception as e:
+        click.echo(compiler.format_error(e), err=True)
+        return
     
     click.echo(f"✅ Successfully compiled to {output_path}")
     
+    if minify:
+        click.echo(format_savings(compiler.original_size, compiler.output_size))
+    
     if not save:
         click.echo(f"🚀 Opening in browser...")
+        # Only needed when opening a page, and slow to import
+        import webbrowser
         webbrowser.open(f'file://{output_path.absolute()}')
     else:
         click.echo(f"💾 Saved to {output_path}")
+    
+    if compile_profile is not None:
+        compile_profile.page = str(filename)
+        report = compile_profile.to_json(profile_top) if profile == 'json' else compile_profile.format_table(profile_top)
+        if profile_output:
+            write_atomic(profile_output, report + '\n')
+            click.echo(f"📊 Profile saved to {profile_output}")
+        else:
+            click.echo(report)
+
+
+
+@cli.command()
+@click.argument('directory', type=click.Path(exists=True, file_okay=False))
+@click.option('--output', '-o', default='output', help='Output directory')
+@click.option('--force', is_flag=True, help='Rebuild every page, even if unchanged')
+@click.option('--jobs', '-j', default=1, type=click.IntRange(min=0), help='Worker processes (0 = one per CPU)')
+@click.option('--no-cache', is_flag=True, help='Do not read or write the parse cache')
+@click.option('--minify', is_flag=True, help='Minify the generated HTML, CSS and JavaScript')
+@click.option('--library-path', '-L', multiple=True, type=click.Path(file_okay=False),
+              help='Extra directory to search for .wl libraries (repeatable)')
+@click.option('--precompress', multiple=True, type=click.Choice(list(ENCODERS)),
+              help='Also write a compressed copy of each page, e.g. page.html.gz (repeatable)')
+@click.option('--compress-level', type=click.IntRange(0, 11), default=None,
+              help='Compression level for --precompress (default: each encoding\'s maximum)')
+@click.option('--bundle', is_flag=True, help='Move CSS and JavaScript shared by several pages into site.<hash>.css/js')
+@click.option('--bundle-min-pages', default=DEFAULT_MIN_PAGES, type=click.IntRange(min=2),
+              help='Only bundle code used by at least this many pages')
+def build(directory, output, force, jobs, no_cache, minify, library_path, precompress, compress_level, bundle,
+          bundle_min_pages):
+    """Compile every changed .ws file in a directory"""
+    click.echo(f"🔨 Building {directory}...")
+    result = build_site(directory, output, force=force, jobs=jobs, use_cache=not no_cache, minify=minify,
+                        library_path=library_path, precompress=precompress, compress_level=compress_level,
+                        bundle=bundle, bundle_min_pages=bundle_min_pages)
+    
+    for page in result.built:
+        click.echo(f"  ✅ {page} ({result.timings[page] * 1000:.1f} ms)")
+    for page, error in result.failed:
+        click.echo(f"  ❌ {page}", err=True)
+        click.echo(error, err=True)
+    
+    click.echo(f"📦 Built {len(result.built)}, skipped {len(result.skipped)} unchanged, "
+               f"{len(result.failed)} failed in {result.elapsed:.2f}s "
+               f"({result.pages_per_second:.0f} pages/s)")
+    if minify and result.built:
+        click.echo(format_savings(result.original_size, result.output_size))
+    for name, size in result.encoded_sizes.items():
+        click.echo(format_compression(name, result.uncompressed_size, size))
+    if result.bundle is not None:
+        site_bundle = result.bundle
+        if site_bundle.css is not None:
+            click.echo(f"🎁 {site_bundle.css_name}: {len(site_bundle.css_rules)} shared rule(s), "
+                       f"{len(site_bundle.css.encode('utf-8')):,} bytes, linked from {len(site_bundle.css_pages)} page(s)")
+        if site_bundle.js is not None:
+            click.echo(f"🎁 {site_bundle.js_name}: {len(site_bundle.js_chunks)} shared script(s), "
+                       f"{len(site_bundle.js.encode('utf-8')):,} bytes, linked from {len(site_bundle.js_pages)} page(s)")
+        if site_bundle.css is None and site_bundle.js is None:
+            click.echo("🎁 No CSS or JavaScript is shared by enough pages to bundle")
+
+
+@cli.command()
+@click.argument('directory', type=click.Path(exists=True, file_okay=False))
+@click.option('--output', '-o', default='output', help='Output directory')
+@click.option('--jobs', '-j', default=1, type=click.IntRange(min=0), help='Worker processes for the first build')
+@click.option('--no-cache', is_flag=True, help='Do not read or write the parse cache')
+@click.option('--minify', is_flag=True, help='Minify the generated HTML, CSS and JavaScript')
+@click.option('--library-path', '-L', multiple=True, type=click.Path(file_okay=False),
+              help='Extra directory to search for .wl libraries (repeatable)')
+@click.option('--poll', is_flag=True, help='Poll for changes instead of using inotify')
+@click.option('--interval', default=DEFAULT_POLL_INTERVAL, type=click.FloatRange(min=0.01),
+              help='Seconds between polls')
+@click.option('--precompress', multiple=True, type=click.Choice(list(ENCODERS)),
+              help='Also write a compressed copy of each page, e.g. page.html.gz (repeatable)')
+@click.option('--compress-level', type=click.IntRange(0, 11), default=None,
+              help='Compression level for --precompress (default: each encoding\'s maximum)')
+def watch(directory, output, jobs, no_cache, minify, library_path, poll, interval, precompress, compress_level):
+    """Rebuild pages in a directory whenever their sources change"""
+    site = SiteWatcher(directory, output, use_cache=not no_cache, minify=minify, library_path=library_path,
+                       precompress=precompress, compress_level=compress_level)
+    
+    click.echo(f"🔨 Building {directory}...")
+    result = site.initial_build(jobs=jobs)
+    for page, error in result.failed:
+        click.echo(f"  ❌ {page}", err=True)
+        click.echo(error, err=True)
+    click.echo(f"📦 Built {len(result.built)}, skipped {len(result.skipped)} unchanged, "
+               f"{len(result.failed)} failed in {result.elapsed:.2f}s")
+    click.echo(f"👀 Watching {directory} for changes (Ctrl+C to stop)...")
+    
+    try:
+        for result in site.watch(polling=poll, interval=interval):
+            for page in result.built:
+                click.echo(f"  ✅ {page}")
+            for page, error in result.failed:
+                click.echo(f"  ❌ {page}", err=True)
+                click.echo(error, err=True)
+            for page in result.removed:
+                click.echo(f"  🧹 {page} removed")
+            click.echo(f"⚡ Rebuilt {len(result.built) + len(result.failed)} page(s) in "
+                       f"{result.elapsed * 1000:.1f} ms")
+    except KeyboardInterrupt:
+        click.echo("\n👋 Stopped watching")
+
+
+@cli.command()
+@click.argument('directory', default='output', type=click.Path(exists=True, file_okay=False))
+@click.option('--host', default=None, help='Address to listen on (default: 0.0.0.0)')
+@click.option('--port', '-p', default=None, type=click.IntRange(0, 65535), help='Port to listen on (default: 5000)')
+@click.option('--quiet', '-q', is_flag=True, help='Do not log each request')
+@click.option('--live', is_flag=True, help='Serve .ws pages from DIRECTORY, compiling them on request')
+@click.option('--cache-size', default=64, type=click.IntRange(min=1), help='Rendered-page cache size in MB (--live)')
+@click.option('--no-cache', is_flag=True, help='Do not read or write the parse cache')
+@click.option('--minify', is_flag=True, help='Minify the generated HTML, CSS and JavaScript')
+@click.option('--library-path', '-L', multiple=True, type=click.Path(file_okay=False),
+              help='Extra directory to search for .wl libraries (repeatable)')
+@click.option('--precompress', multiple=True, default=('gzip',), type=click.Choice(list(ENCODERS)),
+              help='Encodings to keep compiled pages in (--live, repeatable)')
+@click.option('--compress-level', type=click.IntRange(0, 11), default=None,
+              help='Compression level for --precompress (default: each encoding\'s maximum)')
+def serve(directory, host, port, quiet, live, cache_size, no_cache, minify, library_path, precompress,
+          compress_level):
+    """Preview compiled pages over HTTP"""
+    # The server pulls in asyncio, so only 'serve' pays for importing it
+    from .server import run_server, DEFAULT_HOST, DEFAULT_PORT
+    from .live import LiveSite
+    
+    host = DEFAULT_HOST if host is None else host
+    port = DEFAULT_PORT if port is None else port
+    live_site = None
+    if live:
+        live_site = LiveSite(directory, cache_size * 1024 * 1024, use_cache=not no_cache, minify=minify,
+                             library_path=library_path, precompress=precompress, compress_level=compress_level)
+    
+    mode = " (compiling .ws pages on request)" if live else ""
+    click.echo(f"🌐 Serving {Path(directory).absolute()} at http://{host}:{port}{mode}")
+    click.echo("   Press Ctrl+C to stop")
+    try:
+        run_server(directory, host, port, log=None if quiet else click.echo, live=live_site)
+    except KeyboardInterrupt:
+        click.echo("\n👋 Server stopped")
+    finally:
+        if live_site is not None:
+            live_site.close()
+
+
+@cli.command(name='bench')
+@click.option('--workload', '-w', multiple=True, type=click.Choice(list(bench.WORKLOADS)),
+              help='Workload to run (repeatable, default: all)')
+@click.option('--size', '-s', multiple=True, type=click.Choice(list(bench.SIZES)),
+              help='Workload size (repeatable, default: small and medium)')
+@click.option('--repeat', '-r', default=bench.DEFAULT_REPEAT, type=click.IntRange(min=1),
+              help='Runs per workload; the fastest time of each phase is kept')
+@click.option('--minify', is_flag=True, help='Minify the generated HTML, CSS and JavaScript')
+@click.option('--output', '-o', default='webease-bench.json', help='JSON file to write the results to')
+@click.option('--compare', type=click.Path(exists=True, dir_okay=False),
+              help='Earlier results file to check for regressions')
+@click.option('--threshold', default=bench.DEFAULT_THRESHOLD, type=click.FloatRange(min=1.0),
+              help='Slowdown factor that counts as a regression')
+def bench_command(workload, size, repeat, minify, output, compare, threshold):
+    """Time the parse, execute, render and write phases on synthetic pages"""
+    click.echo(f"⏱️  Benchmarking ({repeat} run(s) each, best time per phase)")
+    click.echo(bench.format_header())
+    document = bench.run_suite(workload or None, size or bench.DEFAULT_SIZES, repeat, minify,
+                               progress=lambda result: click.echo(bench.format_result(result)))
+    
+    bench.save_results(document, output)
+    click.echo(f"💾 Results saved to {output}")
+    
+    if compare:
+        regressions = bench.compare_results(bench.load_results(compare), document, threshold)
+        if not regressions:
+            click.echo(f"✅ No phase more than {threshold:g}x slower than {compare}")
+            return
+        for name, workload_size, phase, before, after in regressions:
+            click.echo(f"  ❌ {name}/{workload_size} {phase}: {before:.2f} → {after:.2f} ms "
+                       f"({after / before:.2f}x)", err=True)
+        raise SystemExit(1)
+
+
+def format_savings(original_size, output_size):
+    """Describe how many bytes minification saved"""
+    saved = original_size - output_size
+    percent = saved / original_size * 100 if original_size else 0
+    return f"🗜️  Minified {original_size:,} → {output_size:,} bytes (saved {saved:,} bytes, {percent:.1f}%)"
+
+
+def format_compression(encoding, original_size, compressed_size):
+    """Describe how much a precompressed encoding saves"""
+    percent = (1 - compressed_size / original_size) * 100 if original_size else 0
+    return f"📦 {encoding}: {original_size:,} → {compressed_size:,} bytes ({percent:.1f}% smaller)"
+
+
+@cli.group(name='cache')
+def cache_group():
+    """Manage the parse cache"""
+
+
+@cache_group.command(name='clear')
+@click.option('--cache-dir', default=DEFAULT_CACHE_DIR, help='Cache directory')
+def cache_clear(cache_dir):
+    """Delete all cached parses"""
+    removed = ParseCache(cache_dir).clear()
+    click.echo(f"🧹 Removed {removed} cached parse(s) from {cache_dir}")
+
+
+@cache_group.command(name='stats')
+@click.option('--cache-dir', default=DEFAULT_CACHE_DIR, help='Cache directory')
+def cache_stats(cache_dir):
+    """Show parse cache statistics"""
+    stats = ParseCache(cache_dir).stats()
+    click.echo(f"📁 Directory: {stats['directory']}")
+    click.echo(f"📦 Entries:   {stats['entries']}")
+    click.echo(f"💾 Size:      {stats['size'] / 1024:.1f} KB of {stats['max_size'] / (1024 * 1024):.0f} MB")
+
+
+
+@cli.group(name='daemon')
+def daemon_group():
+    """Keep a warm compiler running so compiles skip interpreter startup"""
+
+
+@daemon_group.command(name='start')
+@click.option('--socket', 'path', default=None,
+              help='Socket to listen on (default: $WEBEASE_SOCKET or .webease_cache/daemon.sock)')
+@click.option('--quiet', '-q', is_flag=True, help='Do not log each compile')
+def daemon_start(path, quiet):
+    """Serve compile requests on a Unix socket until stopped"""
+    # Only the daemon itself needs asyncio and the server side of the protocol
+    from .daemon import run_daemon
+    
+    click.echo(f"🔥 Webease daemon listening on {socket_path(path)} (Ctrl+C or 'webease daemon stop' to stop)")
+    try:
+        run_daemon(path, log=None if quiet else click.echo)
+    except DaemonError as e:
+        click.echo(f"❌ {e}", err=True)
+        raise SystemExit(1)
+    click.echo("👋 Daemon stopped")
+
+
+@daemon_group.command(name='stop')
+@click.option('--socket', 'path', default=None, help='Socket of the daemon to stop')
+def daemon_stop(path):
+    """Stop a running daemon"""
+    try:
+        send_request({'command': 'shutdown'}, path)
+    except DaemonError as e:
+        click.echo(f"❌ {e}", err=True)
+        raise SystemExit(1)
+    click.echo(f"👋 Stopped the daemon at {socket_path(path)}")
+
+
+@daemon_group.command(name='status')
+@click.option('--socket', 'path', default=None, help='Socket of the daemon to query')
+def daemon_status(path):
+    """Show whether a daemon is running and what it has compiled"""
+    try:
+        status = send_request({'command': 'status'}, path)
+    except DaemonError as e:
+        click.echo(f"💤 {e}")
+        raise SystemExit(1)
+    click.echo(f"🔥 Daemon {status['version']} (pid {status['pid']}) on {status['socket']}, "
+               f"up {status['uptime']:.0f}s")
+    click.echo(f"📦 Compiles:  {status['compiles']} ({status['failures']} failed)")
+    click.echo(f"🧰 Compilers: {status['compilers']}, libraries cached: {status['libraries']}")
 
 
 if __name__ == '__main__':
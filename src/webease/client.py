@@ -0,0 +1,139 @@
+"""
+Webease Client - Forwards compile commands to a running 'webease daemon'
+
+This module is imported before anything else by webease.py, so it only
+uses the standard library: a forwarded compile costs a socket round trip
+instead of importing click and the compiler.
+"""
+
+import json
+import os
+import socket
+import sys
+
+
+# Inside the parse cache directory (cache.DEFAULT_CACHE_DIR), which isn't imported here to keep the client light
+DEFAULT_SOCKET = os.path.join('.webease_cache', 'daemon.sock')
+SOCKET_ENV = 'WEBEASE_SOCKET'
+NO_DAEMON_ENV = 'WEBEASE_NO_DAEMON'
+CONNECT_TIMEOUT = 0.5
+
+
+class DaemonError(Exception):
+    """The daemon can't be reached, sent back something that isn't a response or is already running"""
+
+
+def socket_path(path=None):
+    """The daemon socket: path, then $WEBEASE_SOCKET, then .webease_cache/daemon.sock"""
+    return path or os.environ.get(SOCKET_ENV) or DEFAULT_SOCKET
+
+
+def send_request(request, path=None, timeout=None):
+    """Send one JSON request and return the daemon's JSON response
+
+    The protocol is one JSON object per line in each direction, and a
+    connection may carry any number of requests.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(socket_path(path))
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        with sock.makefile('rb') as f:
+            line = f.readline()
+    except OSError as e:
+        raise DaemonError(f"No Webease daemon at {socket_path(path)} ({e.strerror or e})") from None
+    finally:
+        sock.close()
+    if not line:
+        raise DaemonError("The Webease daemon closed the connection")
+    try:
+        return json.loads(line)
+    except ValueError:
+        raise DaemonError("The Webease daemon sent an invalid response") from None
+
+
+def compile_request(argv):
+    """Turn 'page.ws [options]' or 'compile page.ws [options]' into a compile request
+
+    Returns None for anything the daemon doesn't handle (--profile,
+    --legacy-parser, --help, a missing file, ...), which is then left to
+    the full CLI.
+    """
+    args = list(argv)
+    if args and args[0] == 'compile':
+        args = args[1:]
+    filename = None
+    request = {'command': 'compile', 'output': 'output', 'save': False, 'minify': False, 'cache': True,
+               'library_path': []}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--save':
+            request['save'] = True
+        elif arg == '--minify':
+            request['minify'] = True
+        elif arg == '--no-cache':
+            request['cache'] = False
+        elif arg in ('--output', '-o', '--library-path', '-L') and i + 1 < len(args):
+            i += 1
+            if arg in ('--output', '-o'):
+                request['output'] = args[i]
+            else:
+                request['library_path'].append(args[i])
+        elif not arg.startswith('-') and filename is None:
+            filename = arg
+        else:
+            return None
+        i += 1
+
+    if filename is None or not os.path.exists(filename):
+        return None
+    request['file'] = filename
+    request['cwd'] = os.getcwd()
+    return request
+
+
+def format_savings(original_size, output_size):
+    """Same wording as cli.format_savings"""
+    saved = original_size - output_size
+    percent = saved / original_size * 100 if original_size else 0
+    return f"🗜️  Minified {original_size:,} → {output_size:,} bytes (saved {saved:,} bytes, {percent:.1f}%)"
+
+
+def forward(argv):
+    """Run a compile command through the daemon and return an exit status
+
+    Returns None if the command isn't a plain compile, no daemon is
+    running or $WEBEASE_NO_DAEMON is set, so the caller runs it itself.
+    """
+    if os.environ.get(NO_DAEMON_ENV):
+        return None
+    request = compile_request(argv)
+    if request is None or not os.path.exists(socket_path()):
+        return None
+    filename = request['file']
+    try:
+        response = send_request(request)
+    except DaemonError:
+        return None
+
+    print(f"🔨 Compiling {filename}...")
+    if not response.get('ok'):
+        print(response.get('error', 'Unknown daemon error'), file=sys.stderr)
+        # Like the CLI, a page with errors is reported but isn't a failed command
+        return 0
+
+    output_path = response['output']
+    print(f"✅ Successfully compiled to {output_path}")
+    if request['minify']:
+        print(format_savings(response['original_size'], response['output_size']))
+    if not request['save']:
+        print("🚀 Opening in browser...")
+        # Only needed when opening a page, and slow to import
+        import webbrowser
+        webbrowser.open(f'file://{os.path.abspath(output_path)}')
+    else:
+        print(f"💾 Saved to {output_path}")
+    return 0
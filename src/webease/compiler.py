@@ -2,34 +2,187 @@
 Webease Compiler - Compiles .ws files to HTML
 """
 
+import io
 import re
 import os
-from pathlib import Path
+import time
 from . import functions
+from . import parser
+from .libraries import default_registry
+from .minify import HTMLMinifier, minify_css, minify_js
+from .program import CompiledProgram
+
+
+BASE_CSS = """* {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+            line-height: 1.6;
+            color: #333;
+        }"""
+
+DEFAULT_HEAD = '<title>Webease Page</title>'
+
+
+def joined(parts, separator='\n'):
+    """Yield parts with separator between them, like separator.join(parts) without the copy"""
+    parts = iter(parts)
+    for part in parts:
+        yield part
+        break
+    for part in parts:
+        yield separator
+        yield part
+
+
+def joined_size(parts):
+    """UTF-8 size of parts joined with newlines, without joining them"""
+    sizes = [len(part.encode('utf-8')) for part in parts]
+    return sum(sizes) + max(len(sizes) - 1, 0)
 
 
 class WebeaseCompiler:
-    def __init__(self):
+    def __init__(self, legacy_parser=False, cache=None, minify=False, libraries=None, profile=None, work_dir=None):
         self.context = None
-        self.libraries = {}
+        self.profile = profile
+        # Where relative data paths that aren't next to the page are looked up (None: os.getcwd())
+        self.work_dir = work_dir
+        self.libraries = libraries or default_registry
+        self.legacy_parser = legacy_parser
+        self.cache = cache
+        self.minify = minify
+        self.dependencies = []
+        self.original_size = None
+        self.output_size = None
         
     def compile_file(self, ws_file_path):
         """Compile a .ws file to HTML"""
-        functions.reset_context()
-        self.context = functions.get_context()
+        context, error = self.compile_context(ws_file_path)
+        if error:
+            return None, error
+        
+        try:
+            html = self.generate_html()
+            return html, None
+        except Exception as e:
+            return None, self.format_error(e)
+    
+    def compile_context(self, ws_file_path):
+        """Run a .ws file and return its filled-in context, without rendering the page"""
+        self.context = functions.WebeaseContext() if self.profile is None else self.profile.new_context()
+        self.context.base_dir = os.path.dirname(ws_file_path)
+        self.context.work_dir = self.work_dir
+        self.dependencies = []
         
         with open(ws_file_path, 'r', encoding='utf-8') as f:
             ws_code = f.read()
         
         try:
-            self.execute_webease_code(ws_code)
-            html = self.generate_html()
-            return html, None
+            with functions.use_context(self.context):
+                self.execute_webease_code(ws_code)
+            self.add_data_dependencies()
+            return self.context, None
+        except Exception as e:
+            return None, self.format_error(e)
+    
+    def compile_program(self, code):
+        """Compile Webease code into a CompiledProgram that can be run many times"""
+        return CompiledProgram.from_program(self.parse(code))
+    
+    def run_program(self, program, bindings=None, base_dir=None):
+        """Run a CompiledProgram in a fresh context and return (context, error)
+        
+        bindings supplies the values of binding("name") in the page.
+        """
+        self.context = functions.WebeaseContext()
+        self.context.base_dir = base_dir
+        self.context.work_dir = self.work_dir
+        self.context.bindings = bindings if bindings is not None else {}
+        self.dependencies = []
+        
+        try:
+            with functions.use_context(self.context):
+                program.run(self)
+            self.add_data_dependencies()
+            return self.context, None
         except Exception as e:
             return None, self.format_error(e)
     
+    def render_program(self, program, bindings=None, base_dir=None):
+        """Run a CompiledProgram and return (html, error), like compile_file"""
+        context, error = self.run_program(program, bindings, base_dir)
+        if error:
+            return None, error
+        
+        try:
+            return self.generate_html(), None
+        except Exception as e:
+            return None, self.format_error(e)
+    
+    def add_data_dependencies(self):
+        self.dependencies.extend(path for path in dict.fromkeys(self.context.data_files)
+                                 if path not in self.dependencies)
+    
     def execute_webease_code(self, code):
         """Execute Webease code"""
+        if self.profile is not None:
+            self.profile.execute(self, code)
+        elif self.legacy_parser:
+            self.execute_lines(code)
+        else:
+            self.execute_program(self.parse(code))
+    
+    def parse(self, code):
+        """Parse Webease code, reusing a cached parse when one is available"""
+        if self.cache is None:
+            return parser.parse(code)
+        
+        program = self.cache.load(code)
+        if program is None:
+            program = parser.parse(code)
+            self.cache.store(code, program)
+        return program
+    
+    def execute_program(self, program):
+        """Execute a parsed Webease program"""
+        for call in program.statements:
+            try:
+                self.execute_call(call)
+            except Exception as e:
+                raise SyntaxError(f"Error on line {call.line}: {str(e)}")
+    
+    def execute_call(self, call):
+        """Execute a single call node"""
+        args, kwargs = call.evaluate_arguments(self.call_value)
+        self.dispatch(call.name, args, kwargs)
+    
+    def dispatch(self, func_name, args, kwargs):
+        """Run a builtin or component with already evaluated arguments"""
+        if func_name == 'import_library' and args:
+            self.load_library(args[0])
+        
+        func = functions.builtin(func_name)
+        if func is not None:
+            func(*args, **kwargs)
+        elif func_name in self.context.custom_functions:
+            functions.use_component(func_name, **kwargs)
+        else:
+            raise NameError(f"Function '{func_name}' is not defined")
+    
+    def call_value(self, call):
+        """Evaluate a call nested in another call's arguments, such as load_data("rows.csv")"""
+        if call.name not in functions.VALUE_FUNCTIONS:
+            if call.name in functions.BUILTIN_NAMES or call.name in self.context.custom_functions:
+                raise SyntaxError(f"'{call.name}' doesn't return a value, so it can't be used as an argument")
+            raise NameError(f"Function '{call.name}' is not defined")
+        args, kwargs = call.evaluate_arguments(self.call_value)
+        return functions.builtin(call.name)(*args, **kwargs)
+    
+    def execute_lines(self, code):
+        """Execute Webease code line by line (legacy parser)"""
         lines = code.split('\n')
         
         for line_num, line in enumerate(lines, 1):
@@ -50,8 +203,8 @@ class WebeaseCompiler:
                     func_name = func_match.group(1)
                     args_str = func_match.group(2)
                     
-                    if hasattr(functions, func_name):
-                        func = getattr(functions, func_name)
+                    func = functions.builtin(func_name)
+                    if func is not None:
                         args, kwargs = self.parse_arguments(args_str)
                         func(*args, **kwargs)
                     elif func_name in self.context.custom_functions:
@@ -130,6 +283,12 @@ class WebeaseCompiler:
         """Parse a value from string to Python type"""
         value = value.strip()
         
+        if value.startswith(('[', '{')):
+            # Decode JSON-compatible lists and dicts whole instead of re-splitting every level
+            literal = parser.json_literal(value, 0)
+            if literal is not None and literal[1] == len(value):
+                return literal[0]
+        
         if value.startswith('"') and value.endswith('"'):
             return value[1:-1]
         elif value.startswith("'") and value.endswith("'"):
@@ -224,84 +383,137 @@ class WebeaseCompiler:
     
     def load_library(self, library_name):
         """Load a .wl library file"""
-        library_path = Path(f'libraries/{library_name}.wl')
+        start = time.perf_counter()
+        library_path, components = self.libraries.load(library_name)
+        self.dependencies.append(library_path)
+        self.context.custom_functions.update(components)
+        if self.profile is not None:
+            self.profile.add_phase('load_library', time.perf_counter() - start)
+    
+    def generate_html(self, assets=None):
+        """Generate final HTML output
         
-        if not library_path.exists():
-            library_path = Path(f'{library_name}.wl')
+        assets, when given, names the shared site stylesheet and script the
+        page links to and the rules and scripts they already contain.
+        """
+        return ''.join(self.iter_html(assets))
+    
+    def generate_html_stream(self, fp, assets=None):
+        """Write the page to a text or binary file object one fragment at a time
         
-        if not library_path.exists():
-            raise FileNotFoundError(f"Library '{library_name}' not found")
+        Nothing larger than a single fragment (one html_parts entry, CSS rule
+        or script) is held besides the context itself.
+        """
+        pieces = self.iter_html(assets)
+        if isinstance(fp, io.TextIOBase):
+            fp.writelines(pieces)
+        else:
+            fp.writelines(piece.encode('utf-8') for piece in pieces)
+    
+    def iter_html(self, assets=None):
+        """Yield the final HTML in document order"""
+        if self.minify:
+            return self.iter_minified_html(assets)
         
-        with open(library_path, 'r', encoding='utf-8') as f:
-            library_code = f.read()
+        css_rules, js_code, base_css = self.page_assets(assets)
+        head_parts = self.context.head_parts if self.context.head_parts else (DEFAULT_HEAD,)
+        return self.iter_page(head_parts, css_rules, self.context.html_parts, js_code, base_css, assets)
+    
+    def page_assets(self, assets):
+        """The CSS rules, JS chunks and base CSS left inline once shared assets are linked"""
+        context = self.context
+        if assets is None:
+            return context.css_rules, context.js_code, BASE_CSS
         
-        lines = library_code.split('\n')
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            if line.startswith('component '):
-                comp_match = re.match(r'component\s+(\w+)\s*\{', line)
-                if comp_match:
-                    comp_name = comp_match.group(1)
-                    comp_code = []
-                    i += 1
-                    brace_count = 1
-                    
-                    while i < len(lines) and brace_count > 0:
-                        current_line = lines[i]
-                        
-                        for char in current_line:
-                            if char == '{':
-                                brace_count += 1
-                            elif char == '}':
-                                brace_count -= 1
-                        
-                        if brace_count > 0:
-                            comp_code.append(current_line)
-                        elif brace_count == 0 and not current_line.strip() == '}':
-                            comp_code.append(current_line.rstrip('}'))
-                        
-                        i += 1
-                    
-                    self.context.custom_functions[comp_name] = '\n'.join(comp_code).strip()
-            i += 1
+        css_rules = context.css_rules
+        base_css = BASE_CSS
+        if assets.css_href:
+            css_rules = [rule for rule in css_rules if rule not in assets.css_rules]
+            base_css = '' if BASE_CSS in assets.css_rules else BASE_CSS
+        
+        js_code = context.js_code
+        if assets.js_href:
+            # Each shared chunk runs once from the site script, so drop one inline copy of it
+            js_code = list(js_code)
+            for chunk in assets.js_chunks:
+                js_code.remove(chunk)
+        return css_rules, js_code, base_css
+    
+    def render_page(self, head_parts, css, html_content, js, base_css=BASE_CSS, assets=None):
+        """Fill the page template"""
+        return ''.join(self.iter_page((head_parts,), (css,), (html_content,), (js,), base_css, assets))
+    
+    def iter_page(self, head_parts, css_rules, html_parts, js_code, base_css=BASE_CSS, assets=None):
+        """Yield the page template filled with each list of fragments joined by newlines"""
+        yield ('<!DOCTYPE html>\n<html lang="en">\n<head>\n    <meta charset="UTF-8">\n'
+               '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n    ')
+        yield from joined(head_parts)
+        if assets is not None and assets.css_href:
+            yield f'\n    <link rel="stylesheet" href="{assets.css_href}">'
+        yield '\n    <style>\n        '
+        yield base_css
+        yield '\n        '
+        yield from joined(css_rules)
+        yield '\n    </style>\n</head>\n<body>\n    '
+        yield from joined(html_parts)
+        if assets is not None and assets.js_href:
+            yield f'\n    <script src="{assets.js_href}"></script>'
+        yield '\n    <script>\n        '
+        yield from joined(js_code)
+        yield '\n    </script>\n</body>\n</html>'
     
-    def generate_html(self):
-        """Generate final HTML output"""
-        css = '\n'.join(self.context.css_rules)
-        js = '\n'.join(self.context.js_code)
-        html_content = '\n'.join(self.context.html_parts)
-        head_parts = '\n'.join(self.context.head_parts)
+    def generate_minified_html(self, assets=None):
+        """Generate compact HTML output"""
+        return ''.join(self.iter_minified_html(assets))
+    
+    def iter_minified_html(self, assets=None):
+        """Yield compact HTML, minifying one fragment at a time
         
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    {head_parts if head_parts else '<title>Webease Page</title>'}
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            line-height: 1.6;
-            color: #333;
-        }}
-        {css}
-    </style>
-</head>
-<body>
-    {html_content}
-    <script>
-        {js}
-    </script>
-</body>
-</html>"""
-        return html
+        original_size and output_size are set once the last fragment is out.
+        """
+        output_size = 0
+        for piece in self.minified_pieces(assets):
+            output_size += len(piece) if piece.isascii() else len(piece.encode('utf-8'))
+            yield piece
+        
+        self.original_size = self.unminified_size()
+        self.output_size = output_size
+    
+    def minified_pieces(self, assets):
+        context = self.context
+        css_rules, js_code, base_css = self.page_assets(assets)
+        
+        head_minifier = HTMLMinifier()
+        head_parts = ''.join(head_minifier.feed(part) for part in context.head_parts) or DEFAULT_HEAD
+        if assets is not None and assets.css_href:
+            head_parts += f'<link rel="stylesheet" href="{assets.css_href}">'
+        
+        yield ('<!DOCTYPE html><html lang="en"><head><meta charset="UTF-8">'
+               '<meta name="viewport" content="width=device-width, initial-scale=1.0">'
+               f'{head_parts}<style>{minify_css(base_css)}')
+        for rule in css_rules:
+            yield minify_css(rule)
+        yield '</style></head><body>'
+        
+        body_minifier = HTMLMinifier()
+        for index, part in enumerate(context.html_parts):
+            if index:
+                yield body_minifier.feed('\n')
+            yield body_minifier.feed(part)
+        
+        if assets is not None and assets.js_href:
+            yield f'<script src="{assets.js_href}"></script>'
+        yield '<script>'
+        yield from joined(filter(None, map(minify_js, js_code)))
+        yield '</script></body></html>'
+    
+    def unminified_size(self):
+        """Size in bytes the page would have without minification"""
+        context = self.context
+        template_size = len(self.render_page('', '', '', '').encode('utf-8'))
+        head_size = joined_size(context.head_parts) or len(DEFAULT_HEAD)
+        return (template_size + head_size + joined_size(context.css_rules)
+                + joined_size(context.js_code) + joined_size(context.html_parts))
     
     def format_error(self, error):
         """Format error message for beginners"""
@@ -0,0 +1,80 @@
+"""
+Webease Components - Precompiled templates for .wl library components
+"""
+
+import re
+
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+# {{word with no }} before the next {{ or the end of the body; {{a:1}} in a script is left alone
+UNCLOSED_PATTERN = re.compile(r'\{\{\s*(\w+)(?:(?!\{\{|\}\}).)*(?=\{\{|\Z)', re.S)
+
+
+class ComponentTemplate:
+    """A component body split once into literal text and placeholder slots
+
+    Rendering fills the slots and joins the pieces in a single pass instead
+    of running one str.replace over the whole template per argument.
+    """
+
+    def __init__(self, name, source):
+        self.name = name
+        self.source = source
+
+        unclosed = UNCLOSED_PATTERN.search(source)
+        if unclosed:
+            raise SyntaxError(f"Component '{name}' has an unclosed placeholder '{{{{{unclosed.group(1)}'")
+
+        # re.split with one group alternates literal text and placeholder names
+        self.segments = PLACEHOLDER_PATTERN.split(source)
+        self.slots = [(index, self.segments[index]) for index in range(1, len(self.segments), 2)]
+        self.placeholders = tuple(dict.fromkeys(key for _, key in self.slots))
+
+    def check_arguments(self, values):
+        """Raise TypeError for missing or unexpected placeholder values"""
+        missing = [key for key in self.placeholders if key not in values]
+        if missing:
+            raise TypeError(f"Component '{self.name}' is missing a value for {', '.join(missing)}")
+        if len(values) > len(self.placeholders):
+            unknown = [key for key in values if key not in self.placeholders]
+            raise TypeError(f"Component '{self.name}' has no placeholder named {', '.join(unknown)}")
+
+    def render(self, values):
+        """Fill in the placeholders with the given values"""
+        if len(values) != len(self.placeholders):
+            self.check_arguments(values)
+
+        parts = self.segments.copy()
+        try:
+            for index, key in self.slots:
+                parts[index] = str(values[key])
+        except KeyError:
+            self.check_arguments(values)
+            raise
+        return ''.join(parts)
+
+    def row_values(self, row):
+        """Placeholder values for one row: a dict, a list in placeholder order or a single value"""
+        if isinstance(row, dict):
+            return row
+        if isinstance(row, (list, tuple)):
+            if len(row) != len(self.placeholders):
+                raise TypeError(f"Component '{self.name}' takes {len(self.placeholders)} value(s) "
+                                f"({', '.join(self.placeholders)}), got {len(row)}")
+            return dict(zip(self.placeholders, row))
+        if len(self.placeholders) != 1:
+            raise TypeError(f"Component '{self.name}' needs a dict or list of values per row, got {row!r}")
+        return {self.placeholders[0]: row}
+
+    def render_rows(self, rows):
+        """Render the template once per row, joined the way separate use_component calls would be"""
+        rendered = []
+        for number, row in enumerate(rows, 1):
+            try:
+                rendered.append(self.render(self.row_values(row)))
+            except TypeError as e:
+                raise TypeError(f"Row {number}: {e}") from None
+        return '\n'.join(rendered)
+
+    def __repr__(self):
+        return f'ComponentTemplate({self.name!r}, placeholders={self.placeholders!r})'
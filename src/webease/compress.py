@@ -0,0 +1,141 @@
+"""
+Webease Compress - Precompressed variants of generated pages
+"""
+
+import zlib
+
+
+class Encoder:
+    """A content encoding: its HTTP name, file suffix and compressor factory"""
+
+    __slots__ = ('name', 'suffix', 'compressobj', 'default_level', 'max_level')
+
+    def __init__(self, name, suffix, compressobj, default_level, max_level):
+        self.name = name
+        self.suffix = suffix
+        self.compressobj = compressobj
+        self.default_level = default_level
+        self.max_level = max_level
+
+    def level(self, level=None):
+        return self.default_level if level is None else min(level, self.max_level)
+
+
+ENCODERS = {}
+
+
+def register_encoder(name, suffix, compressobj, default_level, max_level):
+    """Add a content encoding
+
+    compressobj(level) returns an incremental compressor with zlib's
+    compress(data) and flush() methods, so pages are compressed a chunk
+    at a time as they are written. name is the token used in
+    Accept-Encoding / Content-Encoding, suffix is appended to the output
+    file name (page.html -> page.html.gz). Requested levels above
+    max_level are clamped to it.
+    """
+    ENCODERS[name] = Encoder(name, suffix, compressobj, default_level, max_level)
+
+
+def gzip_compressobj(level):
+    # wbits=31 writes a gzip header with mtime 0, so the output is identical
+    # across builds of the same page (and to gzip.compress(data, mtime=0))
+    return zlib.compressobj(level, zlib.DEFLATED, 31)
+
+
+register_encoder('gzip', '.gz', gzip_compressobj, 9, 9)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class BrotliCompressor:
+    """brotli.Compressor with zlib's compress/flush method names"""
+
+    def __init__(self, level):
+        self.compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data):
+        return self.compressor.process(data)
+
+    def flush(self):
+        return self.compressor.finish()
+
+
+if brotli is not None:
+    register_encoder('br', '.br', BrotliCompressor, 11, 11)
+
+
+def get_encoder(name):
+    try:
+        return ENCODERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown encoding '{name}' (available: {', '.join(ENCODERS)})") from None
+
+
+def write_variants(chunks, fp, variants, level=None):
+    """Write chunks of bytes to fp and, compressed, to each file in {encoding: file}
+
+    Every encoding is fed the same chunk as it is written, so the page is
+    never held whole. Returns the number of bytes written to fp.
+    """
+    compressors = []
+    for name, variant in variants.items():
+        encoder = get_encoder(name)
+        compressors.append((encoder.compressobj(encoder.level(level)), variant))
+    size = 0
+    for data in chunks:
+        fp.write(data)
+        size += len(data)
+        for compressor, variant in compressors:
+            variant.write(compressor.compress(data))
+    for compressor, variant in compressors:
+        variant.write(compressor.flush())
+    return size
+
+
+# ==================== NEGOTIATION ====================
+
+def parse_accept_encoding(header):
+    """Parse an Accept-Encoding header into {coding: q}"""
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def choose_encoding(header, sizes):
+    """Pick the best encoding from {encoding: size} for an Accept-Encoding header
+
+    The client's q-values decide first and the smaller variant breaks ties.
+    Returns None when the identity encoding should be sent.
+    """
+    if not header or not sizes:
+        return None
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get('*', 0.0)
+
+    best = None
+    best_rank = None
+    for name, size in sizes.items():
+        q = accepted.get(name, wildcard)
+        if q <= 0:
+            continue
+        rank = (q, -size)
+        if best_rank is None or rank > best_rank:
+            best, best_rank = name, rank
+    return best
@@ -0,0 +1,123 @@
+"""
+Webease CSS - Ordered, de-duplicated storage for a page's CSS rules
+"""
+
+import re
+
+
+QUOTED_PATTERN = re.compile(r'"[^"]*"|\'[^\']*\'')
+
+
+def split_rules(css):
+    """Split a block of CSS into its top-level rules
+
+    Returns None when the text can't be split safely (comments, braces
+    inside strings, unbalanced braces or stray declarations), in which
+    case the caller keeps the block as a single rule.
+    """
+    if '/*' in css:
+        return None
+    for quoted in QUOTED_PATTERN.findall(css):
+        if '{' in quoted or '}' in quoted:
+            return None
+
+    rules = []
+    pos = 0
+    length = len(css)
+    while True:
+        open_brace = css.find('{', pos)
+        if open_brace == -1:
+            break
+        depth = 1
+        scan = open_brace + 1
+        while depth:
+            next_open = css.find('{', scan)
+            next_close = css.find('}', scan)
+            if next_close == -1:
+                return None
+            if next_open != -1 and next_open < next_close:
+                depth += 1
+                scan = next_open + 1
+            else:
+                depth -= 1
+                scan = next_close + 1
+        rules.append(css[pos:scan].strip())
+        pos = scan
+
+    if css[pos:length].strip():
+        return None
+    return rules
+
+
+def rule_parts(rule):
+    """Return (selector, declarations) for a plain style rule, or None"""
+    if rule.startswith('@'):
+        return None
+    open_brace = rule.find('{')
+    if open_brace == -1 or rule.find('{', open_brace + 1) != -1:
+        return None
+    declarations = rule[open_brace + 1:-1].strip()
+    if declarations and not declarations.endswith(';'):
+        declarations += ';'
+    return rule[:open_brace].strip(), declarations
+
+
+def merge_adjacent(rules):
+    """Merge consecutive rules that share a selector, keeping declaration order"""
+    merged = []
+    last_selector = None
+    last_declarations = None
+
+    for rule in rules:
+        parts = rule_parts(rule)
+        if parts is not None and parts[0] == last_selector:
+            if parts[1]:
+                last_declarations = f'{last_declarations} {parts[1]}' if last_declarations else parts[1]
+            merged[-1] = f'{last_selector} {{ {last_declarations} }}'
+            continue
+
+        merged.append(rule)
+        if parts is None:
+            last_selector = last_declarations = None
+        else:
+            last_selector, last_declarations = parts
+
+    return merged
+
+
+class CSSStore:
+    """Keeps CSS rules in cascade order with duplicates removed
+
+    Re-adding a rule moves it to the end instead of appending a second copy.
+    An identical rule later in the sheet always wins over an earlier copy,
+    so dropping the earlier one never changes which declarations apply.
+    """
+
+    def __init__(self):
+        self._rules = {}
+        self._split_cache = {}
+
+    def append(self, css):
+        rules = self._split_cache.get(css)
+        if rules is None:
+            rules = split_rules(css) or [css.strip()]
+            self._split_cache[css] = rules
+
+        store = self._rules
+        for rule in rules:
+            if rule in store:
+                del store[rule]
+            store[rule] = None
+
+    def rules(self):
+        """The final, merged list of rules"""
+        return merge_adjacent(self._rules)
+
+    def __iter__(self):
+        return iter(self.rules())
+
+    def __len__(self):
+        return len(self._rules)
+
+    def __bool__(self):
+        return bool(self._rules)
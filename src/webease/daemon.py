@@ -0,0 +1,216 @@
+"""
+Webease Daemon - A resident compiler serving 'webease daemon' requests on a Unix socket
+
+Requests and responses are JSON objects, one per line:
+
+    {"command": "compile", "file": "page.ws", "cwd": "/site", "output": "output", "minify": false}
+    {"ok": true, "output": "output/page.html", "path": "/site/output/page.html", "ms": 1.9, ...}
+
+Other commands are "status" and "shutdown". Errors come back as
+{"ok": false, "error": "..."} with the compiler's formatted message.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import time
+from pathlib import Path
+
+from . import __version__
+from . import functions
+from .build import atomic_writer
+from .cache import ParseCache, DEFAULT_CACHE_DIR
+from .client import DaemonError, send_request, socket_path
+from .compiler import WebeaseCompiler
+from .libraries import LibraryRegistry, default_search_path
+
+
+MAX_REQUEST_SIZE = 1024 * 1024
+
+
+class CompileDaemon:
+    """Keeps compilers, parse caches and library registries warm between requests
+
+    There is one compiler per working directory and set of options, so
+    relative paths, libraries/ and .webease_cache/ resolve exactly as they
+    would for 'webease compile' run in the client's directory. Requests
+    run one at a time on the event loop; a small page takes a few ms.
+    """
+
+    def __init__(self, path=None, log=None):
+        self.path = socket_path(path)
+        self.log = log
+        self.compilers = {}
+        self.registries = {}
+        self.started = time.time()
+        self.compiles = 0
+        self.failures = 0
+        self.server = None
+        self.stopping = None
+        self.connections = {}
+
+    def warm(self):
+        """Import every builtin category up front, so no request pays for it"""
+        for name in functions.BUILTIN_NAMES:
+            functions.builtin(name)
+
+    def compiler_for(self, cwd, minify, use_cache, library_path):
+        key = (cwd, minify, use_cache, library_path)
+        compiler = self.compilers.get(key)
+        if compiler is None:
+            search_path = tuple(os.path.join(cwd, directory) for directory in library_path + default_search_path())
+            libraries = self.registries.get(search_path)
+            if libraries is None:
+                libraries = self.registries[search_path] = LibraryRegistry(search_path)
+            cache = ParseCache(os.path.join(cwd, DEFAULT_CACHE_DIR)) if use_cache else None
+            compiler = self.compilers[key] = WebeaseCompiler(cache=cache, minify=minify, libraries=libraries,
+                                                             work_dir=cwd)
+        return compiler
+
+    # ---- commands ----
+
+    def compile(self, request):
+        """Compile a page like 'webease compile', writing it to the output directory"""
+        cwd = request.get('cwd') or os.getcwd()
+        filename = request['file']
+        output = request.get('output', 'output')
+        compiler = self.compiler_for(cwd, bool(request.get('minify')), request.get('cache', True),
+                                     tuple(request.get('library_path', ())))
+
+        start = time.perf_counter()
+        page = os.path.join(cwd, filename)
+        context, error = compiler.compile_context(page)
+        if not error:
+            output_dir = Path(cwd, output)
+            output_dir.mkdir(exist_ok=True)
+            output_path = output_dir / (Path(filename).stem + '.html')
+            try:
+                with atomic_writer(output_path) as f:
+                    compiler.generate_html_stream(f)
+            except Exception as e:
+                error = compiler.format_error(e)
+        elapsed = time.perf_counter() - start
+
+        self.compiles += 1
+        if error:
+            self.failures += 1
+            if self.log:
+                self.log(f"  ❌ {filename} ({elapsed * 1000:.1f} ms)")
+            return {'ok': False, 'error': error, 'ms': elapsed * 1000}
+        if self.log:
+            self.log(f"  ✅ {filename} ({elapsed * 1000:.1f} ms)")
+        return {
+            'ok': True,
+            'output': str(Path(output) / output_path.name),
+            'path': str(output_path),
+            'ms': elapsed * 1000,
+            'original_size': compiler.original_size,
+            'output_size': compiler.output_size,
+            'dependencies': [str(dep) for dep in compiler.dependencies],
+        }
+
+    def status(self, request):
+        return {
+            'ok': True,
+            'version': __version__,
+            'pid': os.getpid(),
+            'socket': self.path,
+            'uptime': time.time() - self.started,
+            'compiles': self.compiles,
+            'failures': self.failures,
+            'compilers': len(self.compilers),
+            'libraries': sum(registry.stats()['libraries'] for registry in self.registries.values()),
+        }
+
+    def shutdown(self, request):
+        self.stopping.set()
+        return {'ok': True}
+
+    COMMANDS = {'compile': compile, 'status': status, 'shutdown': shutdown}
+
+    def handle(self, line):
+        """Answer one request line with a response dict"""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {'ok': False, 'error': 'Request is not valid JSON'}
+        if not isinstance(request, dict):
+            return {'ok': False, 'error': 'Request must be a JSON object'}
+        command = self.COMMANDS.get(request.get('command'))
+        if command is None:
+            return {'ok': False, 'error': f"Unknown command {request.get('command')!r}"}
+        try:
+            return command(self, request)
+        except KeyError as e:
+            return {'ok': False, 'error': f"Request is missing {e}"}
+        except Exception as e:
+            return {'ok': False, 'error': str(e)}
+
+    # ---- server ----
+
+    async def handle_connection(self, reader, writer):
+        task = asyncio.current_task()
+        self.connections[task] = writer
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(json.dumps({'ok': False, 'error': 'Request is too large'}).encode('utf-8') + b'\n')
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                writer.write(json.dumps(self.handle(line)).encode('utf-8') + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            del self.connections[task]
+            writer.close()
+
+    def claim_socket(self):
+        """Remove a socket left behind by a daemon that died, refusing to replace a live one"""
+        if not os.path.exists(self.path):
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            return
+        try:
+            send_request({'command': 'status'}, self.path, timeout=1.0)
+        except DaemonError:
+            os.unlink(self.path)
+            return
+        raise DaemonError(f"A Webease daemon is already running at {self.path}")
+
+    async def serve_forever(self):
+        self.claim_socket()
+        self.warm()
+        self.stopping = asyncio.Event()
+        # The daemon writes files on request, so only its owner may connect. The
+        # umask makes the socket owner-only from the moment it is bound.
+        umask = os.umask(0o177)
+        try:
+            self.server = await asyncio.start_unix_server(self.handle_connection, self.path, limit=MAX_REQUEST_SIZE)
+        finally:
+            os.umask(umask)
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self.stopping.set)
+        try:
+            async with self.server:
+                await self.stopping.wait()
+                # Closing idle connections lets their handlers finish instead of being cancelled
+                for writer in self.connections.values():
+                    writer.close()
+                if self.connections:
+                    await asyncio.wait(list(self.connections))
+        finally:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
+def run_daemon(path=None, log=None):
+    """Serve compile requests until stopped by 'webease daemon stop', Ctrl+C or SIGTERM"""
+    asyncio.run(CompileDaemon(path, log).serve_forever())
@@ -0,0 +1,134 @@
+"""
+Webease Data - Lazy rows from CSV, JSON and YAML files for load_data()
+"""
+
+import csv
+import json
+from pathlib import Path
+
+
+DATA_SUFFIXES = ('.csv', '.tsv', '.json', '.jsonl', '.yaml', '.yml')
+
+
+def find_data_file(path, base_dir=None, work_dir=None):
+    """Resolve a data file relative to the page's folder, then the working directory
+
+    work_dir stands in for the working directory when the compile runs on
+    someone else's behalf, as in the daemon.
+    """
+    candidates = [Path(path)]
+    if not Path(path).is_absolute():
+        if work_dir is not None:
+            candidates[0] = Path(work_dir) / path
+        if base_dir is not None:
+            candidates.insert(0, Path(base_dir) / path)
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    raise FileNotFoundError(f"Data file '{path}' not found")
+
+
+def number(value):
+    """Convert a numeric string, as read from a CSV file, to int or float"""
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+    return value
+
+
+# ==================== READERS ====================
+
+def read_csv(path, header, delimiter=','):
+    with open(path, newline='', encoding='utf-8') as f:
+        yield from csv.DictReader(f, delimiter=delimiter) if header else csv.reader(f, delimiter=delimiter)
+
+
+def read_tsv(path, header):
+    return read_csv(path, header, delimiter='\t')
+
+
+def read_jsonl(path, header):
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"Invalid JSON on line {line_number} of '{path}': {e}") from None
+
+
+def read_json(path, header):
+    with open(path, encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON in '{path}': {e}") from None
+    yield from document_rows(path, data)
+
+
+def read_yaml(path, header):
+    # Imported here so pages without YAML data don't pay for loading PyYAML
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, encoding='utf-8') as f:
+        try:
+            data = yaml.load(f, Loader=loader)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in '{path}': {e}") from None
+    yield from document_rows(path, data)
+
+
+def document_rows(path, data):
+    if not isinstance(data, list):
+        raise ValueError(f"Data file '{path}' must contain a list of rows, not {type(data).__name__}")
+    return data
+
+
+READERS = {
+    '.csv': read_csv,
+    '.tsv': read_tsv,
+    '.jsonl': read_jsonl,
+    '.json': read_json,
+    '.yaml': read_yaml,
+    '.yml': read_yaml,
+}
+
+
+# ==================== DATA SOURCE ====================
+
+class DataSource:
+    """The rows of a data file, read from disk each time they are iterated
+
+    CSV, TSV and JSON Lines files are streamed one row at a time. JSON and
+    YAML documents are parsed whole and must hold a list. CSV rows are
+    dicts keyed by the header line, or lists with header=False. column
+    picks a single value out of every row.
+    """
+
+    def __init__(self, path, column=None, header=True):
+        self.path = Path(path)
+        self.column = column
+        self.header = header
+        try:
+            self.reader = READERS[self.path.suffix.lower()]
+        except KeyError:
+            raise ValueError(f"Can't load '{path}' (supported: {', '.join(DATA_SUFFIXES)})") from None
+
+    def __iter__(self):
+        rows = self.reader(self.path, self.header)
+        if self.column is None:
+            return rows
+        return (self.cell(row) for row in rows)
+
+    def cell(self, row):
+        try:
+            return row[self.column]
+        except (KeyError, IndexError, TypeError):
+            raise KeyError(f"A row in '{self.path}' has no column {self.column!r}") from None
+
+    def __repr__(self):
+        column = '' if self.column is None else f', column={self.column!r}'
+        return f'DataSource({str(self.path)!r}{column})'
@@ -0,0 +1,35 @@
+"""
+Webease Fragments - Shared HTML building for list-driven builders
+
+Builders collect one string per item and join them once, so building a
+list, table or gallery stays linear in the number of items instead of
+copying the whole fragment on every `+=`.
+"""
+
+
+def wrap_each(items, open_tag, close_tag):
+    """Wrap every item in a pair of tags: ['a', 'b'] -> <li>a</li><li>b</li>"""
+    texts = [str(item) for item in items]
+    if not texts:
+        return ''
+    return open_tag + (close_tag + open_tag).join(texts) + close_tag
+
+
+def table_row(cells):
+    """A <tr> of <td> cells; dict rows give their values in order"""
+    if isinstance(cells, dict):
+        cells = cells.values()
+    return '<tr>' + wrap_each(cells, '<td>', '</td>') + '</tr>'
+
+
+def table_rows(rows):
+    return ''.join([table_row(row) for row in rows])
+
+
+def link_list(links):
+    """<a> tags for {"url": ..., "text": ...} dicts or plain labels"""
+    return ''.join([
+        f'<a href="{link.get("url", "#")}">{link.get("text", "Link")}</a>' if isinstance(link, dict)
+        else f'<a href="#">{link}</a>'
+        for link in links
+    ])
@@ -0,0 +1,238 @@
+"""
+Webease Function Library - 230+ beginner-friendly functions for web creation
+
+The builders are grouped into category modules (text, forms, media, ...)
+that are imported the first time a page calls one of their functions.
+"""
+
+import contextlib
+import contextvars
+import importlib
+
+from ..components import ComponentTemplate
+from ..css import CSSStore
+from ..data import DataSource, find_data_file
+
+class WebeaseContext:
+    def __init__(self):
+        self.html_parts = []
+        self.css_rules = CSSStore()
+        self.js_code = []
+        self.head_parts = []
+        self.body_classes = []
+        self.imported_libraries = []
+        self.custom_functions = {}
+        self.data_files = []
+        self.base_dir = None
+        self.work_dir = None
+        self.bindings = {}
+        
+    def add_html(self, html):
+        self.html_parts.append(html)
+    
+    def add_css(self, css):
+        self.css_rules.append(css)
+    
+    def add_js(self, js):
+        self.js_code.append(js)
+    
+    def add_head(self, head):
+        self.head_parts.append(head)
+
+_current_context = contextvars.ContextVar('webease_context', default=None)
+
+class ContextProxy:
+    """Forwards to the WebeaseContext active in the current thread or task"""
+    __slots__ = ()
+    
+    def add_html(self, html):
+        get_context().add_html(html)
+    
+    def add_css(self, css):
+        get_context().add_css(css)
+    
+    def add_js(self, js):
+        get_context().add_js(js)
+    
+    def add_head(self, head):
+        get_context().add_head(head)
+    
+    def __getattr__(self, name):
+        return getattr(get_context(), name)
+
+# Every builder writes through this proxy, so concurrent compiles in
+# different threads or asyncio tasks never share a context
+ctx = ContextProxy()
+
+# ==================== BUILTIN REGISTRY ====================
+
+# Builtins live in category modules that are imported the first time one of
+# their functions is looked up, so a page only loads the categories it uses
+CATEGORIES = {
+    'text': (
+        'add_title', 'add_text', 'add_heading', 'add_paragraph', 'add_div', 'add_span', 'add_link', 'add_image',
+        'add_list', 'add_ordered_list', 'add_unordered_list', 'add_bold', 'add_italic', 'add_underline',
+        'add_strikethrough', 'add_code', 'add_code_block', 'add_superscript', 'add_subscript', 'add_quote',
+        'add_small', 'add_mark', 'add_br', 'add_hr', 'add_space', 'add_icon', 'add_emoji', 'add_dropcap',
+        'add_text_gradient',
+    ),
+    'charts': (
+        'create_table', 'add_table_row', 'create_bar_chart', 'create_pie_chart',
+    ),
+    'forms': (
+        'create_form', 'end_form', 'add_input', 'add_text_input', 'add_email_input', 'add_password_input',
+        'add_number_input', 'add_textarea', 'add_button', 'add_submit_button', 'add_checkbox', 'add_radio',
+        'add_select', 'add_label', 'add_file_input', 'add_date_input', 'add_color_input', 'add_range_input',
+        'add_form_validation', 'add_password_strength_meter',
+    ),
+    'styling': (
+        'set_background', 'set_background_gradient', 'set_font', 'set_text_color', 'set_page_margin',
+        'set_page_padding', 'add_custom_css', 'add_style_to_element', 'set_mobile_breakpoint',
+        'add_responsive_text', 'hide_on_mobile', 'hide_on_desktop', 'add_box_shadow', 'add_text_shadow',
+        'add_border', 'add_border_radius', 'set_opacity', 'add_transform', 'add_transition', 'enable_dark_mode',
+        'add_dark_mode_toggle', 'create_color_palette',
+    ),
+    'layout': (
+        'create_container', 'create_section', 'create_row', 'create_column', 'create_grid', 'end_grid',
+        'create_flex_container', 'end_flex_container', 'add_spacer', 'create_card', 'create_info_box',
+        'create_warning_box', 'create_success_box', 'create_error_box', 'create_panel', 'create_navbar',
+        'create_menu', 'create_breadcrumbs', 'create_tabs', 'create_accordion', 'create_dropdown_menu',
+        'create_sidebar', 'create_footer', 'create_hero_section', 'make_sticky', 'add_sticky_cta',
+    ),
+    'widgets': (
+        'create_modal', 'add_alert', 'add_toast', 'add_progress_bar', 'add_spinner', 'add_skeleton_loader',
+        'add_badge', 'add_pill', 'add_tooltip', 'create_pricing_card', 'create_timeline', 'create_countdown',
+    ),
+    'animations': (
+        'add_fade_in', 'add_slide_in', 'add_bounce', 'add_rotate', 'add_scale', 'add_shake', 'add_pulse',
+        'add_hover_effect', 'add_hover_color', 'add_hover_background', 'add_click_effect', 'add_parallax',
+        'add_scroll_reveal', 'add_sticky_header', 'add_typing_effect', 'add_fade_in_on_scroll',
+        'add_float_animation', 'add_glow_effect',
+    ),
+    'media': (
+        'add_video', 'add_audio', 'add_iframe', 'add_embed', 'create_carousel', 'create_image_gallery',
+        'create_masonry_gallery', 'add_lightbox', 'create_image_slider', 'add_video_background', 'embed_youtube',
+        'embed_twitter_timeline', 'add_social_share_buttons', 'embed_google_map',
+    ),
+    'page': (
+        'set_title', 'add_favicon', 'add_meta', 'add_external_css', 'add_external_js', 'add_google_font',
+    ),
+}
+
+BUILTIN_CATEGORIES = {name: category for category, names in CATEGORIES.items() for name in names}
+
+# Builtins defined in this module
+CORE_BUILTINS = ('import_library', 'define_component', 'use_component', 'repeat_component', 'load_data', 'binding')
+
+BUILTIN_NAMES = frozenset(CORE_BUILTINS).union(BUILTIN_CATEGORIES)
+
+def __getattr__(name):
+    category = BUILTIN_CATEGORIES.get(name)
+    if category is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{category}', __name__)
+    # Copy the whole category in, so its other builtins are plain attribute lookups from now on
+    for builtin_name in CATEGORIES[category]:
+        globals()[builtin_name] = getattr(module, builtin_name)
+    return globals()[name]
+
+def __dir__():
+    return sorted(BUILTIN_NAMES.union(globals()))
+
+def builtin(name):
+    """The builtin function called name, importing its category if needed, or None"""
+    if name not in BUILTIN_NAMES:
+        return None
+    return globals()[name] if name in globals() else __getattr__(name)
+
+# ==================== LIBRARY SYSTEM ====================
+
+def import_library(library_name):
+    """Import a .wl library"""
+    ctx.imported_libraries.append(library_name)
+
+def define_component(name, html_template):
+    """Define a custom component"""
+    ctx.custom_functions[name] = ComponentTemplate(name, html_template)
+
+def use_component(name, **kwargs):
+    """Use a custom component"""
+    template = ctx.custom_functions.get(name)
+    if template is None:
+        raise NameError(f"Component '{name}' is not defined")
+    ctx.add_html(template.render(kwargs))
+
+def repeat_component(name, rows):
+    """Render a component or builder function once for every row in a list
+
+    Rows are dicts of arguments, lists of positional arguments or single values.
+    """
+    template = ctx.custom_functions.get(name)
+    if template is not None:
+        ctx.add_html(template.render_rows(rows))
+        return
+
+    func = builtin(name)
+    if func is None:
+        raise NameError(f"Component or function '{name}' is not defined")
+    for number, row in enumerate(rows, 1):
+        try:
+            if isinstance(row, dict):
+                func(**row)
+            elif isinstance(row, (list, tuple)):
+                func(*row)
+            else:
+                func(row)
+        except TypeError as e:
+            raise TypeError(f"Row {number}: {e}") from None
+
+# ==================== DATA FILES ====================
+
+def load_data(path, column=None, header=True):
+    """Rows of a CSV, TSV, JSON, JSON Lines or YAML file, read when a builder iterates them
+
+    Use it as an argument: create_table(["Name", "Price"], load_data("products.csv"))
+    """
+    source = DataSource(find_data_file(path, ctx.base_dir, ctx.work_dir), column, header)
+    ctx.data_files.append(str(source.path))
+    return source
+
+_NO_DEFAULT = object()
+
+def binding(name, default=_NO_DEFAULT):
+    """Data passed in by the program rendering the page, such as the rows of a table
+
+    Use it as an argument: create_table(["Name", "Price"], binding("products"))
+    """
+    try:
+        return ctx.bindings[name]
+    except KeyError:
+        if default is _NO_DEFAULT:
+            raise NameError(f"No data is bound to '{name}'") from None
+        return default
+
+# Builtins that return a value, and so may be called inside another call's arguments
+VALUE_FUNCTIONS = frozenset({'load_data', 'binding'})
+
+# ==================== CONTEXT MANAGEMENT ====================
+
+def reset_context():
+    """Reset the context"""
+    _current_context.set(WebeaseContext())
+
+def get_context():
+    """Get the current context"""
+    context = _current_context.get()
+    if context is None:
+        context = WebeaseContext()
+        _current_context.set(context)
+    return context
+
+@contextlib.contextmanager
+def use_context(context):
+    """Make a context current for the duration of a with-block"""
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
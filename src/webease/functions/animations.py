@@ -0,0 +1,132 @@
+"""
+Webease Animations - Keyframe, hover and scroll animations
+"""
+
+from . import ctx
+
+# ==================== ANIMATIONS ====================
+
+def add_fade_in(selector, duration="1s"):
+    """Add fade-in animation"""
+    ctx.add_css(f'{selector} {{ animation: fadeIn {duration}; }} @keyframes fadeIn {{ from {{ opacity: 0; }} to {{ opacity: 1; }} }}')
+
+def add_slide_in(selector, direction="left", duration="0.5s"):
+    """Add slide-in animation"""
+    transform_from = {
+        'left': 'translateX(-100%)',
+        'right': 'translateX(100%)',
+        'top': 'translateY(-100%)',
+        'bottom': 'translateY(100%)'
+    }.get(direction, 'translateX(-100%)')
+    ctx.add_css(f'{selector} {{ animation: slideIn{direction.capitalize()} {duration}; }} @keyframes slideIn{direction.capitalize()} {{ from {{ transform: {transform_from}; }} to {{ transform: translateX(0); }} }}')
+
+def add_bounce(selector, duration="1s"):
+    """Add bounce animation"""
+    ctx.add_css(f'{selector} {{ animation: bounce {duration}; }} @keyframes bounce {{ 0%, 20%, 50%, 80%, 100% {{ transform: translateY(0); }} 40% {{ transform: translateY(-30px); }} 60% {{ transform: translateY(-15px); }} }}')
+
+def add_rotate(selector, degrees=360, duration="2s"):
+    """Add rotation animation"""
+    ctx.add_css(f'{selector} {{ animation: rotate {duration} infinite linear; }} @keyframes rotate {{ from {{ transform: rotate(0deg); }} to {{ transform: rotate({degrees}deg); }} }}')
+
+def add_scale(selector, scale=1.1, duration="0.3s"):
+    """Add scale animation"""
+    ctx.add_css(f'{selector} {{ transition: transform {duration}; }} {selector}:hover {{ transform: scale({scale}); }}')
+
+def add_shake(selector, duration="0.5s"):
+    """Add shake animation"""
+    ctx.add_css(f'{selector} {{ animation: shake {duration}; }} @keyframes shake {{ 0%, 100% {{ transform: translateX(0); }} 10%, 30%, 50%, 70%, 90% {{ transform: translateX(-10px); }} 20%, 40%, 60%, 80% {{ transform: translateX(10px); }} }}')
+
+def add_pulse(selector, duration="1s"):
+    """Add pulse animation"""
+    ctx.add_css(f'{selector} {{ animation: pulse {duration} infinite; }} @keyframes pulse {{ 0% {{ transform: scale(1); }} 50% {{ transform: scale(1.05); }} 100% {{ transform: scale(1); }} }}')
+
+# ==================== HOVER & INTERACTION EFFECTS ====================
+
+def add_hover_effect(selector, property_name, value, duration="0.3s"):
+    """Add hover effect"""
+    ctx.add_css(f'{selector} {{ transition: {property_name} {duration}; }} {selector}:hover {{ {property_name}: {value}; }}')
+
+def add_hover_color(selector, color):
+    """Add hover color change"""
+    add_hover_effect(selector, 'color', color)
+
+def add_hover_background(selector, color):
+    """Add hover background change"""
+    add_hover_effect(selector, 'background-color', color)
+
+def add_click_effect(element_id, effect):
+    """Add click effect with JavaScript"""
+    ctx.add_js(f'document.getElementById("{element_id}").addEventListener("click", function() {{ {effect} }});')
+
+# ==================== SCROLL EFFECTS ====================
+
+def add_parallax(selector, speed=0.5):
+    """Add parallax scroll effect"""
+    ctx.add_js(f'''
+    window.addEventListener('scroll', function() {{
+        const elem = document.querySelector('{selector}');
+        if (elem) {{
+            const scrolled = window.pageYOffset;
+            elem.style.transform = 'translateY(' + (scrolled * {speed}) + 'px)';
+        }}
+    }});
+    ''')
+
+def add_scroll_reveal(selector):
+    """Add scroll reveal animation"""
+    ctx.add_css(f'{selector} {{ opacity: 0; transform: translateY(50px); transition: opacity 0.6s, transform 0.6s; }} {selector}.revealed {{ opacity: 1; transform: translateY(0); }}')
+    ctx.add_js(f'''
+    window.addEventListener('scroll', function() {{
+        document.querySelectorAll('{selector}').forEach(elem => {{
+            const rect = elem.getBoundingClientRect();
+            if (rect.top < window.innerHeight * 0.8) {{
+                elem.classList.add('revealed');
+            }}
+        }});
+    }});
+    ''')
+
+def add_sticky_header(selector):
+    """Make header sticky on scroll"""
+    ctx.add_css(f'{selector} {{ position: sticky; top: 0; z-index: 100; background: white; }}')
+
+# ==================== ADVANCED ANIMATIONS ====================
+
+def add_typing_effect(selector, text, speed=100):
+    """Add typing animation effect"""
+    ctx.add_js(f'''
+    const element = document.querySelector('{selector}');
+    const text = '{text}';
+    let i = 0;
+    element.innerHTML = '';
+    function typeWriter() {{
+        if (i < text.length) {{
+            element.innerHTML += text.charAt(i);
+            i++;
+            setTimeout(typeWriter, {speed});
+        }}
+    }}
+    typeWriter();
+    ''')
+
+def add_fade_in_on_scroll(selector):
+    """Add fade-in animation on scroll"""
+    ctx.add_css(f'{selector} {{ opacity: 0; transform: translateY(30px); transition: opacity 0.6s, transform 0.6s; }} {selector}.visible {{ opacity: 1; transform: translateY(0); }}')
+    ctx.add_js(f'''
+    const observer = new IntersectionObserver(entries => {{
+        entries.forEach(entry => {{
+            if (entry.isIntersecting) {{
+                entry.target.classList.add('visible');
+            }}
+        }});
+    }});
+    document.querySelectorAll('{selector}').forEach(el => observer.observe(el));
+    ''')
+
+def add_float_animation(selector, duration="3s"):
+    """Add floating animation"""
+    ctx.add_css(f'{selector} {{ animation: float {duration} ease-in-out infinite; }} @keyframes float {{ 0%, 100% {{ transform: translateY(0px); }} 50% {{ transform: translateY(-20px); }} }}')
+
+def add_glow_effect(selector, color="#667eea"):
+    """Add glowing effect"""
+    ctx.add_css(f'{selector} {{ animation: glow 2s ease-in-out infinite alternate; }} @keyframes glow {{ from {{ box-shadow: 0 0 10px {color}, 0 0 20px {color}, 0 0 30px {color}; }} to {{ box-shadow: 0 0 20px {color}, 0 0 30px {color}, 0 0 40px {color}; }} }}')
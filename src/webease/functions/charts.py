@@ -0,0 +1,63 @@
+"""
+Webease Charts - Tables, bar charts and pie charts
+"""
+
+from . import ctx
+from ..data import number
+from ..fragments import table_row, table_rows, wrap_each
+
+# ==================== TABLES ====================
+
+def create_table(headers, rows, css_class=""):
+    """Create a table"""
+    class_attr = f' class="{css_class}"' if css_class else ''
+    ctx.add_html(f'<table{class_attr}><thead><tr>{wrap_each(headers, "<th>", "</th>")}</tr></thead>'
+                 f'<tbody>{table_rows(rows)}</tbody></table>')
+
+def add_table_row(cells):
+    """Add a table row (use within table context)"""
+    ctx.add_html(table_row(cells))
+
+# ==================== CHARTS & DATA VISUALIZATION ====================
+
+def create_bar_chart(data, labels, title="", css_class="bar-chart"):
+    """Create a simple bar chart"""
+    data = [number(value) for value in data]
+    max_val = max(data) if data else 1
+    ctx.add_css(f'.{css_class} {{ max-width: 600px; margin: 20px auto; }} .{css_class}-title {{ text-align: center; font-size: 20px; font-weight: bold; margin-bottom: 20px; }} .{css_class}-bar {{ display: flex; align-items: center; margin: 10px 0; }} .{css_class}-label {{ width: 100px; text-align: right; padding-right: 15px; }} .{css_class}-bar-fill {{ height: 30px; background: linear-gradient(90deg, #667eea, #764ba2); border-radius: 4px; transition: width 0.5s; }} .{css_class}-value {{ margin-left: 10px; font-weight: bold; }}')
+    
+    chart_html = [f'<div class="{css_class}">']
+    if title:
+        chart_html.append(f'<div class="{css_class}-title">{title}</div>')
+    for label, value in zip(labels, data):
+        percentage = (value / max_val * 100) if max_val > 0 else 0
+        chart_html.append(f'<div class="{css_class}-bar"><div class="{css_class}-label">{label}</div><div class="{css_class}-bar-fill" style="width: {percentage}%;"></div><div class="{css_class}-value">{value}</div></div>')
+    chart_html.append('</div>')
+    ctx.add_html(''.join(chart_html))
+
+def create_pie_chart(data, labels, colors=None, css_class="pie-chart"):
+    """Create a simple pie chart using CSS conic gradient"""
+    if not colors:
+        colors = ['#667eea', '#764ba2', '#f093fb', '#4facfe', '#43e97b', '#fa709a']
+    
+    data = [number(value) for value in data]
+    total = sum(data)
+    percentages = [val/total*100 for val in data] if total > 0 else [0]*len(data)
+    
+    gradient_stops = []
+    cumulative = 0
+    for i, pct in enumerate(percentages):
+        color = colors[i % len(colors)]
+        gradient_stops.append(f'{color} {cumulative}% {cumulative + pct}%')
+        cumulative += pct
+    
+    gradient = ', '.join(gradient_stops)
+    
+    ctx.add_css(f'.{css_class} {{ width: 300px; height: 300px; border-radius: 50%; background: conic-gradient({gradient}); margin: 20px auto; }} .{css_class}-legend {{ max-width: 300px; margin: 20px auto; }} .{css_class}-legend-item {{ display: flex; align-items: center; margin: 8px 0; }} .{css_class}-legend-color {{ width: 20px; height: 20px; border-radius: 4px; margin-right: 10px; }}')
+    
+    chart_html = [f'<div class="{css_class}"></div><div class="{css_class}-legend">']
+    for i, (label, value) in enumerate(zip(labels, data)):
+        color = colors[i % len(colors)]
+        chart_html.append(f'<div class="{css_class}-legend-item"><div class="{css_class}-legend-color" style="background: {color};"></div><span>{label}: {value}</span></div>')
+    chart_html.append('</div>')
+    ctx.add_html(''.join(chart_html))
@@ -0,0 +1,141 @@
+"""
+Webease Forms - Forms, inputs, buttons and client-side validation
+"""
+
+from . import ctx
+
+# ==================== FORMS & INPUTS ====================
+
+def create_form(action="", method="post", form_id=""):
+    """Start a form"""
+    id_attr = f' id="{form_id}"' if form_id else ''
+    ctx.add_html(f'<form action="{action}" method="{method}"{id_attr}>')
+
+def end_form():
+    """End a form"""
+    ctx.add_html('</form>')
+
+def add_input(input_type="text", name="", placeholder="", value="", required=False):
+    """Add an input field"""
+    required_attr = ' required' if required else ''
+    ctx.add_html(f'<input type="{input_type}" name="{name}" placeholder="{placeholder}" value="{value}"{required_attr}>')
+
+def add_text_input(name, placeholder="", value=""):
+    """Add a text input"""
+    add_input("text", name, placeholder, value)
+
+def add_email_input(name, placeholder="", value=""):
+    """Add an email input"""
+    add_input("email", name, placeholder, value)
+
+def add_password_input(name, placeholder=""):
+    """Add a password input"""
+    add_input("password", name, placeholder)
+
+def add_number_input(name, placeholder="", min_val="", max_val=""):
+    """Add a number input"""
+    min_attr = f' min="{min_val}"' if min_val else ''
+    max_attr = f' max="{max_val}"' if max_val else ''
+    ctx.add_html(f'<input type="number" name="{name}" placeholder="{placeholder}"{min_attr}{max_attr}>')
+
+def add_textarea(name, placeholder="", rows=4, cols=50):
+    """Add a textarea"""
+    ctx.add_html(f'<textarea name="{name}" placeholder="{placeholder}" rows="{rows}" cols="{cols}"></textarea>')
+
+def add_button(text, button_type="button", onclick=""):
+    """Add a button"""
+    onclick_attr = f' onclick="{onclick}"' if onclick else ''
+    ctx.add_html(f'<button type="{button_type}"{onclick_attr}>{text}</button>')
+
+def add_submit_button(text="Submit"):
+    """Add a submit button"""
+    add_button(text, "submit")
+
+def add_checkbox(name, label, value="", checked=False):
+    """Add a checkbox"""
+    checked_attr = ' checked' if checked else ''
+    ctx.add_html(f'<label><input type="checkbox" name="{name}" value="{value}"{checked_attr}> {label}</label>')
+
+def add_radio(name, label, value, checked=False):
+    """Add a radio button"""
+    checked_attr = ' checked' if checked else ''
+    ctx.add_html(f'<label><input type="radio" name="{name}" value="{value}"{checked_attr}> {label}</label>')
+
+def add_select(name, options, selected=""):
+    """Add a select dropdown"""
+    option_html = []
+    for option in options:
+        if isinstance(option, dict):
+            value = option.get('value', option.get('label'))
+            label = option.get('label', value)
+        else:
+            value = label = option
+        selected_attr = ' selected' if value == selected else ''
+        option_html.append(f'<option value="{value}"{selected_attr}>{label}</option>')
+    ctx.add_html(f'<select name="{name}">{"".join(option_html)}</select>')
+
+def add_label(text, for_id=""):
+    """Add a label"""
+    for_attr = f' for="{for_id}"' if for_id else ''
+    ctx.add_html(f'<label{for_attr}>{text}</label>')
+
+def add_file_input(name, accept=""):
+    """Add a file input"""
+    accept_attr = f' accept="{accept}"' if accept else ''
+    ctx.add_html(f'<input type="file" name="{name}"{accept_attr}>')
+
+def add_date_input(name, value=""):
+    """Add a date input"""
+    add_input("date", name, "", value)
+
+def add_color_input(name, value="#000000"):
+    """Add a color picker"""
+    add_input("color", name, "", value)
+
+def add_range_input(name, min_val=0, max_val=100, value=50):
+    """Add a range slider"""
+    ctx.add_html(f'<input type="range" name="{name}" min="{min_val}" max="{max_val}" value="{value}">')
+
+# ==================== ADVANCED FORMS ====================
+
+def add_form_validation(form_id):
+    """Add form validation"""
+    ctx.add_js(f'''
+    document.getElementById('{form_id}').addEventListener('submit', function(e) {{
+        const inputs = this.querySelectorAll('input[required], textarea[required]');
+        let valid = true;
+        inputs.forEach(input => {{
+            if (!input.value.trim()) {{
+                input.style.borderColor = 'red';
+                valid = false;
+            }} else {{
+                input.style.borderColor = '';
+            }}
+        }});
+        if (!valid) {{
+            e.preventDefault();
+            alert('Please fill in all required fields');
+        }}
+    }});
+    ''')
+
+def add_password_strength_meter(input_id):
+    """Add password strength indicator"""
+    ctx.add_css(f'#{input_id}-strength {{ height: 5px; margin-top: 5px; border-radius: 3px; transition: all 0.3s; }} .strength-weak {{ background: #ff4444; width: 33%; }} .strength-medium {{ background: #ffaa00; width: 66%; }} .strength-strong {{ background: #00C851; width: 100%; }}')
+    ctx.add_html(f'<div id="{input_id}-strength"></div>')
+    ctx.add_js(f'''
+    document.getElementById('{input_id}').addEventListener('input', function(e) {{
+        const password = e.target.value;
+        const strength = document.getElementById('{input_id}-strength');
+        let score = 0;
+        if (password.length >= 8) score++;
+        if (/[A-Z]/.test(password)) score++;
+        if (/[0-9]/.test(password)) score++;
+        if (/[^A-Za-z0-9]/.test(password)) score++;
+        
+        strength.className = '';
+        if (score <= 1) strength.className = 'strength-weak';
+        else if (score <= 3) strength.className = 'strength-medium';
+        else strength.className = 'strength-strong';
+    }});
+    ''')
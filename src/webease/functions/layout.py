@@ -0,0 +1,169 @@
+"""
+Webease Layout - Containers, grids, cards, navigation and page sections
+"""
+
+from . import ctx
+from ..fragments import link_list, wrap_each
+
+# ==================== LAYOUT UTILITIES ====================
+
+def create_container(content="", css_class="container", centered=True):
+    """Create a container"""
+    center_css = "margin: 0 auto;" if centered else ""
+    ctx.add_css(f'.{css_class} {{ max-width: 1200px; padding: 20px; {center_css} }}')
+    ctx.add_html(f'<div class="{css_class}">{content}</div>')
+
+def create_section(content="", css_class="section"):
+    """Create a section"""
+    ctx.add_html(f'<section class="{css_class}">{content}</section>')
+
+def create_row(content="", css_class="row"):
+    """Create a flex row"""
+    ctx.add_css(f'.{css_class} {{ display: flex; flex-wrap: wrap; }}')
+    ctx.add_html(f'<div class="{css_class}">{content}</div>')
+
+def create_column(content="", width="", css_class="column"):
+    """Create a column"""
+    width_css = f'flex: 0 0 {width}; max-width: {width};' if width else 'flex: 1;'
+    ctx.add_css(f'.{css_class} {{ {width_css} padding: 10px; box-sizing: border-box; }}')
+    ctx.add_html(f'<div class="{css_class}">{content}</div>')
+
+def create_grid(columns=3, gap="20px", css_class="grid"):
+    """Create a grid container"""
+    ctx.add_css(f'.{css_class} {{ display: grid; grid-template-columns: repeat({columns}, 1fr); gap: {gap}; }}')
+    ctx.add_html(f'<div class="{css_class}">')
+
+def end_grid():
+    """End a grid container"""
+    ctx.add_html('</div>')
+
+def create_flex_container(direction="row", justify="flex-start", align="stretch", css_class="flex-container"):
+    """Create a flexbox container"""
+    ctx.add_css(f'.{css_class} {{ display: flex; flex-direction: {direction}; justify-content: {justify}; align-items: {align}; }}')
+    ctx.add_html(f'<div class="{css_class}">')
+
+def end_flex_container():
+    """End a flexbox container"""
+    ctx.add_html('</div>')
+
+def add_spacer(height="20px"):
+    """Add vertical space"""
+    ctx.add_html(f'<div style="height: {height};"></div>')
+
+# ==================== CARDS & CONTENT BOXES ====================
+
+def create_card(title="", content="", css_class="card", shadow=True):
+    """Create a card"""
+    shadow_css = "box-shadow: 0 4px 6px rgba(0,0,0,0.1);" if shadow else ""
+    ctx.add_css(f'.{css_class} {{ background: white; border-radius: 8px; padding: 20px; margin: 10px; {shadow_css} }}')
+    card_html = f'<div class="{css_class}">'
+    if title:
+        card_html += f'<h3>{title}</h3>'
+    card_html += f'{content}</div>'
+    ctx.add_html(card_html)
+
+def create_info_box(content, css_class="info-box"):
+    """Create an info box"""
+    ctx.add_css(f'.{css_class} {{ background: #e3f2fd; border-left: 4px solid #2196F3; padding: 15px; margin: 10px 0; border-radius: 4px; }}')
+    ctx.add_html(f'<div class="{css_class}">{content}</div>')
+
+def create_warning_box(content, css_class="warning-box"):
+    """Create a warning box"""
+    ctx.add_css(f'.{css_class} {{ background: #fff3cd; border-left: 4px solid #ffc107; padding: 15px; margin: 10px 0; border-radius: 4px; }}')
+    ctx.add_html(f'<div class="{css_class}">{content}</div>')
+
+def create_success_box(content, css_class="success-box"):
+    """Create a success box"""
+    ctx.add_css(f'.{css_class} {{ background: #d4edda; border-left: 4px solid #28a745; padding: 15px; margin: 10px 0; border-radius: 4px; }}')
+    ctx.add_html(f'<div class="{css_class}">{content}</div>')
+
+def create_error_box(content, css_class="error-box"):
+    """Create an error box"""
+    ctx.add_css(f'.{css_class} {{ background: #f8d7da; border-left: 4px solid #dc3545; padding: 15px; margin: 10px 0; border-radius: 4px; }}')
+    ctx.add_html(f'<div class="{css_class}">{content}</div>')
+
+def create_panel(title, content, css_class="panel"):
+    """Create a panel with header"""
+    ctx.add_css(f'.{css_class} {{ border: 1px solid #ddd; border-radius: 4px; margin: 10px 0; }} .{css_class}-header {{ background: #f5f5f5; padding: 10px 15px; border-bottom: 1px solid #ddd; font-weight: bold; }} .{css_class}-body {{ padding: 15px; }}')
+    ctx.add_html(f'<div class="{css_class}"><div class="{css_class}-header">{title}</div><div class="{css_class}-body">{content}</div></div>')
+
+# ==================== NAVIGATION ====================
+
+def create_navbar(brand="", links=None, css_class="navbar"):
+    """Create a navigation bar"""
+    links = links or []
+    ctx.add_css(f'.{css_class} {{ background: #333; padding: 15px; display: flex; align-items: center; }} .{css_class} a {{ color: white; text-decoration: none; padding: 0 15px; }} .{css_class} a:hover {{ color: #ddd; }} .{css_class}-brand {{ font-weight: bold; margin-right: auto; }}')
+    brand_html = f'<span class="{css_class}-brand">{brand}</span>' if brand else ''
+    ctx.add_html(f'<nav class="{css_class}">{brand_html}{link_list(links)}</nav>')
+
+def create_menu(items, css_class="menu"):
+    """Create a vertical menu"""
+    ctx.add_css(f'.{css_class} {{ list-style: none; padding: 0; margin: 0; }} .{css_class} li {{ padding: 10px; border-bottom: 1px solid #ddd; }} .{css_class} li:hover {{ background: #f5f5f5; cursor: pointer; }}')
+    ctx.add_html(f'<ul class="{css_class}">{wrap_each(items, "<li>", "</li>")}</ul>')
+
+def create_breadcrumbs(items, css_class="breadcrumbs"):
+    """Create breadcrumbs navigation"""
+    ctx.add_css(f'.{css_class} {{ display: flex; list-style: none; padding: 10px 0; }} .{css_class} li::after {{ content: " / "; margin: 0 8px; }} .{css_class} li:last-child::after {{ content: ""; }}')
+    ctx.add_html(f'<ul class="{css_class}">{wrap_each(items, "<li>", "</li>")}</ul>')
+
+def create_tabs(tabs, css_class="tabs"):
+    """Create tabs"""
+    ctx.add_css(f'.{css_class} {{ display: flex; border-bottom: 2px solid #ddd; }} .{css_class} button {{ background: none; border: none; padding: 10px 20px; cursor: pointer; }} .{css_class} button.active {{ border-bottom: 2px solid #007bff; color: #007bff; }}')
+    active = ' class="active"'
+    buttons = ''.join([f'<button{active if i == 0 else ""}>{tab}</button>' for i, tab in enumerate(tabs)])
+    ctx.add_html(f'<div class="{css_class}">{buttons}</div>')
+
+def create_accordion(items, css_class="accordion"):
+    """Create an accordion"""
+    ctx.add_css(f'.{css_class}-item {{ border: 1px solid #ddd; margin: 5px 0; }} .{css_class}-header {{ background: #f5f5f5; padding: 15px; cursor: pointer; font-weight: bold; }} .{css_class}-header:hover {{ background: #e0e0e0; }} .{css_class}-body {{ padding: 15px; display: none; }} .{css_class}-body.active {{ display: block; }}')
+    for item in items:
+        if isinstance(item, dict):
+            header = item.get('header', 'Accordion Item')
+            body = item.get('body', '')
+        else:
+            header = body = item
+        ctx.add_html(f'<div class="{css_class}-item"><div class="{css_class}-header">{header}</div><div class="{css_class}-body">{body}</div></div>')
+
+# ==================== ADVANCED COMPONENTS ====================
+
+def create_dropdown_menu(trigger_text, items, css_class="dropdown"):
+    """Create dropdown menu"""
+    ctx.add_css(f'.{css_class} {{ position: relative; display: inline-block; }} .{css_class}-content {{ display: none; position: absolute; background: white; min-width: 160px; box-shadow: 0 8px 16px rgba(0,0,0,0.2); z-index: 1; }} .{css_class}-content a {{ color: black; padding: 12px 16px; text-decoration: none; display: block; }} .{css_class}-content a:hover {{ background: #f1f1f1; }} .{css_class}:hover .{css_class}-content {{ display: block; }}')
+    ctx.add_html(f'<div class="{css_class}"><button>{trigger_text}</button>'
+                 f'<div class="{css_class}-content">{link_list(items)}</div></div>')
+
+def create_sidebar(content, position="left", width="250px", css_class="sidebar"):
+    """Create a sidebar"""
+    position_css = f'{position}: 0;' if position in ['left', 'right'] else 'left: 0;'
+    ctx.add_css(f'.{css_class} {{ position: fixed; {position_css} top: 0; width: {width}; height: 100%; background: #f8f9fa; padding: 20px; overflow-y: auto; box-shadow: 2px 0 5px rgba(0,0,0,0.1); }}')
+    ctx.add_html(f'<aside class="{css_class}">{content}</aside>')
+
+def create_footer(content, css_class="footer"):
+    """Create a footer"""
+    ctx.add_css(f'.{css_class} {{ background: #333; color: white; padding: 30px 20px; margin-top: 50px; text-align: center; }}')
+    ctx.add_html(f'<footer class="{css_class}">{content}</footer>')
+
+def create_hero_section(title, subtitle, background_image="", css_class="hero"):
+    """Create a hero section"""
+    bg_css = f'background-image: url({background_image});' if background_image else 'background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);'
+    ctx.add_css(f'.{css_class} {{ {bg_css} background-size: cover; background-position: center; color: white; padding: 100px 20px; text-align: center; }} .{css_class} h1 {{ font-size: 48px; margin-bottom: 20px; }} .{css_class} p {{ font-size: 20px; }}')
+    ctx.add_html(f'<div class="{css_class}"><h1>{title}</h1><p>{subtitle}</p></div>')
+
+# ==================== STICKY ELEMENTS ====================
+
+def make_sticky(selector, top="0px"):
+    """Make element sticky on scroll"""
+    ctx.add_css(f'{selector} {{ position: sticky; top: {top}; z-index: 100; }}')
+
+def add_sticky_cta(text, link="#", position="bottom-right"):
+    """Add sticky call-to-action button"""
+    positions = {
+        'bottom-right': 'bottom: 20px; right: 20px;',
+        'bottom-left': 'bottom: 20px; left: 20px;',
+        'top-right': 'top: 20px; right: 20px;',
+        'top-left': 'top: 20px; left: 20px;'
+    }
+    pos_css = positions.get(position, positions['bottom-right'])
+    
+    ctx.add_css(f'.sticky-cta {{ position: fixed; {pos_css} z-index: 1000; padding: 15px 30px; background: linear-gradient(135deg, #667eea, #764ba2); color: white; text-decoration: none; border-radius: 50px; box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4); transition: transform 0.3s; }} .sticky-cta:hover {{ transform: scale(1.05); }}')
+    ctx.add_html(f'<a href="{link}" class="sticky-cta">{text}</a>')
@@ -0,0 +1,153 @@
+"""
+Webease Media - Video, audio, image galleries, sliders and embeds
+"""
+
+from . import ctx
+from ..fragments import wrap_each
+
+# ==================== MEDIA ====================
+
+def add_video(src, width="", height="", controls=True):
+    """Add a video"""
+    width_attr = f' width="{width}"' if width else ''
+    height_attr = f' height="{height}"' if height else ''
+    controls_attr = ' controls' if controls else ''
+    ctx.add_html(f'<video src="{src}"{width_attr}{height_attr}{controls_attr}></video>')
+
+def add_audio(src, controls=True):
+    """Add audio"""
+    controls_attr = ' controls' if controls else ''
+    ctx.add_html(f'<audio src="{src}"{controls_attr}></audio>')
+
+def add_iframe(src, width="100%", height="400px"):
+    """Add an iframe"""
+    ctx.add_html(f'<iframe src="{src}" width="{width}" height="{height}"></iframe>')
+
+def add_embed(src, width="", height=""):
+    """Add embedded content"""
+    width_attr = f' width="{width}"' if width else ''
+    height_attr = f' height="{height}"' if height else ''
+    ctx.add_html(f'<embed src="{src}"{width_attr}{height_attr}>')
+
+# ==================== CAROUSEL & SLIDER ====================
+
+def create_carousel(images, css_class="carousel"):
+    """Create an image carousel"""
+    ctx.add_css(f'.{css_class} {{ position: relative; width: 100%; overflow: hidden; }} .{css_class}-item {{ display: none; width: 100%; }} .{css_class}-item.active {{ display: block; }}')
+    for i, img in enumerate(images):
+        active = ' active' if i == 0 else ''
+        ctx.add_html(f'<div class="{css_class}-item{active}"><img src="{img}" style="width: 100%;"></div>')
+
+# ==================== IMAGE GALLERY ====================
+
+def create_image_gallery(images, columns=3, gap="10px", css_class="gallery"):
+    """Create an image gallery"""
+    ctx.add_css(f'.{css_class} {{ display: grid; grid-template-columns: repeat({columns}, 1fr); gap: {gap}; }} .{css_class} img {{ width: 100%; height: 200px; object-fit: cover; border-radius: 8px; cursor: pointer; transition: transform 0.3s; }} .{css_class} img:hover {{ transform: scale(1.05); }}')
+    image_html = []
+    for img in images:
+        if isinstance(img, dict):
+            src = img.get('src', '')
+            alt = img.get('alt', '')
+        else:
+            src = img
+            alt = ''
+        image_html.append(f'<img src="{src}" alt="{alt}">')
+    ctx.add_html(f'<div class="{css_class}">{"".join(image_html)}</div>')
+
+def create_masonry_gallery(images, css_class="masonry"):
+    """Create a masonry-style gallery"""
+    ctx.add_css(f'.{css_class} {{ column-count: 3; column-gap: 15px; }} .{css_class} img {{ width: 100%; margin-bottom: 15px; border-radius: 8px; }} @media (max-width: 768px) {{ .{css_class} {{ column-count: 2; }} }} @media (max-width: 480px) {{ .{css_class} {{ column-count: 1; }} }}')
+    ctx.add_html(f'<div class="{css_class}">' + wrap_each(images, '<img src="', '">') + '</div>')
+
+def add_lightbox(image_selector=".gallery img"):
+    """Add lightbox effect to images"""
+    ctx.add_css('.lightbox { display: none; position: fixed; z-index: 9999; left: 0; top: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.9); } .lightbox img { position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); max-width: 90%; max-height: 90%; } .lightbox-close { position: absolute; top: 20px; right: 40px; color: white; font-size: 40px; cursor: pointer; }')
+    ctx.add_html('<div class="lightbox"><span class="lightbox-close">&times;</span><img src="" alt=""></div>')
+    ctx.add_js(f'''
+    document.querySelectorAll('{image_selector}').forEach(img => {{
+        img.addEventListener('click', function() {{
+            const lightbox = document.querySelector('.lightbox');
+            const lightboxImg = lightbox.querySelector('img');
+            lightboxImg.src = this.src;
+            lightbox.style.display = 'block';
+        }});
+    }});
+    document.querySelector('.lightbox-close').addEventListener('click', function() {{
+        document.querySelector('.lightbox').style.display = 'none';
+    }});
+    document.querySelector('.lightbox').addEventListener('click', function(e) {{
+        if (e.target === this) this.style.display = 'none';
+    }});
+    ''')
+
+# ==================== ADVANCED SLIDERS ====================
+
+def create_image_slider(images, auto_play=True, interval=3000, css_class="slider"):
+    """Create an image slider with controls"""
+    ctx.add_css(f'.{css_class} {{ position: relative; width: 100%; max-width: 800px; margin: 0 auto; overflow: hidden; border-radius: 12px; }} .{css_class}-track {{ display: flex; transition: transform 0.5s ease; }} .{css_class}-slide {{ min-width: 100%; height: 400px; }} .{css_class}-slide img {{ width: 100%; height: 100%; object-fit: cover; }} .{css_class}-btn {{ position: absolute; top: 50%; transform: translateY(-50%); background: rgba(255,255,255,0.8); border: none; padding: 15px; cursor: pointer; font-size: 20px; border-radius: 50%; }} .{css_class}-prev {{ left: 20px; }} .{css_class}-next {{ right: 20px; }} .{css_class}-dots {{ text-align: center; padding: 15px 0; }} .{css_class}-dot {{ display: inline-block; width: 12px; height: 12px; border-radius: 50%; background: #ddd; margin: 0 5px; cursor: pointer; }} .{css_class}-dot.active {{ background: #667eea; }}')
+    
+    slides = wrap_each([f'<img src="{img}">' for img in images], f'<div class="{css_class}-slide">', '</div>')
+    dots = ''.join([f'<span class="{css_class}-dot{" active" if i == 0 else ""}" data-slide="{i}"></span>'
+                    for i in range(len(images))])
+    ctx.add_html(f'<div class="{css_class}"><div class="{css_class}-track">{slides}</div>'
+                 f'<button class="{css_class}-btn {css_class}-prev">&#10094;</button>'
+                 f'<button class="{css_class}-btn {css_class}-next">&#10095;</button>'
+                 f'<div class="{css_class}-dots">{dots}</div></div>')
+    
+    ctx.add_js(f'''
+    (function() {{
+        const slider = document.querySelector('.{css_class}');
+        const track = slider.querySelector('.{css_class}-track');
+        const slides = slider.querySelectorAll('.{css_class}-slide');
+        const prev = slider.querySelector('.{css_class}-prev');
+        const next = slider.querySelector('.{css_class}-next');
+        const dots = slider.querySelectorAll('.{css_class}-dot');
+        let current = 0;
+        
+        function goToSlide(n) {{
+            current = (n + slides.length) % slides.length;
+            track.style.transform = `translateX(-${{current * 100}}%)`;
+            dots.forEach((dot, i) => dot.classList.toggle('active', i === current));
+        }}
+        
+        prev.addEventListener('click', () => goToSlide(current - 1));
+        next.addEventListener('click', () => goToSlide(current + 1));
+        dots.forEach((dot, i) => dot.addEventListener('click', () => goToSlide(i)));
+        
+        {'setInterval(() => goToSlide(current + 1), ' + str(interval) + ');' if auto_play else ''}
+    }})();
+    ''')
+
+# ==================== VIDEO BACKGROUNDS ====================
+
+def add_video_background(video_src, css_class="video-bg"):
+    """Add a video background"""
+    ctx.add_css(f'.{css_class} {{ position: fixed; top: 0; left: 0; width: 100%; height: 100%; object-fit: cover; z-index: -1; }} .{css_class}-overlay {{ position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.5); z-index: -1; }}')
+    ctx.add_html(f'<video class="{css_class}" autoplay muted loop><source src="{video_src}" type="video/mp4"></video><div class="{css_class}-overlay"></div>')
+
+# ==================== SOCIAL MEDIA EMBEDS ====================
+
+def embed_youtube(video_id, width="560", height="315"):
+    """Embed a YouTube video"""
+    ctx.add_html(f'<iframe width="{width}" height="{height}" src="https://www.youtube.com/embed/{video_id}" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture" allowfullscreen></iframe>')
+
+def embed_twitter_timeline(username):
+    """Embed Twitter timeline"""
+    ctx.add_html(f'<a class="twitter-timeline" href="https://twitter.com/{username}">Tweets by {username}</a>')
+    ctx.add_head('<script async src="https://platform.twitter.com/widgets.js"></script>')
+
+def add_social_share_buttons(url="", text=""):
+    """Add social media share buttons"""
+    share_url = url or "window.location.href"
+    share_text = text or "document.title"
+    
+    ctx.add_css('.social-share { display: flex; gap: 10px; margin: 20px 0; } .social-share button { padding: 10px 20px; border: none; border-radius: 4px; color: white; cursor: pointer; font-size: 14px; } .social-share .twitter { background: #1DA1F2; } .social-share .facebook { background: #4267B2; } .social-share .linkedin { background: #0077B5; }')
+    
+    ctx.add_html(f'<div class="social-share"><button class="twitter" onclick="window.open(\'https://twitter.com/intent/tweet?url=\'+encodeURIComponent({share_url})+\'&text=\'+encodeURIComponent({share_text}), \'_blank\')">Share on Twitter</button><button class="facebook" onclick="window.open(\'https://www.facebook.com/sharer/sharer.php?u=\'+encodeURIComponent({share_url}), \'_blank\')">Share on Facebook</button><button class="linkedin" onclick="window.open(\'https://www.linkedin.com/sharing/share-offsite/?url=\'+encodeURIComponent({share_url}), \'_blank\')">Share on LinkedIn</button></div>')
+
+# ==================== MAPS ====================
+
+def embed_google_map(address, width="100%", height="400px"):
+    """Embed Google Map"""
+    encoded_address = address.replace(' ', '+')
+    ctx.add_html(f'<iframe width="{width}" height="{height}" frameborder="0" src="https://www.google.com/maps?q={encoded_address}&output=embed"></iframe>')
@@ -0,0 +1,32 @@
+"""
+Webease Page - Page title, meta tags, favicon and external stylesheets and scripts
+"""
+
+from . import ctx
+
+# ==================== UTILITY FUNCTIONS ====================
+
+def set_title(title):
+    """Set page title"""
+    ctx.add_head(f'<title>{title}</title>')
+
+def add_favicon(href):
+    """Add favicon"""
+    ctx.add_head(f'<link rel="icon" href="{href}">')
+
+def add_meta(name, content):
+    """Add meta tag"""
+    ctx.add_head(f'<meta name="{name}" content="{content}">')
+
+def add_external_css(href):
+    """Add external CSS"""
+    ctx.add_head(f'<link rel="stylesheet" href="{href}">')
+
+def add_external_js(src):
+    """Add external JavaScript"""
+    ctx.add_head(f'<script src="{src}"></script>')
+
+def add_google_font(font_name):
+    """Add Google Font"""
+    font_url = font_name.replace(' ', '+')
+    ctx.add_head(f'<link href="https://fonts.googleapis.com/css2?family={font_url}&display=swap" rel="stylesheet">')
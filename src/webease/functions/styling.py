@@ -0,0 +1,112 @@
+"""
+Webease Styling - Page colors, fonts, borders, shadows and responsive rules
+"""
+
+from . import ctx
+
+# ==================== STYLING FUNCTIONS ====================
+
+def set_background(color):
+    """Set page background color"""
+    ctx.add_css(f'body {{ background-color: {color}; }}')
+
+def set_background_gradient(color1, color2, direction="to bottom"):
+    """Set background gradient"""
+    ctx.add_css(f'body {{ background: linear-gradient({direction}, {color1}, {color2}); }}')
+
+def set_font(family, size="16px"):
+    """Set page font"""
+    ctx.add_css(f'body {{ font-family: {family}; font-size: {size}; }}')
+
+def set_text_color(color):
+    """Set page text color"""
+    ctx.add_css(f'body {{ color: {color}; }}')
+
+def set_page_margin(margin):
+    """Set page margin"""
+    ctx.add_css(f'body {{ margin: {margin}; }}')
+
+def set_page_padding(padding):
+    """Set page padding"""
+    ctx.add_css(f'body {{ padding: {padding}; }}')
+
+def add_custom_css(css):
+    """Add custom CSS"""
+    ctx.add_css(css)
+
+def add_style_to_element(selector, property_name, value):
+    """Add a style to an element"""
+    ctx.add_css(f'{selector} {{ {property_name}: {value}; }}')
+
+# ==================== RESPONSIVE DESIGN ====================
+
+def set_mobile_breakpoint(max_width="768px"):
+    """Set mobile breakpoint"""
+    ctx.add_css(f'@media (max-width: {max_width}) {{ .container {{ padding: 10px; }} .row {{ flex-direction: column; }} }}')
+
+def add_responsive_text(selector, mobile_size="14px", desktop_size="16px"):
+    """Add responsive text sizing"""
+    ctx.add_css(f'{selector} {{ font-size: {desktop_size}; }} @media (max-width: 768px) {{ {selector} {{ font-size: {mobile_size}; }} }}')
+
+def hide_on_mobile(selector):
+    """Hide element on mobile"""
+    ctx.add_css(f'@media (max-width: 768px) {{ {selector} {{ display: none; }} }}')
+
+def hide_on_desktop(selector):
+    """Hide element on desktop"""
+    ctx.add_css(f'@media (min-width: 769px) {{ {selector} {{ display: none; }} }}')
+
+# ==================== ADVANCED STYLING ====================
+
+def add_box_shadow(selector, shadow="0 4px 6px rgba(0,0,0,0.1)"):
+    """Add box shadow"""
+    ctx.add_css(f'{selector} {{ box-shadow: {shadow}; }}')
+
+def add_text_shadow(selector, shadow="2px 2px 4px rgba(0,0,0,0.3)"):
+    """Add text shadow"""
+    ctx.add_css(f'{selector} {{ text-shadow: {shadow}; }}')
+
+def add_border(selector, width="1px", style="solid", color="#ddd"):
+    """Add border"""
+    ctx.add_css(f'{selector} {{ border: {width} {style} {color}; }}')
+
+def add_border_radius(selector, radius="4px"):
+    """Add border radius"""
+    ctx.add_css(f'{selector} {{ border-radius: {radius}; }}')
+
+def set_opacity(selector, opacity=1.0):
+    """Set opacity"""
+    ctx.add_css(f'{selector} {{ opacity: {opacity}; }}')
+
+def add_transform(selector, transform):
+    """Add CSS transform"""
+    ctx.add_css(f'{selector} {{ transform: {transform}; }}')
+
+def add_transition(selector, property_name="all", duration="0.3s", timing="ease"):
+    """Add CSS transition"""
+    ctx.add_css(f'{selector} {{ transition: {property_name} {duration} {timing}; }}')
+
+# ==================== DARK MODE ====================
+
+def enable_dark_mode():
+    """Enable dark mode"""
+    ctx.add_css('body.dark-mode { background: #1a1a1a; color: #f0f0f0; } body.dark-mode a { color: #64b5f6; }')
+    ctx.add_js('document.body.classList.add("dark-mode");')
+
+def add_dark_mode_toggle():
+    """Add dark mode toggle button"""
+    ctx.add_html('<button id="dark-mode-toggle">Toggle Dark Mode</button>')
+    ctx.add_js('''
+    document.getElementById('dark-mode-toggle').addEventListener('click', function() {
+        document.body.classList.toggle('dark-mode');
+    });
+    ''')
+    ctx.add_css('body.dark-mode { background: #1a1a1a; color: #f0f0f0; transition: background 0.3s, color 0.3s; }')
+
+# ==================== COLOR UTILITIES ====================
+
+def create_color_palette(colors, css_class="color-palette"):
+    """Display a color palette"""
+    ctx.add_css(f'.{css_class} {{ display: flex; gap: 10px; margin: 20px 0; }} .{css_class}-color {{ width: 100px; height: 100px; border-radius: 8px; display: flex; align-items: flex-end; justify-content: center; padding-bottom: 10px; color: white; font-size: 12px; font-family: monospace; }}')
+    swatches = ''.join([f'<div class="{css_class}-color" style="background: {color};">{color}</div>' for color in colors])
+    ctx.add_html(f'<div class="{css_class}">{swatches}</div>')
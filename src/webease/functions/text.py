@@ -0,0 +1,139 @@
+"""
+Webease Text - Headings, paragraphs, lists, inline formatting and icons
+"""
+
+from . import ctx
+from ..fragments import wrap_each
+
+# ==================== BASIC HTML ELEMENTS ====================
+
+def add_title(text, level=1):
+    """Add a heading (h1-h6)"""
+    ctx.add_html(f'<h{level}>{text}</h{level}>')
+
+def add_text(text):
+    """Add a paragraph of text"""
+    ctx.add_html(f'<p>{text}</p>')
+
+def add_heading(text, level=1):
+    """Add a heading (alias for add_title)"""
+    add_title(text, level)
+
+def add_paragraph(text):
+    """Add a paragraph (alias for add_text)"""
+    add_text(text)
+
+def add_div(content="", css_class="", element_id=""):
+    """Add a div container"""
+    class_attr = f' class="{css_class}"' if css_class else ''
+    id_attr = f' id="{element_id}"' if element_id else ''
+    ctx.add_html(f'<div{class_attr}{id_attr}>{content}</div>')
+
+def add_span(content="", css_class=""):
+    """Add an inline span"""
+    class_attr = f' class="{css_class}"' if css_class else ''
+    ctx.add_html(f'<span{class_attr}>{content}</span>')
+
+def add_link(url, text, target="_self"):
+    """Add a hyperlink"""
+    ctx.add_html(f'<a href="{url}" target="{target}">{text}</a>')
+
+def add_image(src, alt="", width="", height=""):
+    """Add an image"""
+    width_attr = f' width="{width}"' if width else ''
+    height_attr = f' height="{height}"' if height else ''
+    ctx.add_html(f'<img src="{src}" alt="{alt}"{width_attr}{height_attr}>')
+
+def add_list(items, ordered=False):
+    """Add a list (ordered or unordered)"""
+    tag = 'ol' if ordered else 'ul'
+    ctx.add_html(f'<{tag}>{wrap_each(items, "<li>", "</li>")}</{tag}>')
+
+def add_ordered_list(items):
+    """Add an ordered list"""
+    add_list(items, ordered=True)
+
+def add_unordered_list(items):
+    """Add an unordered list"""
+    add_list(items, ordered=False)
+
+# ==================== TEXT FORMATTING ====================
+
+def add_bold(text):
+    """Add bold text"""
+    ctx.add_html(f'<strong>{text}</strong>')
+
+def add_italic(text):
+    """Add italic text"""
+    ctx.add_html(f'<em>{text}</em>')
+
+def add_underline(text):
+    """Add underlined text"""
+    ctx.add_html(f'<u>{text}</u>')
+
+def add_strikethrough(text):
+    """Add strikethrough text"""
+    ctx.add_html(f'<s>{text}</s>')
+
+def add_code(text):
+    """Add inline code"""
+    ctx.add_html(f'<code>{text}</code>')
+
+def add_code_block(code, language=""):
+    """Add a code block"""
+    lang_class = f' class="language-{language}"' if language else ''
+    ctx.add_html(f'<pre><code{lang_class}>{code}</code></pre>')
+
+def add_superscript(text):
+    """Add superscript text"""
+    ctx.add_html(f'<sup>{text}</sup>')
+
+def add_subscript(text):
+    """Add subscript text"""
+    ctx.add_html(f'<sub>{text}</sub>')
+
+def add_quote(text):
+    """Add a blockquote"""
+    ctx.add_html(f'<blockquote>{text}</blockquote>')
+
+def add_small(text):
+    """Add small text"""
+    ctx.add_html(f'<small>{text}</small>')
+
+def add_mark(text):
+    """Add highlighted/marked text"""
+    ctx.add_html(f'<mark>{text}</mark>')
+
+# ==================== LINE BREAKS & SEPARATORS ====================
+
+def add_br(count=1):
+    """Add line breaks"""
+    ctx.add_html('<br>' * count)
+
+def add_hr():
+    """Add a horizontal rule"""
+    ctx.add_html('<hr>')
+
+def add_space(count=1):
+    """Add non-breaking spaces"""
+    ctx.add_html('&nbsp;' * count)
+
+# ==================== ICONS & SYMBOLS ====================
+
+def add_icon(icon_class, size="24px"):
+    """Add an icon (FontAwesome or similar)"""
+    ctx.add_html(f'<i class="{icon_class}" style="font-size: {size};"></i>')
+
+def add_emoji(emoji):
+    """Add emoji"""
+    ctx.add_html(emoji)
+
+# ==================== TYPOGRAPHY ====================
+
+def add_dropcap(selector):
+    """Add drop cap to first letter"""
+    ctx.add_css(f'{selector}::first-letter {{ float: left; font-size: 75px; line-height: 60px; padding: 8px 8px 0 0; font-weight: bold; color: #667eea; }}')
+
+def add_text_gradient(selector, color1="#667eea", color2="#764ba2"):
+    """Add gradient text effect"""
+    ctx.add_css(f'{selector} {{ background: linear-gradient(90deg, {color1}, {color2}); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text; }}')
@@ -0,0 +1,125 @@
+"""
+Webease Widgets - Modals, alerts, badges, tooltips, progress bars and timers
+"""
+
+from . import ctx
+from ..fragments import wrap_each
+
+# ==================== MODALS & DIALOGS ====================
+
+def create_modal(modal_id, title, content, css_class="modal"):
+    """Create a modal dialog"""
+    ctx.add_css(f'.{css_class} {{ display: none; position: fixed; z-index: 1000; left: 0; top: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.5); }} .{css_class}-content {{ background: white; margin: 10% auto; padding: 20px; border-radius: 8px; width: 80%; max-width: 500px; position: relative; }} .{css_class}-close {{ position: absolute; right: 15px; top: 10px; font-size: 28px; cursor: pointer; }}')
+    modal_html = f'<div id="{modal_id}" class="{css_class}"><div class="{css_class}-content"><span class="{css_class}-close">&times;</span><h2>{title}</h2><p>{content}</p></div></div>'
+    ctx.add_html(modal_html)
+
+def add_alert(message, alert_type="info"):
+    """Add an alert message"""
+    colors = {
+        'info': '#2196F3',
+        'success': '#4CAF50',
+        'warning': '#ff9800',
+        'error': '#f44336'
+    }
+    color = colors.get(alert_type, '#2196F3')
+    ctx.add_css(f'.alert-{alert_type} {{ background: {color}; color: white; padding: 15px; margin: 10px 0; border-radius: 4px; }}')
+    ctx.add_html(f'<div class="alert-{alert_type}">{message}</div>')
+
+def add_toast(message, duration=3000):
+    """Add a toast notification"""
+    ctx.add_css('.toast { position: fixed; bottom: 20px; right: 20px; background: #333; color: white; padding: 15px 20px; border-radius: 4px; z-index: 1000; }')
+    ctx.add_html(f'<div class="toast">{message}</div>')
+    ctx.add_js(f'setTimeout(() => {{ document.querySelector(".toast").remove(); }}, {duration});')
+
+# ==================== PROGRESS & LOADING ====================
+
+def add_progress_bar(value=50, max_val=100, css_class="progress"):
+    """Add a progress bar"""
+    percentage = (value / max_val) * 100
+    ctx.add_css(f'.{css_class} {{ width: 100%; background: #f0f0f0; border-radius: 4px; overflow: hidden; }} .{css_class}-bar {{ height: 20px; background: #007bff; transition: width 0.3s; }}')
+    ctx.add_html(f'<div class="{css_class}"><div class="{css_class}-bar" style="width: {percentage}%;"></div></div>')
+
+def add_spinner(size="40px", color="#007bff"):
+    """Add a loading spinner"""
+    ctx.add_css(f'.spinner {{ border: 4px solid #f3f3f3; border-top: 4px solid {color}; border-radius: 50%; width: {size}; height: {size}; animation: spin 1s linear infinite; }} @keyframes spin {{ 0% {{ transform: rotate(0deg); }} 100% {{ transform: rotate(360deg); }} }}')
+    ctx.add_html('<div class="spinner"></div>')
+
+def add_skeleton_loader(width="100%", height="20px"):
+    """Add skeleton loader"""
+    ctx.add_css(f'.skeleton {{ background: linear-gradient(90deg, #f0f0f0 25%, #e0e0e0 50%, #f0f0f0 75%); background-size: 200% 100%; animation: loading 1.5s infinite; width: {width}; height: {height}; border-radius: 4px; }} @keyframes loading {{ 0% {{ background-position: 200% 0; }} 100% {{ background-position: -200% 0; }} }}')
+    ctx.add_html('<div class="skeleton"></div>')
+
+# ==================== BADGES & LABELS ====================
+
+def add_badge(text, color="#007bff"):
+    """Add a badge"""
+    ctx.add_css(f'.badge {{ display: inline-block; padding: 4px 8px; background: {color}; color: white; border-radius: 12px; font-size: 12px; }}')
+    ctx.add_html(f'<span class="badge">{text}</span>')
+
+def add_pill(text, color="#6c757d"):
+    """Add a pill badge"""
+    ctx.add_css(f'.pill {{ display: inline-block; padding: 6px 16px; background: {color}; color: white; border-radius: 20px; font-size: 14px; }}')
+    ctx.add_html(f'<span class="pill">{text}</span>')
+
+# ==================== TOOLTIPS ====================
+
+def add_tooltip(text, tooltip_text):
+    """Add tooltip to text"""
+    ctx.add_css('.tooltip { position: relative; display: inline-block; } .tooltip .tooltiptext { visibility: hidden; background-color: #555; color: #fff; text-align: center; border-radius: 6px; padding: 5px 10px; position: absolute; z-index: 1; bottom: 125%; left: 50%; transform: translateX(-50%); opacity: 0; transition: opacity 0.3s; } .tooltip:hover .tooltiptext { visibility: visible; opacity: 1; }')
+    ctx.add_html(f'<span class="tooltip">{text}<span class="tooltiptext">{tooltip_text}</span></span>')
+
+# ==================== PRICING TABLES ====================
+
+def create_pricing_card(title, price, features, button_text="Choose Plan"):
+    """Create a pricing card"""
+    ctx.add_css('.pricing-card { border: 1px solid #ddd; border-radius: 8px; padding: 30px; text-align: center; margin: 10px; } .pricing-card h3 { margin-bottom: 20px; } .pricing-card .price { font-size: 36px; font-weight: bold; margin: 20px 0; } .pricing-card ul { list-style: none; padding: 0; margin: 20px 0; } .pricing-card li { padding: 10px 0; border-bottom: 1px solid #f0f0f0; }')
+    ctx.add_html(f'<div class="pricing-card"><h3>{title}</h3><div class="price">{price}</div>'
+                 f'<ul>{wrap_each(features, "<li>", "</li>")}</ul><button>{button_text}</button></div>')
+
+# ==================== TIMELINE ====================
+
+def create_timeline(events, css_class="timeline"):
+    """Create a timeline"""
+    ctx.add_css(f'.{css_class} {{ position: relative; padding: 20px 0; }} .{css_class}::before {{ content: ""; position: absolute; left: 50%; width: 2px; background: #ddd; top: 0; bottom: 0; }} .{css_class}-item {{ position: relative; margin: 20px 0; }} .{css_class}-content {{ background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); width: 45%; }} .{css_class}-item:nth-child(odd) .{css_class}-content {{ margin-left: 55%; }} .{css_class}-item:nth-child(even) .{css_class}-content {{ margin-right: 55%; }}')
+    for event in events:
+        if isinstance(event, dict):
+            content = f"<strong>{event.get('title', '')}</strong><p>{event.get('description', '')}</p>"
+        else:
+            content = event
+        ctx.add_html(f'<div class="{css_class}-item"><div class="{css_class}-content">{content}</div></div>')
+
+# ==================== COUNTDOWN TIMER ====================
+
+def create_countdown(target_date, css_class="countdown"):
+    """Create a countdown timer"""
+    ctx.add_css(f'.{css_class} {{ display: flex; justify-content: center; gap: 30px; padding: 30px; }} .{css_class}-item {{ text-align: center; }} .{css_class}-number {{ font-size: 48px; font-weight: bold; color: #667eea; }} .{css_class}-label {{ font-size: 14px; color: #666; text-transform: uppercase; }}')
+    
+    ctx.add_html(f'<div class="{css_class}"><div class="{css_class}-item"><div class="{css_class}-number" id="days">0</div><div class="{css_class}-label">Days</div></div><div class="{css_class}-item"><div class="{css_class}-number" id="hours">0</div><div class="{css_class}-label">Hours</div></div><div class="{css_class}-item"><div class="{css_class}-number" id="minutes">0</div><div class="{css_class}-label">Minutes</div></div><div class="{css_class}-item"><div class="{css_class}-number" id="seconds">0</div><div class="{css_class}-label">Seconds</div></div></div>')
+    
+    ctx.add_js(f'''
+    const targetDate = new Date('{target_date}').getTime();
+    function updateCountdown() {{
+        const now = new Date().getTime();
+        const distance = targetDate - now;
+        
+        if (distance < 0) {{
+            document.getElementById('days').innerHTML = '0';
+            document.getElementById('hours').innerHTML = '0';
+            document.getElementById('minutes').innerHTML = '0';
+            document.getElementById('seconds').innerHTML = '0';
+            return;
+        }}
+        
+        const days = Math.floor(distance / (1000 * 60 * 60 * 24));
+        const hours = Math.floor((distance % (1000 * 60 * 60 * 24)) / (1000 * 60 * 60));
+        const minutes = Math.floor((distance % (1000 * 60 * 60)) / (1000 * 60));
+        const seconds = Math.floor((distance % (1000 * 60)) / 1000);
+        
+        document.getElementById('days').innerHTML = days;
+        document.getElementById('hours').innerHTML = hours;
+        document.getElementById('minutes').innerHTML = minutes;
+        document.getElementById('seconds').innerHTML = seconds;
+    }}
+    updateCountdown();
+    setInterval(updateCountdown, 1000);
+    ''')
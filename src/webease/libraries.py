@@ -0,0 +1,149 @@
+"""
+Webease Libraries - Process-wide cache of parsed .wl component libraries
+"""
+
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+
+from .components import ComponentTemplate
+
+
+DEFAULT_SEARCH_PATH = ('libraries', '.')
+LIBRARY_PATH_ENV = 'WEBEASE_LIBRARY_PATH'
+LIBRARY_SUFFIX = '.wl'
+
+COMPONENT_PATTERN = re.compile(r'component\s+(\w+)\s*\{')
+
+
+def default_search_path():
+    """Directories from $WEBEASE_LIBRARY_PATH, followed by libraries/ and the current directory"""
+    extra = os.environ.get(LIBRARY_PATH_ENV, '')
+    return tuple(entry for entry in extra.split(os.pathsep) if entry) + DEFAULT_SEARCH_PATH
+
+
+def parse_library(code):
+    """Compile the components in a .wl file into a {name: ComponentTemplate} table"""
+    components = {}
+    lines = code.split('\n')
+    count = len(lines)
+    i = 0
+    while i < count:
+        line = lines[i].strip()
+        i += 1
+        if not line.startswith('component '):
+            continue
+        comp_match = COMPONENT_PATTERN.match(line)
+        if not comp_match:
+            continue
+
+        comp_name = comp_match.group(1)
+        comp_code = []
+        brace_count = 1
+        while i < count and brace_count > 0:
+            current_line = lines[i]
+            brace_count += current_line.count('{') - current_line.count('}')
+            if brace_count > 0:
+                comp_code.append(current_line)
+            elif brace_count == 0 and current_line.strip() != '}':
+                comp_code.append(current_line.rstrip('}'))
+            i += 1
+
+        components[comp_name] = ComponentTemplate(comp_name, '\n'.join(comp_code).strip())
+    return components
+
+
+class LibraryEntry:
+    """A parsed library and the file state it was parsed from"""
+
+    __slots__ = ('mtime_ns', 'size', 'hash', 'components')
+
+    def __init__(self, mtime_ns, size, hash, components):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.hash = hash
+        self.components = components
+
+
+class LibraryRegistry:
+    """Resolves library names on a search path and caches their parsed components
+
+    An entry is reused while the file's mtime and size are unchanged. When
+    they differ the file is re-hashed, and only re-parsed if its content
+    actually changed. The registry is safe to share between threads.
+    """
+
+    def __init__(self, search_path=None):
+        self.search_path = tuple(search_path) if search_path is not None else default_search_path()
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, library_name):
+        """Find a library on the search path, returning (path, stat)"""
+        filename = f'{library_name}{LIBRARY_SUFFIX}'
+        for directory in self.search_path:
+            path = Path(directory) / filename
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            return path, stat
+        raise FileNotFoundError(f"Library '{library_name}' not found")
+
+    def load(self, library_name):
+        """Return (path, components) for a library, parsing it only if it changed"""
+        path, stat = self.resolve(library_name)
+        key = os.path.abspath(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self.hits += 1
+                return path, entry.components
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.hash == digest:
+                entry.mtime_ns = stat.st_mtime_ns
+                entry.size = stat.st_size
+                self.hits += 1
+                return path, entry.components
+            self.misses += 1
+
+        # The hash covers the raw bytes; parsing gets the newlines text-mode open() would give
+        text = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        components = parse_library(text)
+        with self._lock:
+            self._entries[key] = LibraryEntry(stat.st_mtime_ns, stat.st_size, digest, components)
+        return path, components
+
+    def clear(self):
+        """Forget every cached library"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {
+            'search_path': list(self.search_path),
+            'libraries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+default_registry = LibraryRegistry()
+
+
+def registry_for(library_path=()):
+    """The shared registry, or a new one that searches library_path first"""
+    if not library_path:
+        return default_registry
+    return LibraryRegistry(tuple(library_path) + default_search_path())
@@ -0,0 +1,171 @@
+"""
+Webease Live - Compile pages on request for 'webease serve --live'
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .build import encoded_chunks, file_record, record_matches
+from .cache import ParseCache
+from .compiler import WebeaseCompiler
+from .compress import write_variants
+from .libraries import registry_for
+
+
+DEFAULT_LIVE_CACHE_SIZE = 64 * 1024 * 1024
+DEFAULT_LIVE_WORKERS = 4
+
+
+class LivePage:
+    """A rendered page and the file records it was rendered from"""
+
+    __slots__ = ('page', 'source', 'dependencies', 'body', 'encoded', 'size', 'etag')
+
+    def __init__(self, page, source, dependencies, body, encoded=None):
+        self.page = page
+        self.source = source
+        self.dependencies = dependencies
+        self.body = body
+        self.encoded = encoded or {}
+        self.size = len(body) + sum(len(data) for data in self.encoded.values())
+
+        digest = hashlib.sha256(source['hash'].encode('ascii'))
+        for dep in sorted(dependencies):
+            digest.update(f'\0{dep}\0{dependencies[dep]["hash"]}'.encode('utf-8'))
+        self.etag = f'"{digest.hexdigest()[:32]}"'
+
+    def is_current(self):
+        """True if the source and every library are unchanged since rendering"""
+        return record_matches(self.page, self.source) and all(
+            record_matches(dep, record) for dep, record in self.dependencies.items()
+        )
+
+
+class PageError(Exception):
+    """A page failed to compile; the message is the compiler's formatted error"""
+
+
+class LiveSite:
+    """Renders .ws pages on demand and keeps the results in a bounded LRU cache
+
+    Entries are validated against their source and library files on every
+    hit (a stat per file, plus a hash if the stat changed). Concurrent
+    requests for a page that is being compiled all wait on the same compile.
+    """
+
+    def __init__(self, source_dir, max_size=DEFAULT_LIVE_CACHE_SIZE, use_cache=True, minify=False,
+                 library_path=(), workers=DEFAULT_LIVE_WORKERS, precompress=('gzip',), compress_level=None):
+        self.source_dir = Path(source_dir)
+        self.max_size = max_size
+        self.use_cache = use_cache
+        self.minify = minify
+        self.precompress = tuple(precompress)
+        self.compress_level = compress_level
+        self.libraries = registry_for(library_path)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='webease-live')
+        self.pages = OrderedDict()
+        self.size = 0
+        self.pending = {}
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+
+    def page_for(self, path):
+        """Find the .ws page that renders a filesystem path, or None"""
+        if os.path.isdir(path):
+            candidate = os.path.join(path, 'index.ws')
+        elif path.endswith('.html'):
+            candidate = path[:-len('.html')] + '.ws'
+        elif not os.path.splitext(path)[1]:
+            candidate = path + '.ws'
+        else:
+            return None
+        return Path(candidate) if os.path.isfile(candidate) else None
+
+    def compiler(self):
+        """One compiler per executor thread"""
+        compiler = getattr(self._local, 'compiler', None)
+        if compiler is None:
+            compiler = WebeaseCompiler(cache=ParseCache() if self.use_cache else None, minify=self.minify,
+                                       libraries=self.libraries)
+            self._local.compiler = compiler
+        return compiler
+
+    def compile(self, page):
+        """Compile a page, recording the state of its inputs first so edits during the compile are noticed"""
+        source = file_record(page)
+        compiler = self.compiler()
+        context, error = compiler.compile_context(page)
+        if not error:
+            # Compressed once here, chunk by chunk as the page renders, so serving
+            # a cached page costs no compression at all
+            body = io.BytesIO()
+            variants = {name: io.BytesIO() for name in self.precompress}
+            try:
+                write_variants(encoded_chunks(compiler.iter_html()), body, variants, self.compress_level)
+            except Exception as e:
+                error = compiler.format_error(e)
+        if error:
+            raise PageError(error)
+        dependencies = {str(dep): file_record(dep) for dep in compiler.dependencies}
+        body = body.getvalue()
+        encoded = {}
+        for name, variant in variants.items():
+            data = variant.getvalue()
+            if len(data) < len(body):
+                encoded[name] = data
+        return LivePage(page, source, dependencies, body, encoded)
+
+    async def render(self, page):
+        """Return (LivePage, was_cached) for a page, compiling it if needed"""
+        key = str(page)
+        entry = self.pages.get(key)
+        if entry is not None:
+            if entry.is_current():
+                self.pages.move_to_end(key)
+                self.hits += 1
+                return entry, True
+            self.discard(key)
+
+        future = self.pending.get(key)
+        if future is None:
+            self.misses += 1
+            future = asyncio.get_running_loop().run_in_executor(self.executor, self.compile, page)
+            self.pending[key] = future
+            future.add_done_callback(lambda done: self.finish(key, done))
+
+        # Shielded so a client that disconnects doesn't cancel the compile for everyone else
+        return await asyncio.shield(future), False
+
+    def finish(self, key, future):
+        del self.pending[key]
+        if not future.cancelled() and future.exception() is None:
+            self.store(key, future.result())
+
+    def store(self, key, entry):
+        if entry.size > self.max_size:
+            return
+        self.discard(key)
+        self.pages[key] = entry
+        self.size += entry.size
+        while self.size > self.max_size:
+            _, evicted = self.pages.popitem(last=False)
+            self.size -= evicted.size
+
+    def discard(self, key):
+        entry = self.pages.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def stats(self):
+        return {'pages': len(self.pages), 'size': self.size, 'max_size': self.max_size,
+                'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        self.executor.shutdown(wait=False)
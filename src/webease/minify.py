@@ -0,0 +1,184 @@
+"""
+Webease Minify - Pure-Python minification of generated HTML, CSS and JS
+
+Each function works on one fragment at a time, so a page is minified
+piece by piece as it is rendered instead of as one big string.
+"""
+
+import re
+
+
+# ==================== CSS ====================
+
+CSS_COMMENT_PATTERN = re.compile(r'("[^"]*"|\'[^\']*\')|/\*.*?\*/', re.DOTALL)
+CSS_STRING_PATTERN = re.compile(r'"[^"]*"|\'[^\']*\'')
+CSS_PUNCTUATION_PATTERN = re.compile(r' ?([{};,>]) ?')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# Strings, brackets and the ': ' that may be shortened inside a declaration block
+CSS_DECLARATION_PATTERN = re.compile(r'"[^"]*"|\'[^\']*\'|[{}();]|: ')
+# At-rules whose blocks hold declarations rather than nested rules
+DECLARATION_AT_RULES = ('@font-face', '@page', '@counter-style', '@property')
+# At-rules whose preludes hold (feature: value) conditions
+CONDITION_AT_RULES = ('@media', '@supports', '@container')
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace from CSS"""
+    css = CSS_COMMENT_PATTERN.sub(lambda match: match.group(1) or '', css)
+    parts = []
+    pos = 0
+    for match in CSS_STRING_PATTERN.finditer(css):
+        parts.append(_compact_css(css[pos:match.start()]))
+        parts.append(match.group())
+        pos = match.end()
+    parts.append(_compact_css(css[pos:]))
+    return _compact_declarations(''.join(parts).strip())
+
+
+def _compact_css(text):
+    text = WHITESPACE_PATTERN.sub(' ', text)
+    text = CSS_PUNCTUATION_PATTERN.sub(r'\1', text)
+    return text.replace(';}', '}')
+
+
+def _compact_declarations(css):
+    """Drop the space after ':' in declarations and @media (feature: value) conditions
+
+    Selectors (a: hover), strings and parentheses inside a declaration,
+    such as an unquoted url(), keep theirs.
+    """
+    if ': ' not in css:
+        return css
+    parts = []
+    pos = 0
+    blocks = []
+    parens = 0
+    prelude_start = 0
+    for match in CSS_DECLARATION_PATTERN.finditer(css):
+        token = match.group()
+        if token == ': ':
+            if blocks and blocks[-1]:
+                shorten = not parens
+            else:
+                shorten = parens and css[prelude_start:match.start()].lstrip().startswith(CONDITION_AT_RULES)
+            if shorten:
+                parts.append(css[pos:match.start() + 1])
+                pos = match.end()
+        elif token == '{':
+            prelude = css[prelude_start:match.start()].lstrip()
+            blocks.append(not prelude.startswith('@') or prelude.startswith(DECLARATION_AT_RULES))
+            prelude_start = match.end()
+        elif token == '}':
+            if blocks:
+                blocks.pop()
+            prelude_start = match.end()
+        elif token == ';':
+            prelude_start = match.end()
+        elif token == '(':
+            parens += 1
+        elif token == ')' and parens:
+            parens -= 1
+    parts.append(css[pos:])
+    return ''.join(parts)
+
+
+# ==================== JAVASCRIPT ====================
+
+def minify_js(js):
+    """Strip comments, indentation and blank lines from JavaScript
+
+    Line breaks are kept so automatic semicolon insertion behaves exactly
+    as before, and lines inside multi-line template literals are left alone.
+    """
+    lines = []
+    in_template = False
+    in_comment = False
+
+    for line in js.split('\n'):
+        if in_template:
+            lines.append(line)
+            if line.count('`') % 2:
+                in_template = False
+            continue
+
+        stripped = line.strip()
+        if in_comment:
+            if '*/' in stripped:
+                in_comment = False
+                stripped = stripped.split('*/', 1)[1].strip()
+            else:
+                continue
+
+        if stripped.startswith('/*'):
+            if '*/' not in stripped:
+                in_comment = True
+                continue
+            stripped = stripped.split('*/', 1)[1].strip()
+
+        if not stripped or stripped.startswith('//'):
+            continue
+
+        lines.append(stripped)
+        if stripped.count('`') % 2:
+            in_template = True
+
+    return '\n'.join(lines)
+
+
+# ==================== HTML ====================
+
+RAW_TAG_PATTERN = re.compile(r'<(/?)(pre|textarea|script|style)\b[^>]*>', re.IGNORECASE)
+HTML_COMMENT_PATTERN = re.compile(r'<!--(?!\[if).*?-->', re.DOTALL)
+
+
+class HTMLMinifier:
+    """Collapses whitespace in HTML fed to it fragment by fragment
+
+    Whitespace runs become a single space, including runs that span two
+    fragments. Content inside <pre>, <textarea>, <script> and <style> is
+    passed through untouched, even when the element is split across fragments.
+    """
+
+    def __init__(self):
+        self.raw_tag = None
+        self.after_space = False
+
+    def feed(self, html):
+        parts = []
+        pos = 0
+        for match in RAW_TAG_PATTERN.finditer(html):
+            closing, tag = match.group(1), match.group(2).lower()
+            if self.raw_tag is None:
+                parts.append(self._collapse(html[pos:match.start()]))
+                parts.append(match.group())
+                self.after_space = False
+                if not closing:
+                    self.raw_tag = tag
+            else:
+                parts.append(html[pos:match.end()])
+                if closing and tag == self.raw_tag:
+                    self.raw_tag = None
+                    self.after_space = False
+            pos = match.end()
+
+        if self.raw_tag is None:
+            parts.append(self._collapse(html[pos:]))
+        else:
+            parts.append(html[pos:])
+        return ''.join(parts)
+
+    def _collapse(self, text):
+        if not text:
+            return text
+        text = HTML_COMMENT_PATTERN.sub('', text)
+        text = WHITESPACE_PATTERN.sub(' ', text)
+        if self.after_space and text.startswith(' '):
+            text = text[1:]
+        if text:
+            self.after_space = text.endswith(' ')
+        return text
+
+
+def minify_html(html):
+    """Minify a complete HTML string"""
+    return HTMLMinifier().feed(html)
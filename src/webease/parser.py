@@ -0,0 +1,412 @@
+"""
+Webease Parser - Tokenizes .ws source and builds a typed AST in one pass
+"""
+
+import gc
+import json
+import re
+
+
+# One match per token. Group 1 is the whitespace in front of the token, the
+# remaining groups are the token kinds; exactly one of them is non-empty.
+TOKEN_PATTERN = re.compile(r'''
+    ([ \t\r\f\v]*)
+    (?:
+        (\n)                                        # newline
+      | ("[^"\n]*"|'[^'\n]*')                       # string
+      | ([()\[\]{},:=])                             # operator
+      | ([^\s()\[\]{},:="']+)                       # bare word, number or comment
+      | (.)                                         # anything else is an error
+    )
+''', re.VERBOSE)
+
+NAME_PATTERN = re.compile(r'\w+\Z')
+
+KEYWORDS = {'True': True, 'False': False, 'None': None}
+
+
+# ==================== AST NODES ====================
+
+class Node:
+    __slots__ = ('line', 'column')
+
+
+class Program(Node):
+    """A parsed .ws file: a sequence of call statements"""
+    __slots__ = ('statements',)
+
+    def __init__(self, statements, line=1, column=1):
+        self.statements = statements
+        self.line = line
+        self.column = column
+
+
+class Call(Node):
+    """A function call such as add_title("Hi", level=2)"""
+    __slots__ = ('name', 'args', 'kwargs')
+
+    def __init__(self, name, args, kwargs, line, column):
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+        self.line = line
+        self.column = column
+
+    def evaluate_arguments(self, call_value=None):
+        """Evaluate argument nodes into Python values
+
+        Calls nested inside the arguments, such as load_data("rows.csv"),
+        are handed to call_value(call).
+        """
+        args = [arg.evaluate(call_value) for arg in self.args]
+        kwargs = {key: value.evaluate(call_value) for key, value in self.kwargs}
+        return args, kwargs
+
+    def evaluate(self, call_value=None):
+        if call_value is None:
+            raise SyntaxError(f"'{self.name}(...)' can't be used as a value here")
+        return call_value(self)
+
+
+class Literal(Node):
+    """A string, number, boolean, None or bare word"""
+    __slots__ = ('value',)
+
+    def __init__(self, value, line, column):
+        self.value = value
+        self.line = line
+        self.column = column
+
+    def evaluate(self, call_value=None):
+        return self.value
+
+
+class ListLiteral(Node):
+    """A list literal such as ["a", "b"]"""
+    __slots__ = ('items',)
+
+    def __init__(self, items, line, column):
+        self.items = items
+        self.line = line
+        self.column = column
+
+    def evaluate(self, call_value=None):
+        return [item.evaluate(call_value) for item in self.items]
+
+
+class DictLiteral(Node):
+    """A dict literal such as {"url": "#", "text": "Home"}"""
+    __slots__ = ('items',)
+
+    def __init__(self, items, line, column):
+        self.items = items
+        self.line = line
+        self.column = column
+
+    def evaluate(self, call_value=None):
+        return {key.evaluate(call_value): value.evaluate(call_value) for key, value in self.items}
+
+
+# ==================== PARSER ====================
+
+def atom_value(text):
+    """Convert a bare word to a Python value, matching the legacy parser"""
+    if text in KEYWORDS:
+        return KEYWORDS[text]
+    try:
+        if '.' in text:
+            return float(text)
+        return int(text)
+    except ValueError:
+        return text
+
+
+# Numbers go through atom_value, so 1e5 stays a string as it does in .ws
+JSON_DECODER = json.JSONDecoder(parse_float=atom_value, parse_constant=atom_value)
+
+# JSON reads these differently: it processes escapes and true/false/null are keywords
+JSON_ONLY = ('\\', 'true', 'false', 'null')
+
+
+# A failed JSON decode counts the lines before the error in the whole string
+# it was given, so literals are decoded from a slice of the source: the
+# first JSON_CHUNK characters, then a slice JSON_GROWTH times longer each
+# time the literal runs past the end. A retry never reads much further than
+# the literal itself, so a list rejected for a trailing comma doesn't make
+# every row inside it decode the rest of the file again.
+JSON_CHUNK = 4096
+JSON_GROWTH = 4
+
+
+def json_literal(code, start):
+    """Decode the list or dict literal at code[start] in a single C-level pass
+
+    Returns (value, end), or None if the literal doesn't read the same as
+    JSON and as .ws - single quotes, True/False/None, bare words, comments,
+    trailing commas and backslashes all take the token-by-token path.
+    """
+    size = JSON_CHUNK
+    while True:
+        try:
+            value, end = JSON_DECODER.raw_decode(code[start:start + size])
+            break
+        except json.JSONDecodeError as e:
+            if start + size >= len(code) or not json_truncated(e):
+                return None
+            size *= JSON_GROWTH
+        except (ValueError, RecursionError):
+            return None
+    end += start
+    for text in JSON_ONLY:
+        if code.find(text, start, end) != -1:
+            return None
+    return value, end
+
+
+def json_truncated(e):
+    """True if a JSON error may only mean the literal runs past the end of the slice"""
+    return e.pos >= len(e.doc) - 16 or e.msg.startswith('Unterminated string')
+
+
+# Parser states: what the next token is allowed to be
+STATEMENT = 0     # a function name, or a blank line
+OPEN_CALL = 1     # the '(' after a function name
+VALUE = 2         # a value, or the closing bracket of the current container
+SEPARATOR = 3     # ',' or the closing bracket after a value
+COLON = 4         # ':' after a dict key
+END = 5           # end of line after a statement
+
+CLOSERS = {')': Call, ']': ListLiteral, '}': DictLiteral}
+
+# Appended to errors on lines that aren't calls, which the legacy parser skipped silently
+NOT_A_CALL = "; lines that aren't function calls need a leading # (--legacy-parser still skips them)"
+
+
+class Frame:
+    """An open call, list or dict on the parser stack"""
+    __slots__ = ('kind', 'items', 'kwargs', 'key', 'line', 'column', 'name')
+
+    def __init__(self, kind, line, column, name=None):
+        self.kind = kind
+        self.items = []
+        self.kwargs = []
+        self.key = None
+        self.line = line
+        self.column = column
+        self.name = name
+
+    def describe(self):
+        if self.kind is Call:
+            return f"'{self.name}('"
+        return "'['" if self.kind is ListLiteral else "'{'"
+
+    def close(self):
+        if self.kind is Call:
+            return Call(self.name, self.items, self.kwargs, self.line, self.column)
+        return self.kind(self.items, self.line, self.column)
+
+
+def unread_value(frame, node, line, column):
+    """Take back the value just added to a frame, so a nested call can replace it"""
+    if frame.kind is DictLiteral and frame.items and frame.items[-1][1] is node:
+        frame.key = frame.items.pop()[0]
+    elif frame.kind is Call and frame.kwargs and frame.kwargs[-1][1] is node:
+        frame.key = frame.kwargs.pop()[0]
+    elif frame.kind is not DictLiteral and frame.items and frame.items[-1] is node:
+        frame.items.pop()
+    else:
+        raise error(line, column, "unexpected '('")
+
+
+def error(line, column, message):
+    return SyntaxError(f"Error on line {line}, column {column}: {message}")
+
+
+def unclosed_hint(stack, frame, line):
+    """Point at the statement's opening bracket when an error comes lines after it"""
+    if frame is None:
+        return ''
+    opened = stack[0] if stack else frame
+    if opened.line == line:
+        return ''
+    return f"; is {opened.describe()} on line {opened.line} closed?"
+
+
+def parse(code):
+    """Parse .ws source code into a Program in a single pass"""
+    # The AST is acyclic, so pausing the cyclic collector while hundreds of
+    # thousands of nodes are allocated avoids repeated full-heap scans.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return parse_program(code)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def parse_program(code):
+    """Parse .ws source code without pausing the garbage collector"""
+    statements = []
+    stack = []
+    frame = None
+    state = STATEMENT
+    pending = None
+    pending_end = None
+    line = 1
+    line_start = 0
+    offset = 0
+
+    # A list or dict that json_literal() decodes in one step is skipped over,
+    # and tokenizing starts again after it
+    resume = 0
+    while resume is not None:
+        tokens = TOKEN_PATTERN.finditer(code, resume)
+        resume = None
+        for match in tokens:
+            space, newline, string, op, atom, other = match.groups()
+            offset += len(space)
+            column = offset - line_start + 1
+            node = None
+            if state == OPEN_CALL and op != '(':
+                raise error(line, column, f"expected '(' after the function name{NOT_A_CALL}")
+            if op == ':' and frame is not None and frame.kind is not DictLiteral:
+                # Outside a dict a colon is text, as in link(url=https://example.com)
+                atom, op = op, None
+
+            if string:
+                offset += len(string)
+                if state != VALUE:
+                    hint = NOT_A_CALL if state == STATEMENT else ''
+                    raise error(line, column, f"unexpected string {string}{hint}")
+                node = Literal(string[1:-1], line, column)
+
+            elif atom:
+                start = offset
+                if atom[0] == '#' and (frame is None or start - len(space) == line_start):
+                    # A comment runs to the end of the line. Anywhere else inside a
+                    # call '#' is text, so set_background(#f0f0f0) keeps working.
+                    end = code.find('\n', start)
+                    offset = resume = end if end != -1 else len(code)
+                    break
+                offset += len(atom)
+                if state == VALUE:
+                    node = Literal(atom_value(atom), line, column)
+                    pending = (atom, node, start)
+                    pending_end = offset
+                elif state == SEPARATOR and pending is not None and pending_end == start - len(space):
+                    # Bare words separated only by spaces are one value, as in the
+                    # legacy parser: add_text(Hello world) shows "Hello world"
+                    text = code[pending[2]:offset]
+                    pending[1].value = atom_value(text)
+                    pending = (text, pending[1], pending[2])
+                    pending_end = offset
+                    continue
+                elif state == STATEMENT:
+                    if not NAME_PATTERN.match(atom):
+                        raise error(line, column, f"'{atom}' is not a valid function name{NOT_A_CALL}")
+                    frame = Frame(Call, line, column, atom)
+                    state = OPEN_CALL
+                    continue
+                else:
+                    raise error(line, column, f"unexpected '{atom}'{unclosed_hint(stack, frame, line)}")
+
+            elif op:
+                offset += 1
+                if op == ',':
+                    if state != SEPARATOR:
+                        raise error(line, column, "unexpected ','")
+                    state = VALUE
+                elif op in CLOSERS:
+                    if frame is None or frame.kind is not CLOSERS[op] or state not in (VALUE, SEPARATOR) or frame.key is not None:
+                        raise error(line, column, f"unexpected '{op}'")
+                    node = frame.close()
+                    if stack:
+                        frame = stack.pop()
+                    else:
+                        frame = None
+                        statements.append(node)
+                        state = END
+                        continue
+                elif op == '(':
+                    if state == SEPARATOR and pending is not None:
+                        # A bare word followed by '(' is a nested call used as a value
+                        name, literal, _ = pending
+                        if not name.isidentifier():
+                            raise error(line, column, f"'{name}' is not a valid function name")
+                        unread_value(frame, literal, line, column)
+                        stack.append(frame)
+                        frame = Frame(Call, literal.line, literal.column, name)
+                    elif state != OPEN_CALL:
+                        raise error(line, column, "unexpected '('")
+                    state = VALUE
+                    pending = None
+                    continue
+                elif op == '[' or op == '{':
+                    if state != VALUE:
+                        raise error(line, column, f"unexpected '{op}'")
+                    # Dict keys can't be lists or dicts, so leave those to report the error
+                    literal = None if frame.kind is DictLiteral and frame.key is None else json_literal(code, offset - 1)
+                    if literal is None:
+                        stack.append(frame)
+                        frame = Frame(ListLiteral if op == '[' else DictLiteral, line, column)
+                        continue
+                    value, end = literal
+                    node = Literal(value, line, column)
+                    newlines = code.count('\n', offset, end)
+                    if newlines:
+                        line += newlines
+                        line_start = code.rindex('\n', offset, end) + 1
+                    offset = resume = end
+                elif op == ':':
+                    if state != COLON:
+                        raise error(line, column, "unexpected ':'")
+                    state = VALUE
+                else:
+                    if state != SEPARATOR or pending is None or frame.kind is not Call or not frame.items \
+                            or frame.items[-1] is not pending[1]:
+                        raise error(line, column, "unexpected '='")
+                    name = pending[0]
+                    if not NAME_PATTERN.match(name):
+                        raise error(line, column, f"'{name}' is not a valid argument name")
+                    frame.items.pop()
+                    frame.key = name
+                    state = VALUE
+                pending = None
+
+            elif newline:
+                offset += 1
+                line += 1
+                line_start = offset
+                if frame is None:
+                    state = STATEMENT
+
+            else:
+                if other in ('"', "'"):
+                    raise error(line, column, "unterminated string")
+                raise error(line, column, f"unexpected character {other!r}")
+
+            if node is not None:
+                if frame.kind is DictLiteral:
+                    if frame.key is None:
+                        frame.key = node
+                        state = COLON
+                        continue
+                    frame.items.append((frame.key, node))
+                    frame.key = None
+                elif frame.key is not None:
+                    frame.kwargs.append((frame.key, node))
+                    frame.key = None
+                else:
+                    frame.items.append(node)
+                state = SEPARATOR
+                if resume is not None:
+                    break
+
+    if state == OPEN_CALL:
+        raise error(line, offset - line_start + 1, f"expected '(' after the function name{NOT_A_CALL}")
+    if frame is not None:
+        opened = stack[0] if stack else frame
+        raise error(opened.line, opened.column, f"{opened.describe()} is never closed")
+
+    return Program(statements)
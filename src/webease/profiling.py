@@ -0,0 +1,201 @@
+"""
+Webease Profiling - Per-phase and per-builtin timings for 'webease compile --profile'
+"""
+
+import json
+import time
+
+from .functions import WebeaseContext
+
+
+PHASES = ('parse', 'arguments', 'execute', 'load_library', 'render', 'write')
+BUFFERS = ('html', 'css', 'js', 'head')
+DEFAULT_TOP_LINES = 10
+
+
+def byte_size(text):
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+class ProfiledContext(WebeaseContext):
+    """A WebeaseContext that counts the bytes written to each buffer"""
+
+    def __init__(self):
+        super().__init__()
+        self.written = dict.fromkeys(BUFFERS, 0)
+
+    def add_html(self, html):
+        self.written['html'] += byte_size(html)
+        super().add_html(html)
+
+    def add_css(self, css):
+        self.written['css'] += byte_size(css)
+        super().add_css(css)
+
+    def add_js(self, js):
+        self.written['js'] += byte_size(js)
+        super().add_js(js)
+
+    def add_head(self, head):
+        self.written['head'] += byte_size(head)
+        super().add_head(head)
+
+
+class FunctionStats:
+    """Calls, time and bytes written for one builtin or component"""
+
+    __slots__ = ('name', 'kind', 'calls', 'seconds', 'written')
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.calls = 0
+        self.seconds = 0.0
+        self.written = dict.fromkeys(BUFFERS, 0)
+
+    def to_dict(self):
+        return {'name': self.name, 'kind': self.kind, 'calls': self.calls, 'ms': self.seconds * 1000,
+                **{f'{buffer}_bytes': self.written[buffer] for buffer in BUFFERS}}
+
+
+class CompileProfile:
+    """Collects timings while a WebeaseCompiler with profile=... compiles a page
+
+    The compiler only checks for a profile once per page (and once per
+    library load), so an unprofiled compile runs exactly as before.
+    """
+
+    def __init__(self):
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.functions = {}
+        self.lines = []
+        self.source_lines = []
+        self.page = None
+        self.started = None
+        self.finished = None
+
+    # ---- hooks called by the compiler ----
+
+    def new_context(self):
+        return ProfiledContext()
+
+    def add_phase(self, phase, seconds):
+        self.phases[phase] += seconds
+
+    def execute(self, compiler, code):
+        """Parse and run a page, timing each statement"""
+        if self.started is None:
+            self.started = time.perf_counter()
+        self.source_lines = code.split('\n')
+
+        if compiler.legacy_parser:
+            # The legacy parser interleaves parsing and execution line by line
+            library_before = self.phases['load_library']
+            start = time.perf_counter()
+            compiler.execute_lines(code)
+            self.add_phase('execute', time.perf_counter() - start - (self.phases['load_library'] - library_before))
+            return
+
+        start = time.perf_counter()
+        program = compiler.parse(code)
+        self.add_phase('parse', time.perf_counter() - start)
+
+        for call in program.statements:
+            try:
+                self.execute_call(compiler, call)
+            except Exception as e:
+                raise SyntaxError(f"Error on line {call.line}: {str(e)}")
+
+    def execute_call(self, compiler, call):
+        context = compiler.context
+        before = dict(context.written)
+        library_before = self.phases['load_library']
+
+        start = time.perf_counter()
+        args, kwargs = call.evaluate_arguments(compiler.call_value)
+        evaluated = time.perf_counter()
+        try:
+            compiler.dispatch(call.name, args, kwargs)
+        finally:
+            end = time.perf_counter()
+            library = self.phases['load_library'] - library_before
+            self.add_phase('arguments', evaluated - start)
+            self.add_phase('execute', end - evaluated - library)
+
+            stats = self.functions.get(call.name)
+            if stats is None:
+                kind = 'component' if call.name in context.custom_functions else 'builtin'
+                stats = self.functions[call.name] = FunctionStats(call.name, kind)
+            stats.calls += 1
+            stats.seconds += end - evaluated - library
+            for buffer in BUFFERS:
+                stats.written[buffer] += context.written[buffer] - before[buffer]
+            self.lines.append((end - start, call.line, call.name))
+
+    def render(self, compiler, fp):
+        """Write the page to a text file, timing rendering and writing separately"""
+        pieces = compiler.iter_html()
+        render = write = 0.0
+        while True:
+            start = time.perf_counter()
+            piece = next(pieces, None)
+            rendered = time.perf_counter()
+            render += rendered - start
+            if piece is None:
+                break
+            fp.write(piece)
+            write += time.perf_counter() - rendered
+        self.add_phase('render', render)
+        self.add_phase('write', write)
+        self.finished = time.perf_counter()
+
+    # ---- reporting ----
+
+    def slowest_lines(self, count=DEFAULT_TOP_LINES):
+        result = []
+        for seconds, line, name in sorted(self.lines, reverse=True)[:count]:
+            source = self.source_lines[line - 1].strip() if 0 < line <= len(self.source_lines) else name
+            result.append({'line': line, 'name': name, 'ms': seconds * 1000, 'source': source})
+        return result
+
+    def total_seconds(self):
+        if self.started is None or self.finished is None:
+            return sum(self.phases.values())
+        return self.finished - self.started
+
+    def to_dict(self, top=DEFAULT_TOP_LINES):
+        functions = sorted(self.functions.values(), key=lambda stats: stats.seconds, reverse=True)
+        phases = {phase: seconds * 1000 for phase, seconds in self.phases.items()}
+        # Time between phases: dispatch and the profiler's own bookkeeping
+        phases['other'] = max(self.total_seconds() * 1000 - sum(phases.values()), 0.0)
+        return {
+            'page': self.page,
+            'total_ms': self.total_seconds() * 1000,
+            'phases': phases,
+            'functions': [stats.to_dict() for stats in functions],
+            'slowest_lines': self.slowest_lines(top),
+        }
+
+    def to_json(self, top=DEFAULT_TOP_LINES):
+        return json.dumps(self.to_dict(top), indent=2)
+
+    def format_table(self, top=DEFAULT_TOP_LINES):
+        data = self.to_dict(top)
+        total = data['total_ms'] or 1.0
+        lines = [f"⏱️  Profile for {data['page']}: {data['total_ms']:.2f} ms", '',
+                 f'{"phase":<14} {"ms":>10} {"%":>6}']
+        for phase, ms in data['phases'].items():
+            lines.append(f'{phase:<14} {ms:>10.2f} {ms / total * 100:>6.1f}')
+
+        lines += ['', f'{"function":<28} {"calls":>7} {"ms":>10} {"html B":>10} {"css B":>9} {"js B":>9} {"head B":>7}']
+        for stats in data['functions']:
+            name = stats['name'] if stats['kind'] == 'builtin' else f"{stats['name']} (component)"
+            lines.append(f'{name[:28]:<28} {stats["calls"]:>7,} {stats["ms"]:>10.2f} {stats["html_bytes"]:>10,} '
+                         f'{stats["css_bytes"]:>9,} {stats["js_bytes"]:>9,} {stats["head_bytes"]:>7,}')
+
+        if data['slowest_lines']:
+            lines += ['', f'Slowest {len(data["slowest_lines"])} line(s):']
+            for entry in data['slowest_lines']:
+                source = entry['source'] if len(entry['source']) <= 60 else entry['source'][:57] + '...'
+                lines.append(f'  line {entry["line"]:<6} {entry["ms"]:>8.2f} ms  {source}')
+        return '\n'.join(lines)
@@ -0,0 +1,119 @@
+"""
+Webease Program - Compiled .ws programs that replay without parsing or name lookups
+"""
+
+import marshal
+import zlib
+
+from . import __version__
+from . import functions
+from .cache import encode_node, decode_node
+from .parser import Call, ListLiteral, DictLiteral
+
+
+PROGRAM_FORMAT = 1
+
+# Builtins the compiler runs itself, because they also load .wl files
+COMPILER_FUNCTIONS = frozenset({'import_library'})
+
+
+def is_constant(node):
+    """True if a node holds no nested calls, so its value can be computed once"""
+    if isinstance(node, Call):
+        return False
+    if isinstance(node, ListLiteral):
+        return all(is_constant(item) for item in node.items)
+    if isinstance(node, DictLiteral):
+        return all(is_constant(key) and is_constant(value) for key, value in node.items)
+    return True
+
+
+def resolve(name):
+    """The builtin a statement calls, or None if the compiler has to dispatch it"""
+    if name in COMPILER_FUNCTIONS:
+        return None
+    return functions.builtin(name)
+
+
+def instruction(call):
+    """Turn a call statement into (line, name, func, args, kwargs, call)
+
+    call is only kept when the arguments must be evaluated on every run,
+    i.e. when they contain load_data(...), binding(...) or another call.
+    """
+    func = resolve(call.name)
+    if all(is_constant(arg) for arg in call.args) and all(is_constant(value) for _, value in call.kwargs):
+        try:
+            args, kwargs = call.evaluate_arguments()
+            return (call.line, call.name, func, args, kwargs, None)
+        except Exception:
+            # e.g. an unhashable dict key: report it on every run, like the interpreter does
+            pass
+    return (call.line, call.name, func, None, None, call)
+
+
+class CompiledProgram:
+    """A .ws program as a flat list of resolved builtins and evaluated arguments
+
+    Running it skips parsing, the builtin lookup and argument evaluation for
+    every statement whose arguments are constant. Argument values are shared
+    between runs, so builtins must not modify them (none do).
+    """
+
+    __slots__ = ('instructions',)
+
+    def __init__(self, instructions):
+        self.instructions = instructions
+
+    @classmethod
+    def from_program(cls, program):
+        return cls([instruction(call) for call in program.statements])
+
+    def run(self, compiler):
+        """Execute every statement into compiler.context"""
+        call_value = compiler.call_value
+        dispatch = compiler.dispatch
+        for line, name, func, args, kwargs, call in self.instructions:
+            try:
+                if call is not None:
+                    args, kwargs = call.evaluate_arguments(call_value)
+                if func is None:
+                    dispatch(name, args, kwargs)
+                else:
+                    func(*args, **kwargs)
+            except Exception as e:
+                raise SyntaxError(f"Error on line {line}: {str(e)}")
+
+    def __len__(self):
+        return len(self.instructions)
+
+    # ---- serialization ----
+
+    def dumps(self):
+        """Serialize to compressed bytes; builtins are stored by name and resolved again on load"""
+        instructions = [
+            (line, name, args, kwargs, None if call is None else encode_node(call))
+            for line, name, func, args, kwargs, call in self.instructions
+        ]
+        return zlib.compress(marshal.dumps((PROGRAM_FORMAT, __version__, instructions)), 1)
+
+    @classmethod
+    def loads(cls, data):
+        """Rebuild a program from dumps() output, raising ValueError if it is stale or damaged"""
+        try:
+            program_format, version, instructions = marshal.loads(zlib.decompress(data))
+        except (ValueError, EOFError, TypeError, zlib.error):
+            raise ValueError("Not a compiled Webease program") from None
+        if program_format != PROGRAM_FORMAT or version != __version__:
+            raise ValueError(f"Compiled program is from Webease {version}; recompile it with {__version__}")
+
+        resolved = {}
+        result = []
+        for line, name, args, kwargs, call in instructions:
+            if name not in resolved:
+                resolved[name] = resolve(name)
+            result.append((line, name, resolved[name], args, kwargs, None if call is None else decode_node(call)))
+        return cls(result)
+
+    def __repr__(self):
+        return f'CompiledProgram({len(self.instructions)} statements)'
@@ -0,0 +1,442 @@
+"""
+Webease Server - Asyncio preview server for compiled pages
+"""
+
+import asyncio
+import email.utils
+import mimetypes
+import os
+import posixpath
+import time
+from html import escape
+from urllib.parse import quote, unquote, urlsplit
+
+from .compress import ENCODERS, choose_encoding
+
+
+DEFAULT_HOST = '0.0.0.0'
+DEFAULT_PORT = 5000
+KEEP_ALIVE_TIMEOUT = 5
+MAX_KEEP_ALIVE_REQUESTS = 1000
+MAX_HEADER_SIZE = 64 * 1024
+MAX_BODY_SIZE = 1024 * 1024
+MAX_CACHED_FILE_SIZE = 1024 * 1024
+SEND_CHUNK_SIZE = 64 * 1024
+SERVER_NAME = 'Webease'
+
+# Content types for files requested with an encoding suffix (mimetypes' encodings_map)
+ENCODED_TYPES = {
+    'gzip': 'application/gzip', 'br': 'application/x-brotli', 'bzip2': 'application/x-bzip2',
+    'xz': 'application/x-xz', 'compress': 'application/x-compress',
+}
+
+REASONS = {
+    200: 'OK', 301: 'Moved Permanently', 304: 'Not Modified', 400: 'Bad Request',
+    404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large',
+    431: 'Request Header Fields Too Large', 500: 'Internal Server Error',
+}
+
+
+def http_date(timestamp):
+    return email.utils.formatdate(timestamp, usegmt=True)
+
+
+def content_type_for(path):
+    content_type, encoding = mimetypes.guess_type(path)
+    if encoding is not None:
+        # page.html.gz requested by name is served as the compressed file it is;
+        # Content-Encoding is only set when file_response picks a variant itself
+        return ENCODED_TYPES.get(encoding, 'application/octet-stream')
+    if content_type is None:
+        return 'application/octet-stream'
+    if content_type.startswith('text/') or content_type in ('application/javascript', 'application/json'):
+        return f'{content_type}; charset=utf-8'
+    return content_type
+
+
+def etag_matches(if_none_match, etag):
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if if_none_match.strip() == '*':
+        return True
+    bare = etag.removeprefix('W/')
+    return any(tag.strip().removeprefix('W/') == bare for tag in if_none_match.split(','))
+
+
+def not_modified(headers, etag, mtime):
+    """True if a conditional request's cached copy is still current
+
+    If-None-Match takes precedence over If-Modified-Since, as RFC 9110 requires.
+    """
+    if_none_match = headers.get('if-none-match')
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = headers.get('if-modified-since')
+    if if_modified_since is not None:
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return False
+        return int(mtime) <= since
+    return False
+
+
+class Response:
+    """A status, header list and body ready to be written to the client
+
+    A file too large to keep in memory is given as file instead of body and
+    is sent from disk a chunk at a time.
+    """
+
+    __slots__ = ('status', 'headers', 'body', 'file')
+
+    def __init__(self, status, headers=None, body=b'', file=None):
+        self.status = status
+        self.headers = headers if headers is not None else []
+        self.body = body
+        self.file = file
+
+
+def error_response(status, message=None):
+    message = message or REASONS.get(status, 'Error')
+    body = f'<!DOCTYPE html><html><body><h1>{status} {escape(message)}</h1></body></html>'.encode('utf-8')
+    return Response(status, [('Content-Type', 'text/html; charset=utf-8')], body)
+
+
+# ==================== STATIC FILES ====================
+
+class StaticFile:
+    """A file's validators and, for small files, its contents"""
+
+    __slots__ = ('path', 'mtime_ns', 'size', 'etag', 'last_modified', 'content_type', 'body')
+
+    def __init__(self, path, stat, body):
+        self.path = path
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        self.last_modified = http_date(stat.st_mtime)
+        self.content_type = content_type_for(path)
+        self.body = body
+
+
+class StaticFiles:
+    """Maps URL paths to files under a root directory
+
+    Small files are kept in memory and re-read only when their mtime or
+    size changes, so a request for an unchanged page costs one stat call.
+    """
+
+    def __init__(self, root):
+        self.root = os.path.realpath(root)
+        self.files = {}
+
+    def translate(self, url_path):
+        """Turn a URL path into a filesystem path under root, or None if it escapes"""
+        path = posixpath.normpath(unquote(url_path))
+        parts = [part for part in path.split('/') if part and part not in ('.', '..')]
+        full_path = os.path.join(self.root, *parts)
+        real_path = os.path.realpath(full_path)
+        if real_path != self.root and not real_path.startswith(self.root + os.sep):
+            return None
+        return real_path
+
+    def lookup(self, path):
+        """Return the StaticFile for a filesystem path, or None if it isn't a file"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.files.pop(path, None)
+            return None
+        if not os.path.isfile(path):
+            return None
+
+        cached = self.files.get(path)
+        if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            return cached
+
+        body = None
+        if stat.st_size <= MAX_CACHED_FILE_SIZE:
+            try:
+                with open(path, 'rb') as f:
+                    body = f.read()
+            except OSError:
+                return None
+        static_file = StaticFile(path, stat, body)
+        self.files[path] = static_file
+        return static_file
+
+    def variants(self, static_file):
+        """Precompressed copies of a file ({encoding: StaticFile}) that are at least as new as it"""
+        variants = {}
+        for name, encoder in ENCODERS.items():
+            variant = self.lookup(static_file.path + encoder.suffix)
+            if variant is not None and variant.mtime_ns >= static_file.mtime_ns:
+                variants[name] = variant
+        return variants
+
+    def listing(self, url_path, directory, live=False):
+        """A simple index page for a directory without index.html
+
+        In live mode .ws pages are listed under the .html name they are served as.
+        """
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            return None
+        items = []
+        for name in names:
+            if name.startswith('.'):
+                continue
+            if os.path.isdir(os.path.join(directory, name)):
+                name += '/'
+            elif live and name.endswith('.ws'):
+                name = name[:-len('.ws')] + '.html'
+            items.append(f'<li><a href="{quote(name)}">{escape(name)}</a></li>')
+        title = escape(unquote(url_path))
+        return (f'<!DOCTYPE html><html><head><meta charset="UTF-8"><title>Index of {title}</title></head>'
+                f'<body><h1>Index of {title}</h1><ul>{"".join(items)}</ul></body></html>').encode('utf-8')
+
+
+# ==================== SERVER ====================
+
+class PreviewServer:
+    """HTTP/1.1 server with keep-alive and conditional GET support
+
+    Every connection is its own asyncio task, so a slow or idle client
+    never holds up anyone else.
+    """
+
+    def __init__(self, root, host=DEFAULT_HOST, port=DEFAULT_PORT, log=None, live=None):
+        self.static = StaticFiles(root)
+        self.host = host
+        self.port = port
+        self.log = log
+        self.live = live
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port,
+                                                 limit=MAX_HEADER_SIZE)
+        return self.server
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def handle_connection(self, reader, writer):
+        try:
+            for _ in range(MAX_KEEP_ALIVE_REQUESTS):
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.send(writer, 'GET', error_response(431), keep_alive=False)
+                    break
+
+                request = self.parse_head(head)
+                if request is None:
+                    await self.send(writer, 'GET', error_response(400), keep_alive=False)
+                    break
+                method, target, version, headers = request
+
+                length = headers.get('content-length', '0')
+                if not length.isdigit() or 'transfer-encoding' in headers:
+                    await self.send(writer, method, error_response(400), keep_alive=False)
+                    break
+                if int(length) > MAX_BODY_SIZE:
+                    await self.send(writer, method, error_response(413), keep_alive=False)
+                    break
+                if int(length):
+                    await reader.readexactly(int(length))
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+                start = time.perf_counter()
+                try:
+                    response = await self.handle_request(method, target, headers)
+                except Exception as e:
+                    response = error_response(500, str(e))
+                await self.send(writer, method, response, keep_alive)
+                if self.log:
+                    self.log(f"{method} {target} {response.status} {(time.perf_counter() - start) * 1000:.1f} ms")
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def parse_head(self, head):
+        """Split a raw request head into (method, target, version, headers)"""
+        try:
+            lines = head.decode('latin-1').split('\r\n')
+            method, target, version = lines[0].split(' ')
+        except ValueError:
+            return None
+        if not version.startswith('HTTP/1.'):
+            return None
+
+        headers = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, sep, value = line.partition(':')
+            if not sep:
+                return None
+            headers[name.strip().lower()] = value.strip()
+        return method, target, version, headers
+
+    async def send(self, writer, method, response, keep_alive):
+        f = None
+        if response.file is not None and method != 'HEAD':
+            try:
+                f = await asyncio.to_thread(open, response.file.path, 'rb')
+            except OSError:
+                response = error_response(404)
+
+        headers = [
+            f'HTTP/1.1 {response.status} {REASONS.get(response.status, "")}',
+            f'Server: {SERVER_NAME}',
+            f'Date: {http_date(time.time())}',
+        ]
+        headers += [f'{name}: {value}' for name, value in response.headers]
+        if response.status != 304:
+            size = response.file.size if response.file is not None else len(response.body)
+            headers.append(f'Content-Length: {size}')
+        if keep_alive:
+            headers.append('Connection: keep-alive')
+            headers.append(f'Keep-Alive: timeout={KEEP_ALIVE_TIMEOUT}')
+        else:
+            headers.append('Connection: close')
+
+        writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1'))
+        if f is not None:
+            with f:
+                await self.send_file(writer, f, response.file.size)
+            return
+        if method != 'HEAD' and response.body:
+            writer.write(response.body)
+        await writer.drain()
+
+    async def send_file(self, writer, f, size):
+        """Copy size bytes of an open file to the client SEND_CHUNK_SIZE bytes at a time"""
+        while size > 0:
+            chunk = await asyncio.to_thread(f.read, min(SEND_CHUNK_SIZE, size))
+            if not chunk:
+                # The file shrank after Content-Length was sent; only closing can tell the client
+                raise ConnectionResetError(f"{f.name} changed while it was being sent")
+            writer.write(chunk)
+            await writer.drain()
+            size -= len(chunk)
+
+    async def handle_request(self, method, target, headers):
+        """Produce the response for one request"""
+        if method not in ('GET', 'HEAD'):
+            response = error_response(405)
+            response.headers.append(('Allow', 'GET, HEAD'))
+            return response
+
+        url_path = urlsplit(target).path or '/'
+        path = self.static.translate(url_path)
+        if path is None:
+            return error_response(404)
+
+        is_dir = os.path.isdir(path)
+        if is_dir and not url_path.endswith('/'):
+            return Response(301, [('Location', url_path + '/')])
+
+        if self.live is not None:
+            page = self.live.page_for(path)
+            if page is not None:
+                return await self.live_response(page, headers)
+
+        if is_dir:
+            index_path = os.path.join(path, 'index.html')
+            if not os.path.isfile(index_path):
+                body = self.static.listing(url_path, path, live=self.live is not None)
+                if body is None:
+                    return error_response(404)
+                return Response(200, [('Content-Type', 'text/html; charset=utf-8')], body)
+            path = index_path
+
+        static_file = self.static.lookup(path)
+        if static_file is None:
+            return error_response(404)
+        return await self.file_response(static_file, headers)
+
+    async def file_response(self, static_file, headers):
+        """A 200 with the file, or a 304 if the client's copy is current
+
+        If the client accepts an encoding that has a precompressed .gz/.br
+        file next to the original, that file is sent as-is.
+        """
+        served = static_file
+        encoding = None
+        if 'accept-encoding' in headers:
+            variants = self.static.variants(static_file)
+            encoding = choose_encoding(headers['accept-encoding'],
+                                       {name: variant.size for name, variant in variants.items()})
+            if encoding is not None:
+                served = variants[encoding]
+
+        validators = [
+            ('ETag', served.etag),
+            ('Last-Modified', static_file.last_modified),
+            ('Cache-Control', 'no-cache'),
+            ('Vary', 'Accept-Encoding'),
+        ]
+        if not_modified(headers, served.etag, static_file.mtime_ns / 1e9):
+            return Response(304, validators)
+        response_headers = [('Content-Type', static_file.content_type)] + validators
+        if encoding is not None:
+            response_headers.append(('Content-Encoding', encoding))
+        if served.body is None:
+            # Too large to cache: send() streams it from disk, and a HEAD request never opens it
+            return Response(200, response_headers, file=served)
+        return Response(200, response_headers, served.body)
+
+    async def live_response(self, page, headers):
+        """Compile a page on demand, or answer from the rendered-page cache"""
+        try:
+            entry, cached = await self.live.render(page)
+        except Exception as e:
+            body = f'<!DOCTYPE html><html><body><pre>{escape(str(e))}</pre></body></html>'.encode('utf-8')
+            return Response(500, [('Content-Type', 'text/html; charset=utf-8'), ('Cache-Control', 'no-store')], body)
+
+        body = entry.body
+        etag = entry.etag
+        encoding = None
+        if 'accept-encoding' in headers:
+            encoding = choose_encoding(headers['accept-encoding'],
+                                       {name: len(data) for name, data in entry.encoded.items()})
+            if encoding is not None:
+                body = entry.encoded[encoding]
+                etag = f'{etag[:-1]}-{encoding}"'
+
+        validators = [
+            ('ETag', etag),
+            ('Cache-Control', 'no-cache'),
+            ('Vary', 'Accept-Encoding'),
+            ('X-Webease-Cache', 'hit' if cached else 'miss'),
+        ]
+        if 'if-none-match' in headers and etag_matches(headers['if-none-match'], etag):
+            return Response(304, validators)
+        response_headers = [('Content-Type', 'text/html; charset=utf-8')] + validators
+        if encoding is not None:
+            response_headers.append(('Content-Encoding', encoding))
+        return Response(200, response_headers, body)
+
+
+def run_server(root, host=DEFAULT_HOST, port=DEFAULT_PORT, log=None, live=None):
+    """Serve a directory until interrupted"""
+    server = PreviewServer(root, host, port, log, live)
+    asyncio.run(server.serve_forever())
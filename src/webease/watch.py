@@ -0,0 +1,369 @@
+"""
+Webease Watch - Recompile pages as their .ws and .wl sources change
+"""
+
+import os
+import select
+import struct
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from .build import (BuildManifest, BuildResult, MANIFEST_NAME, build_options, build_site, compile_page,
+                    find_pages, output_path_for, remove_page)
+from .cache import ParseCache
+from .compiler import WebeaseCompiler
+from .data import DATA_SUFFIXES
+from .libraries import registry_for
+
+
+WATCHED_SUFFIXES = ('.ws', '.wl') + DATA_SUFFIXES
+DEFAULT_DEBOUNCE = 0.05
+DEFAULT_POLL_INTERVAL = 0.25
+
+
+def is_watched(path):
+    return str(path).endswith(WATCHED_SUFFIXES)
+
+
+# ==================== INOTIFY ====================
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    """Linux inotify, called through ctypes so no extra package is needed
+
+    wait() returns the set of changed paths, or None if the kernel queue
+    overflowed and events were lost.
+    """
+
+    def __init__(self, recursive_dirs, flat_dirs=()):
+        # ctypes, and ctypes.util which imports subprocess, are only needed here
+        import ctypes
+        import ctypes.util
+        libc_name = ctypes.util.find_library('c')
+        if libc_name is None:
+            raise OSError('libc not found')
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self.libc, 'inotify_init1'):
+            raise OSError('inotify is not available')
+
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.watches = {}
+        self.recursive = set()
+        for directory in recursive_dirs:
+            self.add_tree(Path(directory))
+        for directory in flat_dirs:
+            self.add_watch(Path(directory))
+
+    def add_watch(self, directory):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd >= 0:
+            self.watches[wd] = directory
+
+    def add_dirs(self, flat_dirs):
+        """Start watching more directories (not their subdirectories)"""
+        for directory in flat_dirs:
+            self.add_watch(Path(directory))
+
+    def add_tree(self, directory):
+        self.recursive.add(directory)
+        self.add_watch(directory)
+        for root, dirs, _ in os.walk(directory):
+            dirs[:] = [name for name in dirs if not name.startswith('.')]
+            for name in dirs:
+                subdir = Path(root) / name
+                self.recursive.add(subdir)
+                self.add_watch(subdir)
+
+    def wait(self, timeout=None):
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    return None
+                directory = self.watches.get(wd)
+                if mask & IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+                if directory is None or not name:
+                    continue
+
+                path = directory / name
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO) and directory in self.recursive:
+                        # Files written before the watch existed are picked up by the scan
+                        self.add_tree(path)
+                        changed.update(p for p in path.rglob('*') if is_watched(p))
+                elif is_watched(name):
+                    changed.add(path)
+
+    def close(self):
+        os.close(self.fd)
+
+
+# ==================== POLLING ====================
+
+class PollingWatcher:
+    """Portable fallback that compares stat snapshots at a fixed interval"""
+
+    def __init__(self, recursive_dirs, flat_dirs=(), interval=DEFAULT_POLL_INTERVAL):
+        self.recursive_dirs = [Path(directory) for directory in recursive_dirs]
+        self.flat_dirs = [Path(directory) for directory in flat_dirs]
+        self.interval = interval
+        self.snapshot = self.scan(self.recursive_dirs, self.flat_dirs)
+
+    def add_dirs(self, flat_dirs):
+        """Start watching more directories (not their subdirectories)"""
+        flat_dirs = [Path(directory) for directory in flat_dirs]
+        self.flat_dirs += flat_dirs
+        # Their current files are the baseline, not changes
+        self.snapshot.update(self.scan((), flat_dirs))
+
+    def scan(self, recursive_dirs=None, flat_dirs=None):
+        recursive_dirs = self.recursive_dirs if recursive_dirs is None else recursive_dirs
+        flat_dirs = self.flat_dirs if flat_dirs is None else flat_dirs
+        snapshot = {}
+        pending = [(directory, True) for directory in recursive_dirs]
+        pending += [(directory, False) for directory in flat_dirs]
+        while pending:
+            directory, recursive = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.name.startswith('.'):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                pending.append((Path(entry.path), True))
+                        elif is_watched(entry.name):
+                            stat = entry.stat()
+                            snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    def wait(self, timeout=None):
+        time.sleep(self.interval if timeout is None else min(self.interval, timeout))
+        snapshot = self.scan()
+        old = self.snapshot
+        self.snapshot = snapshot
+        changed = {path for path, state in snapshot.items() if old.get(path) != state}
+        changed.update(path for path in old if path not in snapshot)
+        return changed
+
+    def close(self):
+        pass
+
+
+def create_watcher(recursive_dirs, flat_dirs=(), polling=False, interval=DEFAULT_POLL_INTERVAL):
+    """Use inotify where the platform has it, otherwise poll"""
+    if not polling:
+        try:
+            return InotifyWatcher(recursive_dirs, flat_dirs)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(recursive_dirs, flat_dirs, interval)
+
+
+def collect_changes(watcher, debounce=DEFAULT_DEBOUNCE):
+    """Block until something changes, then gather the rest of the burst
+
+    Returns the changed paths, or None if changes were lost and every
+    page needs checking.
+    """
+    changed = set()
+    while not changed:
+        changed = watcher.wait()
+        if changed is None:
+            return None
+
+    while True:
+        more = watcher.wait(debounce)
+        if more is None:
+            return None
+        if not more:
+            return changed
+        changed |= more
+
+
+# ==================== SITE ====================
+
+class SiteWatcher:
+    """Keeps a warm compiler and recompiles only the pages a change affects"""
+
+    def __init__(self, source_dir, output_dir='output', use_cache=True, minify=False, library_path=(),
+                 precompress=(), compress_level=None):
+        self.source_dir = Path(source_dir)
+        self.output_dir = Path(output_dir)
+        self.minify = minify
+        self.precompress = tuple(precompress)
+        self.compress_level = compress_level
+        self.library_path = tuple(library_path)
+        self.libraries = registry_for(library_path)
+        self.compiler = WebeaseCompiler(cache=ParseCache() if use_cache else None, minify=minify,
+                                        libraries=self.libraries)
+        self.manifest = None
+        self.failed = set()
+
+    def initial_build(self, jobs=1, force=False):
+        """Bring the output up to date before watching"""
+        result = build_site(self.source_dir, self.output_dir, force=force, jobs=jobs,
+                            use_cache=self.compiler.cache is not None, minify=self.minify,
+                            library_path=self.library_path, precompress=self.precompress,
+                            compress_level=self.compress_level)
+        options = build_options(self.minify, self.precompress, self.compress_level)
+        self.manifest = BuildManifest(self.output_dir / MANIFEST_NAME, options)
+        self.failed = {page for page, _ in result.failed}
+        return result
+
+    def watched_dirs(self):
+        """(recursive, flat) directories to watch
+
+        Besides the source tree and library folders, that is every folder
+        outside the tree holding a data file a page loads.
+        """
+        source_dir = os.path.abspath(self.source_dir)
+        flat = [Path(directory) for directory in self.libraries.search_path
+                if os.path.isdir(directory) and os.path.abspath(directory) != source_dir]
+        seen = {os.path.abspath(directory) for directory in flat}
+        flat += [directory for directory in sorted(self.dependency_dirs()) if str(directory) not in seen]
+        return [self.source_dir], flat
+
+    def dependency_dirs(self):
+        """Absolute folders outside the source tree that hold a recorded dependency"""
+        source_dir = Path(os.path.abspath(self.source_dir))
+        dirs = set()
+        for entry in self.manifest.pages.values() if self.manifest is not None else ():
+            for dep in entry['dependencies']:
+                directory = Path(os.path.abspath(dep)).parent
+                if directory != source_dir and source_dir not in directory.parents:
+                    dirs.add(directory)
+        return dirs
+
+    def page_key(self, page):
+        return page.relative_to(self.source_dir).as_posix()
+
+    def dependents(self):
+        """Map each library's absolute path to the pages that import it"""
+        graph = defaultdict(set)
+        for page_key, entry in self.manifest.pages.items():
+            for dep in entry['dependencies']:
+                graph[os.path.abspath(dep)].add(page_key)
+        return graph
+
+    def affected_pages(self, changed):
+        """Work out which pages to recompile and which were deleted"""
+        source_dir = Path(os.path.abspath(self.source_dir))
+        pages = set()
+        removed = set()
+        graph = None
+
+        for path in changed:
+            path = Path(os.path.abspath(path))
+            if path.suffix == '.ws':
+                try:
+                    relative = path.relative_to(source_dir)
+                except ValueError:
+                    continue
+                page = self.source_dir / relative
+                (pages if page.exists() else removed).add(page)
+            else:
+                if graph is None:
+                    graph = self.dependents()
+                pages.update(self.source_dir / key for key in graph.get(str(path), ()))
+                # A library appearing may fix pages that failed to find it
+                pages.update(self.failed)
+
+        return sorted(page for page in pages if page.exists()), sorted(removed)
+
+    def rebuild(self, changed):
+        """Recompile the pages affected by a set of changed paths"""
+        start = time.perf_counter()
+        result = BuildResult()
+
+        if changed is None:
+            self.manifest.forget_checks()
+            pages = []
+            existing = set()
+            for page in find_pages(self.source_dir):
+                existing.add(self.page_key(page))
+                output_path = output_path_for(page, self.source_dir, self.output_dir)
+                if page in self.failed or not self.manifest.is_fresh(self.page_key(page), page, output_path):
+                    pages.append(page)
+            removed = [self.source_dir / key for key in self.manifest.pages if key not in existing]
+        else:
+            pages, removed = self.affected_pages(changed)
+
+        for page in pages:
+            output_path = output_path_for(page, self.source_dir, self.output_dir)
+            page_result = compile_page(self.compiler, page, output_path, self.precompress, self.compress_level)
+            result.timings[page] = page_result.elapsed
+            if page_result.error:
+                result.failed.append((page, page_result.error))
+                self.failed.add(page)
+                continue
+
+            self.manifest.record(self.page_key(page), page, page_result.dependencies, output_path)
+            self.failed.discard(page)
+            result.built.append(page)
+
+        for page in removed:
+            self.failed.discard(page)
+            self.manifest.pages.pop(self.page_key(page), None)
+            self.manifest.changed = True
+            remove_page(output_path_for(page, self.source_dir, self.output_dir))
+            result.removed.append(page)
+
+        self.manifest.save()
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    def watch(self, polling=False, interval=DEFAULT_POLL_INTERVAL, debounce=DEFAULT_DEBOUNCE):
+        """Yield a BuildResult for every burst of changes, forever"""
+        recursive, flat = self.watched_dirs()
+        watcher = create_watcher(recursive, flat, polling, interval)
+        watching = {os.path.abspath(directory) for directory in flat}
+        try:
+            while True:
+                changed = collect_changes(watcher, debounce)
+                result = self.rebuild(changed)
+                # A page may have started loading data from a folder that isn't watched yet
+                new_dirs = [directory for directory in sorted(self.dependency_dirs())
+                            if str(directory) not in watching]
+                if new_dirs:
+                    watcher.add_dirs(new_dirs)
+                    watching.update(str(directory) for directory in new_dirs)
+                if result.built or result.failed or result.removed:
+                    yield result
+        finally:
+            watcher.close()
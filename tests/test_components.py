@@ -0,0 +1,40 @@
+"""
+Tests for component templates: placeholder syntax and unclosed-placeholder checks
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease.components import ComponentTemplate  # noqa: E402
+
+
+@pytest.mark.parametrize('source', [
+    '<script>const o={{a:1}};</script>',
+    '<script>f({{a: {b: 1}}})</script>',
+    '<p>{{}}</p>',
+])
+def test_double_braces_that_are_not_placeholders_render_unchanged(source):
+    template = ComponentTemplate('raw', source)
+    assert template.placeholders == ()
+    assert template.render({}) == source
+
+
+def test_spaces_inside_placeholders_are_allowed():
+    template = ComponentTemplate('card', '<h3>{{ title }}</h3><p>{{title}}</p>')
+    assert template.placeholders == ('title',)
+    assert template.render({'title': 'Hi'}) == '<h3>Hi</h3><p>Hi</p>'
+
+
+@pytest.mark.parametrize('source, name', [
+    ('<h3>{{title</h3>', 'title'),
+    ('<h3>{{ title }</h3>', 'title'),
+    ('<h3>{{title</h3><p>{{body}}</p>', 'title'),
+])
+def test_unclosed_placeholders_are_reported(source, name):
+    with pytest.raises(SyntaxError, match=f"unclosed placeholder '{{{{{name}'"):
+        ComponentTemplate('card', source)
@@ -0,0 +1,66 @@
+"""
+Tests that concurrent compiles keep their own context
+
+A smaller version of benchmarks/stress_contexts.py: each page compiled
+from threads and from asyncio tasks must match its serial output.
+"""
+
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease.compiler import WebeaseCompiler  # noqa: E402
+from src.webease.libraries import LibraryRegistry  # noqa: E402
+
+LIBRARIES = LibraryRegistry((ROOT / 'libraries', ROOT))
+PAGES = sorted((ROOT / 'examples').glob('*.ws'))
+COMPILES = 48
+WORKERS = 4
+
+
+def compile_page(page):
+    html, error = WebeaseCompiler(libraries=LIBRARIES).compile_file(str(page))
+    return page, error or html
+
+
+@pytest.fixture(scope='module')
+def serial():
+    results = dict(compile_page(page) for page in PAGES)
+    for page, html in results.items():
+        assert html.startswith('<!DOCTYPE html>'), f'{page.name} does not compile serially:\n{html}'
+    return results
+
+
+@pytest.fixture(autouse=True)
+def frequent_switches():
+    """Switch threads every few microseconds, so a few dozen compiles interleave as often as hundreds would"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def jobs():
+    return [PAGES[i % len(PAGES)] for i in range(COMPILES)]
+
+
+def test_threads_match_serial_output(serial):
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        results = list(executor.map(compile_page, jobs()))
+    assert [page.name for page, html in results if html != serial[page]] == []
+
+
+def test_asyncio_tasks_match_serial_output(serial):
+    async def run():
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            return await asyncio.gather(*(loop.run_in_executor(executor, compile_page, page) for page in jobs()))
+
+    results = asyncio.run(run())
+    assert [page.name for page, html in results if html != serial[page]] == []
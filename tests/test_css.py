@@ -0,0 +1,164 @@
+"""
+Tests for CSSStore: duplicate removal, merging and blocks that must stay whole
+
+The example-page test compares the cascade of the raw CSS every builder
+added with the cascade of the stored rules, selector by selector.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease.compiler import WebeaseCompiler  # noqa: E402
+from src.webease.css import CSSStore, merge_adjacent, split_rules  # noqa: E402
+from src.webease.libraries import LibraryRegistry  # noqa: E402
+
+LIBRARIES = LibraryRegistry((ROOT / 'libraries', ROOT))
+EXAMPLES = sorted((ROOT / 'examples').glob('*.ws'))
+
+COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.S)
+
+
+# ==================== CASCADE ====================
+
+def normalize(text):
+    return ' '.join(text.split())
+
+
+def top_level(text, separator):
+    """Split text on separator, ignoring separators inside quotes or parentheses"""
+    parts = []
+    depth = 0
+    quote = None
+    start = 0
+    for i, char in enumerate(text):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == separator and not depth:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return [part for part in parts if part.strip()]
+
+
+def blocks(css):
+    """Yield (prelude, body) for every top-level block, skipping braces inside strings"""
+    depth = 0
+    quote = None
+    start = body_start = 0
+    for i, char in enumerate(css):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '{':
+            if not depth:
+                prelude = css[start:i]
+                body_start = i + 1
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if not depth:
+                yield normalize(prelude), css[body_start:i]
+                start = i + 1
+
+
+def declare(declarations, body):
+    for declaration in top_level(body, ';'):
+        name, _, value = declaration.partition(':')
+        name, value = name.strip().lower(), normalize(value)
+        # A later declaration only beats an earlier !important one if it is !important too
+        if declarations.get(name, '').endswith('!important') and not value.endswith('!important'):
+            continue
+        declarations[name] = value
+
+
+def cascade(css, context=()):
+    """{(at-rules..., selector): {property: value}} with later rules winning, as a browser applies them"""
+    result = {}
+    for prelude, body in blocks(COMMENT_PATTERN.sub('', css)):
+        if prelude.startswith(('@media', '@supports')):
+            for key, declarations in cascade(body, context + (prelude,)).items():
+                for name, value in declarations.items():
+                    declare(result.setdefault(key, {}), f'{name}: {value}')
+        elif prelude.startswith('@'):
+            # @keyframes and friends: the last definition replaces earlier ones whole
+            result[context + (prelude,)] = {'': normalize(body)}
+        else:
+            for selector in top_level(prelude, ','):
+                declare(result.setdefault(context + (normalize(selector),), {}), body)
+    return result
+
+
+def stored(*blocks_added):
+    store = CSSStore()
+    for css in blocks_added:
+        store.append(css)
+    return list(store)
+
+
+# ==================== TESTS ====================
+
+def test_repeated_rule_is_emitted_once_at_its_last_position():
+    assert stored('.a { color: red; }', '.b { color: blue; }', '.a { color: red; }') == [
+        '.b { color: blue; }', '.a { color: red; }',
+    ]
+
+
+def test_a_b_a_keeps_a_winning():
+    added = ('.x { color: red; }', '.x { color: blue; }', '.x { color: red; }')
+    rules = stored(*added)
+    assert cascade('\n'.join(rules))[('.x',)] == {'color': 'red'}
+    assert cascade('\n'.join(rules)) == cascade('\n'.join(added))
+
+
+def test_adjacent_rules_with_the_same_selector_are_merged():
+    assert merge_adjacent(['.a { color: red; }', '.a { margin: 0 }', '.b { padding: 0; }', '.a { top: 0; }']) == [
+        '.a { color: red; margin: 0; }', '.b { padding: 0; }', '.a { top: 0; }',
+    ]
+
+
+@pytest.mark.parametrize('css', [
+    '/* header */ .a { color: red; } .b { color: blue; }',
+    '.a::before { content: "}"; } .b { color: blue; }',
+    ".a::after { content: '{'; }",
+])
+def test_blocks_that_cannot_be_split_are_kept_whole(css):
+    assert split_rules(css) is None
+    assert stored(css) == [css.strip()]
+
+
+def test_media_blocks_are_kept_whole():
+    media = '@media (max-width: 600px) { .a { color: red; } .b { color: blue; } }'
+    assert split_rules(f'.a {{ color: green; }} {media}') == ['.a { color: green; }', media]
+    assert stored(media, '.a { color: green; }', media) == ['.a { color: green; }', media]
+
+
+@pytest.mark.parametrize('page', EXAMPLES, ids=lambda page: page.name)
+def test_example_pages_keep_the_same_effective_declarations(page, monkeypatch):
+    added = []
+    append = CSSStore.append
+
+    def recording_append(store, css):
+        added.append(css)
+        append(store, css)
+
+    monkeypatch.setattr(CSSStore, 'append', recording_append)
+    context, error = WebeaseCompiler(libraries=LIBRARIES).compile_context(str(page))
+    assert error is None, error
+
+    before = cascade('\n'.join(added))
+    assert before == cascade('\n'.join(context.css_rules))
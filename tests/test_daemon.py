@@ -0,0 +1,69 @@
+"""
+Tests for 'webease daemon': requests resolve paths like a one-shot compile
+"""
+
+import os
+import socket
+import stat
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease.client import DaemonError, send_request  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='the daemon listens on a Unix socket')
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """A daemon started from its own directory, so its cwd differs from every request's"""
+    home = tmp_path / 'daemon'
+    home.mkdir()
+    path = str(tmp_path / 'daemon.sock')
+    process = subprocess.Popen([sys.executable, str(ROOT / 'webease.py'), 'daemon', 'start', '--quiet'],
+                               cwd=home, env=dict(os.environ, WEBEASE_SOCKET=path), stdout=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                send_request({'command': 'status'}, path)
+                break
+            except DaemonError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+        yield path
+    finally:
+        try:
+            send_request({'command': 'shutdown'}, path)
+        except DaemonError:
+            process.kill()
+        process.wait(timeout=10)
+
+
+def test_socket_is_owner_only(daemon):
+    assert stat.S_IMODE(os.stat(daemon).st_mode) == 0o600
+
+
+def test_relative_data_files_resolve_against_the_request_cwd(daemon, tmp_path):
+    site = tmp_path / 'site'
+    (site / 'pages').mkdir(parents=True)
+    (site / 'data').mkdir()
+    (site / 'data' / 'rows.csv').write_text('name\nfrom-the-site\n', encoding='utf-8')
+    (site / 'pages' / 'page.ws').write_text('create_table(["Name"], load_data("data/rows.csv"))\n', encoding='utf-8')
+    # The same relative path next to the daemon must not be picked up
+    (tmp_path / 'daemon' / 'data').mkdir()
+    (tmp_path / 'daemon' / 'data' / 'rows.csv').write_text('name\nfrom-the-daemon\n', encoding='utf-8')
+
+    response = send_request({'command': 'compile', 'file': 'pages/page.ws', 'cwd': str(site), 'cache': False}, daemon)
+
+    assert response['ok'], response.get('error')
+    html = Path(response['path']).read_text(encoding='utf-8')
+    assert 'from-the-site' in html and 'from-the-daemon' not in html
+    assert response['dependencies'] == [str(site / 'data' / 'rows.csv')]
@@ -0,0 +1,23 @@
+"""
+Tests for loading .wl libraries through the registry
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease.libraries import LibraryRegistry  # noqa: E402
+
+LIBRARY = 'component card {\n<div class="card">\n    <h3>{{title}}</h3>\n</div>\n}\n'
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n', '\r'])
+def test_libraries_load_with_any_line_endings(tmp_path, newline):
+    (tmp_path / 'cards.wl').write_bytes(LIBRARY.replace('\n', newline).encode('utf-8'))
+    _, components = LibraryRegistry((tmp_path,)).load('cards')
+    template = components['card']
+    assert template.render({'title': 'Hi'}) == '<div class="card">\n    <h3>Hi</h3>\n</div>'
@@ -0,0 +1,28 @@
+"""
+Tests for CSS minification: only declarations lose the space after ':'
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease.minify import minify_css  # noqa: E402
+
+
+@pytest.mark.parametrize('css, expected', [
+    ('.a { color: red; }', '.a{color:red}'),
+    ('a::before { content: "a: b"; }', 'a::before{content:"a: b"}'),
+    (".a::after { content: 'x: y' ; }", ".a::after{content:'x: y'}"),
+    ('a: hover { color: red; }', 'a: hover{color:red}'),
+    ('.a:not(.b: c) { top: 0; }', '.a:not(.b: c){top:0}'),
+    ('.a { background: url(x: y.png); }', '.a{background:url(x: y.png)}'),
+    ('@media (max-width: 600px) { .a: focus { color: red; } }', '@media (max-width:600px){.a: focus{color:red}}'),
+    ('@font-face { font-family: X; }', '@font-face{font-family:X}'),
+    ('@keyframes k { from { opacity: 0 } to { opacity: 1 } }', '@keyframes k{from{opacity:0}to{opacity:1}}'),
+])
+def test_minify_css(css, expected):
+    assert minify_css(css) == expected
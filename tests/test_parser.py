@@ -0,0 +1,95 @@
+"""
+Tests for the single-pass .ws parser
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease import parser  # noqa: E402
+
+
+def arguments(code):
+    """The evaluated (args, kwargs) of each call in code"""
+    return [call.evaluate_arguments() for call in parser.parse(code).statements]
+
+
+# ==================== BARE WORDS ====================
+
+@pytest.mark.parametrize('code, expected', [
+    ('add_text(Hello world)', (['Hello world'], {})),
+    ('add_text("Hi", css_class=big box)', (['Hi'], {'css_class': 'big box'})),
+    ('set_background(#f0f0f0)', (['#f0f0f0'], {})),
+    ('set_text_color(#333)', (['#333'], {})),
+    ('add_text(a #b)', (['a #b'], {})),
+    ('link(url=https://example.com)', ([], {'url': 'https://example.com'})),
+    ('set_title(My Page: Home)', (['My Page: Home'], {})),
+    ('add_list([a:b, 10:30])', ([['a:b', '10:30']], {})),
+    ('add_text({a: b})', ([{'a': 'b'}], {})),
+])
+def test_unquoted_arguments_read_as_in_the_legacy_parser(code, expected):
+    assert arguments(code) == [expected]
+
+
+def test_comments():
+    code = (
+        "# A page (it's short)\n"
+        'add_title("Hi")  # trailing, with "quotes"\n'
+        'add_list([\n'
+        '    # one per line\n'
+        '    1,\n'
+        '    2,\n'
+        '])\n'
+        '    # indented\n'
+        '# last line'
+    )
+    assert arguments(code) == [(['Hi'], {}), ([[1, 2]], {})]
+
+
+# ==================== ERRORS ====================
+
+@pytest.mark.parametrize('code, message', [
+    ('add_title("Hi")\nthis line is prose\n',
+     "Error on line 2, column 6: expected '(' after the function name; "
+     "lines that aren't function calls need a leading # (--legacy-parser still skips them)"),
+    ('"hello"\n',
+     'Error on line 1, column 1: unexpected string "hello"; '
+     "lines that aren't function calls need a leading # (--legacy-parser still skips them)"),
+    ('add_title("Hi"\nadd_text("x")\n', "Error on line 2, column 1: unexpected 'add_text'; is 'add_title(' on line 1 closed?"),
+    ('add_list([1, 2\n', "Error on line 1, column 1: 'add_list(' is never closed"),
+    ('add_title("Hi)\n', 'Error on line 1, column 11: unterminated string'),
+    ('add_text("a" "b")\n', 'Error on line 1, column 14: unexpected string "b"'),
+    ('add_text({"a" 1})\n', "Error on line 1, column 15: unexpected '1'"),
+    ('add_text("a": 1)\n', "Error on line 1, column 13: unexpected ':'"),
+    ('add_text(1))\n', "Error on line 1, column 12: unexpected ')'"),
+    ('add_text(a b=1)\n', "Error on line 1, column 13: 'a b' is not a valid argument name"),
+])
+def test_error_messages(code, message):
+    with pytest.raises(SyntaxError) as excinfo:
+        parser.parse(code)
+    assert str(excinfo.value) == message
+
+
+# ==================== LITERALS ====================
+
+def test_trailing_comma_literal_over_4kb_decodes_each_row_once(monkeypatch):
+    """A list rejected for its trailing comma must not re-decode the rest of the file per row"""
+    rows = ''.join(f'        ["{"x" * 5000}", {i}],\n' for i in range(200))
+    code = f'create_table(\n    ["A", "B"],\n    [\n{rows}    ],\n)\n'
+    decoded = []
+
+    class CountingDecoder:
+        def raw_decode(self, text):
+            decoded.append(len(text))
+            return decoder.raw_decode(text)
+
+    decoder = parser.JSON_DECODER
+    monkeypatch.setattr(parser, 'JSON_DECODER', CountingDecoder())
+    [(args, kwargs)] = arguments(code)
+
+    assert args[1] == [['x' * 5000, i] for i in range(200)]
+    assert sum(decoded) < 10 * len(code)
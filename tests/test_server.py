@@ -0,0 +1,73 @@
+"""
+Tests for the preview server's content types and large-file responses
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease import server  # noqa: E402
+from src.webease.server import PreviewServer, content_type_for  # noqa: E402
+
+
+@pytest.mark.parametrize('path, content_type', [
+    ('page.html', 'text/html; charset=utf-8'),
+    ('style.css', 'text/css; charset=utf-8'),
+    ('page.html.gz', 'application/gzip'),
+    ('page.html.br', 'application/x-brotli'),
+    ('site.tar.gz', 'application/gzip'),
+    ('data.unknown', 'application/octet-stream'),
+])
+def test_content_type_for(path, content_type):
+    assert content_type_for(path) == content_type
+
+
+async def fetch(port, method, path):
+    """Send one request and return (head, body)"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f'{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n'.encode('latin-1'))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return head.decode('latin-1'), body
+
+
+def test_large_files_are_streamed_and_head_never_reads_them(tmp_path, monkeypatch):
+    data = os.urandom(server.MAX_CACHED_FILE_SIZE + 3 * server.SEND_CHUNK_SIZE + 17)
+    (tmp_path / 'large.bin').write_bytes(data)
+    reads = []
+    to_thread = asyncio.to_thread
+
+    async def recording_to_thread(function, *args):
+        reads.append(function)
+        return await to_thread(function, *args)
+
+    monkeypatch.setattr(server.asyncio, 'to_thread', recording_to_thread)
+
+    async def run():
+        preview = PreviewServer(tmp_path, host='127.0.0.1', port=0)
+        listener = await preview.start()
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            head = await fetch(port, 'HEAD', '/large.bin')
+            head_reads = len(reads)
+            get = await fetch(port, 'GET', '/large.bin')
+        finally:
+            listener.close()
+            await listener.wait_closed()
+        return head, head_reads, get
+
+    (head, head_body), head_reads, (get, body) = asyncio.run(run())
+    assert f'Content-Length: {len(data)}' in head and head_body == b''
+    assert head_reads == 0
+    assert f'Content-Length: {len(data)}' in get
+    assert body == data
+    # open, then one read per chunk: the file is never read whole
+    assert len(reads) == 1 + -(-len(data) // server.SEND_CHUNK_SIZE)
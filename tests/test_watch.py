@@ -0,0 +1,57 @@
+"""
+Tests for 'webease watch': the watch set and which pages a change rebuilds
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.webease.watch import PollingWatcher, SiteWatcher  # noqa: E402
+
+
+def site(tmp_path, data_dir):
+    """A one-page site whose data lives in data_dir"""
+    source = tmp_path / 'site'
+    source.mkdir()
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / 'rows.csv').write_text('name,price\nTea,3\n')
+    (source / 'shop.ws').write_text(f'create_table(["Name", "Price"], load_data("{data_dir / "rows.csv"}"))\n')
+    watcher = SiteWatcher(source, tmp_path / 'output')
+    result = watcher.initial_build()
+    assert not result.failed, result.failed
+    return watcher
+
+
+def test_importing_watch_does_not_load_ctypes():
+    code = 'import sys; import src.webease.watch; print("ctypes" in sys.modules)'
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == 'False'
+
+
+def test_data_outside_the_source_dir_is_watched(tmp_path):
+    shared = tmp_path / 'shared'
+    watcher = site(tmp_path, shared)
+    recursive, flat = watcher.watched_dirs()
+    assert recursive == [tmp_path / 'site']
+    assert shared in flat
+    assert watcher.affected_pages({shared / 'rows.csv'}) == ([tmp_path / 'site' / 'shop.ws'], [])
+
+
+def test_data_inside_the_source_dir_is_not_watched_twice(tmp_path):
+    watcher = site(tmp_path, tmp_path / 'site' / 'data')
+    assert watcher.dependency_dirs() == set()
+    assert tmp_path / 'site' / 'data' not in watcher.watched_dirs()[1]
+
+
+def test_polling_watcher_takes_added_dirs_as_unchanged(tmp_path):
+    added = tmp_path / 'added'
+    added.mkdir()
+    (added / 'rows.csv').write_text('a\n')
+    watcher = PollingWatcher([tmp_path / 'site'], [], interval=0)
+    watcher.add_dirs([added])
+    assert watcher.snapshot
+    (added / 'rows.csv').write_text('a\nb\n')
+    assert watcher.scan() != watcher.snapshot